@@ -8,6 +8,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db.session import get_session
 from app.models import User
 from app.services.auth import verify_token
+from app.services.user_cache import cache_user, get_cached_user
 
 # Security scheme for JWT bearer tokens
 security = HTTPBearer()
@@ -20,6 +21,10 @@ async def get_current_user(
     """Get current authenticated user from JWT token."""
     token = credentials.credentials
 
+    cached_user = get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+
     # Verify and decode token
     payload = verify_token(token)
     if payload is None:
@@ -59,6 +64,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        cache_user(token, float(expires_at), user)
     return user
 
 
@@ -1,24 +1,37 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import datetime
 from typing import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_session, require_admin
 from app.api.schemas.admin import (
+    AdminDatabaseDiagnostics,
     AdminLibraryMemberInfo,
+    AdminMetadataCacheEntry,
+    AdminMetadataCacheList,
+    AdminMetadataCachePurgeResult,
+    AdminMetadataProviderState,
     AdminUpdateLibraryRole,
     AdminUpdatePassword,
     AdminUpdateUserAdminStatus,
     AdminUserDetail,
     AdminUserLibrary,
 )
+from app.core.config import get_settings
+from app.db.session import sqlite_pragmas
 from app.models import Library, LibraryMember, MemberRole, User
-from app.services.auth import get_password_hash
+from app.services import metadata_cache
+from app.services.auth import hash_password
+from app.services.membership import invalidate_membership
+from app.services.metadata import PROVIDER_FETCHERS
+from app.services.provider_limits import provider_states
+from app.services.user_cache import invalidate_user
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -129,6 +142,7 @@ async def update_admin_status(
     user.is_admin = payload.is_admin
     session.add(user)
     await session.commit()
+    invalidate_user(user.id)
     await session.refresh(user)
 
     return await _serialize_admin_user(session, user)
@@ -142,15 +156,18 @@ async def update_user_password(
     session: AsyncSession = Depends(get_session),
 ) -> None:
     """Set a new password for a user."""
+    # Hash before touching the database so bcrypt does not hold the writer
+    password_hash = await hash_password(payload.new_password)
     result = await session.exec(select(User).where(User.id == user_id))
     user = result.first()
 
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    user.password_hash = get_password_hash(payload.new_password)
+    user.password_hash = password_hash
     session.add(user)
     await session.commit()
+    invalidate_user(user.id)
 
 
 @router.patch(
@@ -207,6 +224,7 @@ async def update_membership_role(
     membership.role = payload.role
     session.add(membership)
     await session.commit()
+    invalidate_membership(library_id, user_id)
     await session.refresh(membership)
 
     return await _serialize_user_library(session, membership, library)
@@ -260,6 +278,90 @@ async def remove_user_from_library(
 
     await session.delete(membership)
     await session.commit()
+    invalidate_membership(library_id, user_id)
+
+
+@router.get("/metadata-cache", response_model=AdminMetadataCacheList)
+async def list_metadata_cache(
+    provider: str | None = Query(default=None),
+    identifier: str | None = Query(default=None),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=500),
+    _: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_session),
+) -> AdminMetadataCacheList:
+    """Inspect cached metadata provider responses."""
+    entries, total = await metadata_cache.list_entries(
+        session,
+        provider=provider,
+        identifier=identifier,
+        skip=skip,
+        limit=limit,
+    )
+    now = datetime.utcnow()
+    return AdminMetadataCacheList(
+        entries=[
+            AdminMetadataCacheEntry(
+                provider=entry.provider,
+                identifier=entry.identifier,
+                status=entry.status,
+                payload=entry.payload,
+                fetched_at=entry.fetched_at,
+                expires_at=entry.expires_at,
+                expired=entry.expires_at <= now,
+            )
+            for entry in entries
+        ],
+        total=total,
+    )
+
+
+@router.delete("/metadata-cache", response_model=AdminMetadataCachePurgeResult)
+async def purge_metadata_cache(
+    provider: str | None = Query(default=None),
+    identifier: str | None = Query(default=None),
+    expired_only: bool = Query(default=False),
+    _: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_session),
+) -> AdminMetadataCachePurgeResult:
+    """Purge cached metadata; without filters the whole cache is cleared."""
+    deleted = await metadata_cache.purge_entries(
+        session,
+        provider=provider,
+        identifier=identifier,
+        expired_only=expired_only,
+    )
+    return AdminMetadataCachePurgeResult(deleted=deleted)
+
+
+@router.get("/metadata-providers", response_model=list[AdminMetadataProviderState])
+async def list_metadata_providers(
+    _: User = Depends(require_admin),
+) -> list[AdminMetadataProviderState]:
+    """Show each provider's rate limiter and circuit breaker state."""
+    return [
+        AdminMetadataProviderState(**state)
+        for state in provider_states(list(PROVIDER_FETCHERS))
+    ]
+
+
+@router.get("/database", response_model=AdminDatabaseDiagnostics)
+async def database_diagnostics(
+    _: User = Depends(require_admin),
+    session: AsyncSession = Depends(get_session),
+) -> AdminDatabaseDiagnostics:
+    """Compare the configured connection pragmas with what SQLite reports."""
+    connection = await session.connection()
+    dialect = connection.dialect.name
+    if dialect != "sqlite":
+        return AdminDatabaseDiagnostics(dialect=dialect, configured={}, effective={})
+
+    configured = sqlite_pragmas(get_settings())
+    effective = {}
+    for name in configured:
+        result = await connection.exec_driver_sql(f"PRAGMA {name}")
+        effective[name] = result.scalar()
+    return AdminDatabaseDiagnostics(dialect=dialect, configured=configured, effective=effective)
 
 
 async def _serialize_admin_user(session: AsyncSession, user: User) -> AdminUserDetail:
@@ -8,7 +8,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_current_user, get_session
 from app.models import Token, User, UserCreate, UserLogin, UserRead
-from app.services.auth import create_access_token, get_password_hash, verify_password
+from app.services.auth import create_access_token, hash_password, verify_and_update_password
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -19,6 +19,9 @@ async def register(
     session: AsyncSession = Depends(get_session),
 ) -> User:
     """Register a new user."""
+    # Hash up front so the writer connection is not held while bcrypt runs
+    password_hash = await hash_password(user_data.password)
+
     # Check if email already exists
     stmt = select(User).where(User.email == user_data.email)
     result = await session.exec(stmt)
@@ -50,7 +53,7 @@ async def register(
         username=user_data.username,
         email=user_data.email,
         full_name=user_data.full_name,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         is_admin=not has_any_user,
     )
 
@@ -73,15 +76,28 @@ async def login(
     )
     result = await session.exec(stmt)
     user = result.first()
+    # Release the writer connection while bcrypt runs
+    await session.commit()
 
     # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.password_hash):
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await verify_and_update_password(
+            credentials.password, user.password_hash
+        )
+    if not user or not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username/email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if new_hash:
+        # Stored hash predates the current bcrypt cost; upgrade it in place
+        user.password_hash = new_hash
+        session.add(user)
+        await session.commit()
+
     # Create access token
     access_token = create_access_token(
         data={"sub": str(user.id), "email": user.email}
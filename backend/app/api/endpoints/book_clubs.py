@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from typing import Iterable
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select, update
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, literal, or_, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.api.deps import get_current_user, get_session
 from app.api.schemas.book_clubs import BookClubDetail, BookClubSummary
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.api.utils.sse import KEEPALIVE, event_stream_response, format_sse
+from app.core.config import get_settings
+from app.core.pubsub import SubscriptionLagged
 from app.models import (
     BookClub,
     BookClubBook,
@@ -32,8 +41,29 @@ from app.models import (
     BookV2,
     User,
 )
+from app.services.club_events import (
+    CLUB,
+    COMMENT,
+    MEMBER_JOINED,
+    MEMBER_LEFT,
+    MEMBER_UPDATED,
+    PROGRESS,
+    PROGRESS_RESET,
+    ClubEvent,
+    ClubViewer,
+    club_events,
+    publish_club_event,
+)
 
 router = APIRouter(prefix="/book-clubs", tags=["book-clubs"])
+settings = get_settings()
+
+# Keyset for comment threads; the id breaks ties between identical timestamps
+_COMMENT_ORDER = (
+    BookClubComment.page_number,
+    BookClubComment.created_at,
+    BookClubComment.id,
+)
 
 
 async def _get_club(session: AsyncSession, club_id: UUID) -> BookClub:
@@ -43,10 +73,13 @@ async def _get_club(session: AsyncSession, club_id: UUID) -> BookClub:
     return club
 
 
-async def _count_members(session: AsyncSession, club_id: UUID) -> int:
-    stmt = select(func.count(BookClubMember.id)).where(BookClubMember.club_id == club_id)
-    result = await session.exec(stmt)
-    return int(result.scalar_one() or 0)
+async def _adjust_member_count(session: AsyncSession, club_id: UUID, delta: int) -> None:
+    # Applied in SQL so concurrent joins and removals cannot lose updates
+    await session.exec(
+        update(BookClub)
+        .where(BookClub.id == club_id)
+        .values(member_count=BookClub.member_count + delta)
+    )
 
 
 async def _get_owner_id_by_club_id(session: AsyncSession, club_id: UUID) -> UUID:
@@ -171,6 +204,7 @@ async def create_book_club(
         slug=payload.slug,
         current_book_id=payload.current_book_id,
         pages_total_override=payload.pages_total_override,
+        member_count=1,
         created_at=now,
         updated_at=now,
     )
@@ -205,55 +239,37 @@ async def list_book_clubs(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[BookClubSummary]:
-    summary_list: list[BookClubSummary] = []
-
-    owner_stmt = select(BookClub).where(BookClub.owner_id == current_user.id)
-    owner_result = await session.exec(owner_stmt)
-    owner_clubs = owner_result.scalars().all()
-    owner_ids: set[UUID] = set()
-    for club in owner_clubs:
-        owner_ids.add(club.id)
-        _get_pages_total_override(club)
-        summary_list.append(
-            BookClubSummary(
-                id=club.id,
-                name=club.name,
-                description=club.description,
-                owner_id=club.owner_id,
-                current_book_id=club.current_book_id,
-                pages_total_override=club.pages_total_override,
-                member_count=await _count_members(session, club.id),
-                membership_role=BookClubRole.OWNER,
-                slug=club.slug,
-            )
+    stmt = (
+        select(BookClub, BookClubMember.role)
+        .outerjoin(
+            BookClubMember,
+            and_(
+                BookClubMember.club_id == BookClub.id,
+                BookClubMember.user_id == current_user.id,
+            ),
         )
+        .where(or_(BookClub.owner_id == current_user.id, BookClubMember.id.is_not(None)))
+    )
+    rows = (await session.exec(stmt)).all()
 
-    member_stmt = select(BookClubMember).where(BookClubMember.user_id == current_user.id)
-    member_result = await session.exec(member_stmt)
-    member_rows = member_result.scalars().all()
-    for membership in member_rows:
-        club_id = membership.club_id
-        if club_id in owner_ids:
-            continue
-        club = await session.get(BookClub, club_id)
-        if club is None:
-            continue
-        membership_role = membership.role
-        if membership_role is not None and not isinstance(membership_role, BookClubRole):
+    summary_list: list[BookClubSummary] = []
+    for club, membership_role in rows:
+        if club.owner_id == current_user.id:
+            membership_role = BookClubRole.OWNER
+        elif membership_role is not None and not isinstance(membership_role, BookClubRole):
             try:
                 membership_role = BookClubRole(membership_role)
             except ValueError:
                 membership_role = BookClubRole.MEMBER
-        _get_pages_total_override(club)
         summary_list.append(
             BookClubSummary(
                 id=club.id,
                 name=club.name,
                 description=club.description,
-                owner_id=await _get_owner_id(session, club),
+                owner_id=club.owner_id,
                 current_book_id=club.current_book_id,
                 pages_total_override=club.pages_total_override,
-                member_count=await _count_members(session, club.id),
+                member_count=club.member_count,
                 membership_role=membership_role,
                 slug=club.slug,
             )
@@ -295,14 +311,13 @@ async def get_book_club_detail(
 
     comments_result = await session.exec(
         select(BookClubComment)
-        .where(BookClubComment.club_id == club_id)
-        .order_by(BookClubComment.page_number.asc(), BookClubComment.created_at.asc())
+        .where(
+            BookClubComment.club_id == club_id,
+            BookClubComment.page_number <= viewer_page,
+        )
+        .order_by(*_COMMENT_ORDER)
     )
-    comments = [
-        comment
-        for comment in comments_result.scalars().all()
-        if comment.page_number <= viewer_page
-    ]
+    comments = comments_result.scalars().all()
 
     history_result = await session.exec(
         select(BookClubBook)
@@ -364,7 +379,10 @@ async def update_book_club(
             .values(pages_total=updates["pages_total_override"])
         )
 
-    if "current_book_id" in updates and updates["current_book_id"] != previous_book_id:
+    book_changed = (
+        "current_book_id" in updates and updates["current_book_id"] != previous_book_id
+    )
+    if book_changed:
         await _upsert_history_entry(
             session,
             club,
@@ -380,7 +398,14 @@ async def update_book_club(
     await session.commit()
     await session.refresh(club)
     _get_pages_total_override(club)
-    return BookClubRead.model_validate(club)
+    club_read = BookClubRead.model_validate(club)
+    if book_changed:
+        publish_club_event(
+            club.id,
+            ClubEvent(PROGRESS_RESET, {"current_book_id": club_read.current_book_id}),
+        )
+    _publish(club.id, CLUB, club_read)
+    return club_read
 
 
 @router.post(
@@ -407,6 +432,9 @@ async def add_member(
     existing_member = await _get_member(session, club_id, payload.user_id)
     now = datetime.utcnow()
     if existing_member:
+        rejoined = existing_member.left_at is not None
+        if rejoined:
+            await _adjust_member_count(session, club_id, 1)
         existing_member.role = payload.role
         existing_member.left_at = None
         existing_member.removed_by = None
@@ -414,7 +442,14 @@ async def add_member(
         session.add(existing_member)
         await session.commit()
         await session.refresh(existing_member)
-        return BookClubMemberRead.model_validate(existing_member)
+        member_read = BookClubMemberRead.model_validate(existing_member)
+        _publish(
+            club_id,
+            MEMBER_JOINED if rejoined else MEMBER_UPDATED,
+            member_read,
+            user_id=member_read.user_id,
+        )
+        return member_read
 
     new_member = BookClubMember(
         club_id=club_id,
@@ -424,6 +459,7 @@ async def add_member(
     )
     session.add(new_member)
     try:
+        await _adjust_member_count(session, club_id, 1)
         await session.commit()
     except IntegrityError as exc:  # noqa: BLE001
         await session.rollback()
@@ -432,7 +468,9 @@ async def add_member(
             detail="Member already exists.",
         ) from exc
     await session.refresh(new_member)
-    return BookClubMemberRead.model_validate(new_member)
+    member_read = BookClubMemberRead.model_validate(new_member)
+    _publish(club_id, MEMBER_JOINED, member_read, user_id=member_read.user_id)
+    return member_read
 
 
 @router.patch(
@@ -462,11 +500,20 @@ async def update_member(
 
     member.role = payload.role
     if payload.left_at is not None:
+        if member.left_at is None:
+            await _adjust_member_count(session, club_id, -1)
         member.left_at = payload.left_at
     session.add(member)
     await session.commit()
     await session.refresh(member)
-    return BookClubMemberRead.model_validate(member)
+    member_read = BookClubMemberRead.model_validate(member)
+    _publish(
+        club_id,
+        MEMBER_LEFT if member.left_at is not None else MEMBER_UPDATED,
+        member_read,
+        user_id=user_id,
+    )
+    return member_read
 
 
 @router.delete(
@@ -493,10 +540,13 @@ async def remove_member(
     if member.role == BookClubRole.OWNER:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot remove the owner.")
 
+    if member.left_at is None:
+        await _adjust_member_count(session, club_id, -1)
     member.left_at = datetime.utcnow()
     member.removed_by = current_user.id if current_user.id != user_id else None
     session.add(member)
     await session.commit()
+    _publish(club_id, MEMBER_LEFT, BookClubMemberRead.model_validate(member), user_id=user_id)
 
 
 @router.get(
@@ -589,7 +639,9 @@ async def update_progress(
 
     await session.commit()
     await session.refresh(progress)
-    return BookClubProgressRead.model_validate(progress)
+    progress_read = BookClubProgressRead.model_validate(progress)
+    _publish(club_id, PROGRESS, progress_read, user_id=current_user.id)
+    return progress_read
 
 
 @router.get(
@@ -598,9 +650,29 @@ async def update_progress(
 )
 async def list_comments(
     club_id: UUID,
+    response: Response,
+    limit: int | None = Query(
+        None, ge=1, le=500, description="Page size; every remaining comment when omitted"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque X-Next-Cursor value from the previous page"
+    ),
+    since: datetime | None = Query(
+        None, description="Only return comments created after this time"
+    ),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[BookClubCommentRead]:
+    """
+    Comments the viewer has read up to, in page order.
+
+    Comments past the viewer's current page are filtered out in SQL.
+    Without ``limit`` every remaining comment is returned; with it, the
+    ``X-Next-Cursor`` response header carries the cursor for the next page
+    while more remain. ``since`` lets clients poll for new comments;
+    comments unlocked by the viewer's own progress are older than that, so
+    clients reload without ``since`` after moving forward.
+    """
     await _get_club(session, club_id)
     member = await _get_member(session, club_id, current_user.id)
     if member is None:
@@ -609,22 +681,53 @@ async def list_comments(
             detail="Join the club to view comments.",
         )
 
-    progress_stmt = select(BookClubProgress).where(
+    progress_stmt = select(BookClubProgress.current_page).where(
         BookClubProgress.club_id == club_id,
         BookClubProgress.user_id == current_user.id,
     )
     progress_result = await session.exec(progress_stmt)
-    progress = progress_result.scalar_one_or_none()
-    viewer_page = progress.current_page if progress else 0
+    viewer_page = progress_result.scalar_one_or_none() or 0
 
-    comments_result = await session.exec(
-        select(BookClubComment)
-        .where(BookClubComment.club_id == club_id)
-        .order_by(BookClubComment.page_number.asc(), BookClubComment.created_at.asc())
-    )
-    comments = [
-        comment for comment in comments_result.all() if comment.page_number <= viewer_page
+    conditions = [
+        BookClubComment.club_id == club_id,
+        BookClubComment.page_number <= viewer_page,
     ]
+    if since is not None:
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        conditions.append(BookClubComment.created_at > since)
+    if cursor:
+        position = decode_cursor(cursor)
+        try:
+            after = tuple_(
+                literal(int(position["page"]), BookClubComment.page_number.type),
+                literal(
+                    datetime.fromisoformat(position["created_at"]),
+                    BookClubComment.created_at.type,
+                ),
+                literal(UUID(position["id"]), BookClubComment.id.type),
+            )
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        conditions.append(tuple_(*_COMMENT_ORDER) > after)
+
+    stmt = select(BookClubComment).where(*conditions).order_by(*_COMMENT_ORDER)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    comments = (await session.exec(stmt)).scalars().all()
+    if limit is not None and len(comments) > limit:
+        comments = comments[:limit]
+        last = comments[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            {
+                "page": last.page_number,
+                "created_at": last.created_at.isoformat(),
+                "id": str(last.id),
+            }
+        )
     return [BookClubCommentRead.model_validate(comment) for comment in comments]
 
 
@@ -655,7 +758,8 @@ async def create_comment(
     progress = progress_result.scalar_one_or_none()
     current_page = progress.current_page if progress else 0
 
-    if payload.page_number > current_page:
+    progress_advanced = payload.page_number > current_page
+    if progress_advanced:
         now = datetime.utcnow()
         pages_total = await _resolve_pages_total(
             session,
@@ -694,7 +798,107 @@ async def create_comment(
     session.add(member)
     await session.commit()
     await session.refresh(comment)
-    return BookClubCommentRead.model_validate(comment)
+    comment_read = BookClubCommentRead.model_validate(comment)
+    if progress_advanced:
+        _publish(
+            club_id,
+            PROGRESS,
+            BookClubProgressRead.model_validate(progress),
+            user_id=current_user.id,
+        )
+    _publish(
+        club_id,
+        COMMENT,
+        comment_read,
+        user_id=current_user.id,
+        page_number=comment_read.page_number,
+    )
+    return comment_read
+
+
+@router.get("/{club_id}/events")
+async def stream_club_events(
+    club_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of changes to a club.
+
+    Opens with a ``ready`` event carrying the viewer's current page, then
+    sends ``progress``, ``progress_reset``, ``comment``, ``club`` and
+    ``member_*`` events as they are committed. Comments past the viewer's
+    page are withheld; when the viewer's own progress moves forward, they
+    fetch the newly unlocked comments from ``/comments``. A ``resync`` event
+    means events were dropped and the client should reload the club.
+    """
+    club = await _get_club(session, club_id)
+    owner_id = await _get_owner_id(session, club)
+    member = await _get_member(session, club_id, current_user.id)
+    if current_user.id != owner_id and member is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Join the club to follow its activity.",
+        )
+
+    # Subscribe before reading progress so no change falls in between
+    subscription = club_events.subscribe(club_id)
+    try:
+        progress_result = await session.exec(
+            select(BookClubProgress.current_page).where(
+                BookClubProgress.club_id == club_id,
+                BookClubProgress.user_id == current_user.id,
+            )
+        )
+        viewer_page = progress_result.scalar_one_or_none() or 0
+        # The stream outlives the request's queries; hand the connection back
+        await session.commit()
+    except BaseException:
+        subscription.close()
+        raise
+
+    viewer = ClubViewer(subscription, current_user.id, viewer_page)
+    return event_stream_response(
+        _club_event_stream(viewer),
+        background=BackgroundTask(subscription.close),
+    )
+
+
+async def _club_event_stream(viewer: ClubViewer) -> AsyncIterator[str]:
+    with viewer.subscription as subscription:
+        yield format_sse({"current_page": viewer.current_page}, event="ready")
+        while True:
+            try:
+                event = await subscription.get(timeout=settings.event_keepalive_seconds)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE
+                continue
+            except SubscriptionLagged:
+                yield format_sse({}, event="resync")
+                return
+            if viewer.accept(event):
+                yield format_sse(event.data, event=event.type)
+            if viewer.ends_stream(event):
+                return
+
+
+def _publish(
+    club_id: UUID,
+    event_type: str,
+    model: SQLModel,
+    *,
+    user_id: UUID | None = None,
+    page_number: int | None = None,
+) -> None:
+    publish_club_event(
+        club_id,
+        ClubEvent(
+            event_type,
+            model.model_dump(mode="json"),
+            user_id=user_id,
+            page_number=page_number,
+        ),
+    )
 
 
 async def _get_owner_id(session: AsyncSession, club: BookClub) -> UUID:
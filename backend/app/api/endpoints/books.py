@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable
 from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
 import sqlalchemy
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy import String, cast, delete, func
+from sqlalchemy import String, cast, delete, func, literal, tuple_, update
 from sqlalchemy.orm import attributes
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -20,15 +23,27 @@ from app.api.utils.library_access import (
     require_library_permission,
 )
 from app.api.schemas.library_books import LibraryBookDetail, LibraryBookListResponse
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.db.search import (
+    build_match_query,
+    fts_match,
+    fts_rank,
+    join_search_index,
+    supports_full_text,
+)
 from app.models import (
+    BookClub,
+    BookClubBook,
     BookV2,
     BookV2Create,
     BookV2Read,
     BookV2Update,
+    EnrichmentJob,
     LibraryBook,
     LibraryBookRead,
     LibraryBookUpdate,
     MemberRole,
+    ReadingListItem,
     Series,
     SeriesRead,
     User,
@@ -36,7 +51,14 @@ from app.models import (
     UserBookDataRead,
     UserBookDataUpdate,
 )
+from app.services.library_counts import (
+    bump_book_libraries,
+    bump_library_version,
+    get_cached_count,
+    store_count,
+)
 from app.services.metadata import fetch_metadata
+from app.services.series import ensure_series, normalize_series_name
 
 router = APIRouter(prefix="/libraries/{library_id}/books", tags=["books"])
 
@@ -57,6 +79,57 @@ class LibraryBookUpdatePayload(SQLModel):
     personal_data: UserBookDataUpdate | None = None
 
 
+def _ilike_search(q: str):
+    """Substring search used when the full-text index is unavailable."""
+    like = f"%{q}%"
+    return sqlalchemy.or_(
+        BookV2.title.ilike(like),  # type: ignore[attr-defined]
+        BookV2.isbn.ilike(like),  # type: ignore[attr-defined]
+        BookV2.publisher.ilike(like),  # type: ignore[union-attr]
+        BookV2.description.ilike(like),  # type: ignore[union-attr]
+        LibraryBook.series.ilike(like),  # type: ignore[union-attr]
+        LibraryBook.physical_location.ilike(like),  # type: ignore[union-attr]
+        cast(BookV2.authors, String).ilike(like),  # type: ignore[arg-type]
+        cast(BookV2.subjects, String).ilike(like),  # type: ignore[arg-type]
+        cast(BookV2.language, String).ilike(like),  # type: ignore[arg-type]
+    )
+
+
+class LibraryBookSort(str, Enum):
+    TITLE = "title"
+    CREATED_AT = "created_at"
+    ACQUISITION_DATE = "acquisition_date"
+    AUTHOR = "author"
+    RELEVANCE = "relevance"
+
+
+class SortOrder(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+def _sort_key(
+    sort: LibraryBookSort, match_query: str | None, dialect: str
+) -> tuple[Any, Callable[[Any], Any]]:
+    """Return the SQL sort expression and a parser for its cursor value."""
+    if sort == LibraryBookSort.CREATED_AT:
+        return LibraryBook.created_at, datetime.fromisoformat
+    if sort == LibraryBookSort.ACQUISITION_DATE:
+        # Undated copies sort first; coalescing keeps the keyset free of NULLs
+        return func.coalesce(LibraryBook.acquisition_date, date.min), date.fromisoformat
+    if sort == LibraryBookSort.AUTHOR:
+        first_author = BookV2.authors[0].as_string()  # type: ignore[index]
+        return func.lower(func.coalesce(first_author, "")), str
+    if sort == LibraryBookSort.RELEVANCE:
+        assert match_query is not None
+        return fts_rank(match_query, dialect), float
+    return func.lower(BookV2.title), str
 
 
 @router.get("")
@@ -66,44 +139,60 @@ async def list_library_books(
     current_user: User = Depends(get_current_user),
     q: str | None = Query(
         None,
-        description="Free text search across intrinsic and library fields",
+        description=(
+            "Free text search across intrinsic and library fields; "
+            "every term is matched as a prefix and results are ranked by relevance"
+        ),
+    ),
+    skip: int = Query(
+        0, ge=0, description="Offset pagination, ignored when a cursor is given"
     ),
-    skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     metadata_status: str | None = Query(
         None, description="Filter books by metadata status"
     ),
+    sort: LibraryBookSort | None = Query(
+        None,
+        description="Sort order; defaults to relevance when searching, otherwise title",
+    ),
+    order: SortOrder = Query(SortOrder.ASC),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor value from the previous page"
+    ),
+    total: TotalMode = Query(
+        TotalMode.EXACT,
+        description=(
+            "exact counts matches (cached until the library changes), estimate "
+            "accepts a recently cached count, none skips counting"
+        ),
+    ),
 ) -> LibraryBookListResponse:
-    print("=" * 80)
-    print("LIST_LIBRARY_BOOKS ENDPOINT CALLED - NEW CODE IS RUNNING!")
-    print("=" * 80)
     await require_library_member(library_id, current_user.id, session)
 
     conditions: list = [LibraryBook.library_id == library_id]
     if metadata_status:
         conditions.append(BookV2.metadata_status == metadata_status)
 
-    if q:
-        like = f"%{q}%"
-        search_conditions = [
-            BookV2.title.ilike(like),  # type: ignore[attr-defined]
-            BookV2.isbn.ilike(like),  # type: ignore[attr-defined]
-            BookV2.publisher.ilike(like),  # type: ignore[union-attr]
-            BookV2.description.ilike(like),  # type: ignore[union-attr]
-            LibraryBook.series.ilike(like),  # type: ignore[union-attr]
-            LibraryBook.physical_location.ilike(like),  # type: ignore[union-attr]
-        ]
-        search_conditions.extend(
-            [
-                cast(BookV2.authors, String).ilike(like),  # type: ignore[arg-type]
-                cast(BookV2.subjects, String).ilike(like),  # type: ignore[arg-type]
-                cast(BookV2.language, String).ilike(like),  # type: ignore[arg-type]
-            ]
+    dialect = session.bind.dialect.name
+    match_query = build_match_query(q, dialect) if q else None
+    use_fts = match_query is not None and supports_full_text(dialect)
+    if use_fts:
+        conditions.append(fts_match(match_query, dialect))
+    elif q:
+        conditions.append(_ilike_search(q))
+
+    if sort is None:
+        sort = LibraryBookSort.RELEVANCE if use_fts else LibraryBookSort.TITLE
+    if sort == LibraryBookSort.RELEVANCE and not use_fts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Relevance sorting requires a search query",
         )
-        conditions.append(sqlalchemy.or_(*search_conditions))
+    sort_expr, parse_sort_value = _sort_key(sort, match_query, dialect)
+    descending = order == SortOrder.DESC
 
     stmt = (
-        select(LibraryBook, BookV2, UserBookData)
+        select(LibraryBook, BookV2, UserBookData, Series, sort_expr)
         .join(BookV2, LibraryBook.book_id == BookV2.id)
         .outerjoin(
             UserBookData,
@@ -111,80 +200,93 @@ async def list_library_books(
             & (UserBookData.library_id == library_id)
             & (UserBookData.user_id == current_user.id),
         )
-        .where(*conditions)
-        .offset(skip)
-        .limit(limit)
-    )
-    rows = (await session.exec(stmt)).all()
-
-    # Build lookup of Series metadata for all referenced series names
-    series_lookup: dict[str, SeriesRead] = {}
-    series_names = {
-        library_book.series
-        for library_book, *_ in rows
-        if library_book.series
-    }
-    if series_names:
-        print(f"DEBUG series names requested: {series_names}")
-        series_stmt = select(Series).where(
-            Series.library_id == library_id,
-            Series.name.in_(tuple(series_names)),
+        .outerjoin(
+            Series,
+            (Series.library_id == library_id) & (Series.name == LibraryBook.series),
         )
-        existing_series = (await session.exec(series_stmt)).all()
-        series_lookup = {
-            series.name: SeriesRead.model_validate(series)
-            for series in existing_series
-        }
-        print(f"DEBUG found existing series: {list(series_lookup.keys())}")
-
-        missing_series_names = series_names - set(series_lookup.keys())
-        if missing_series_names:
-            print(f"DEBUG creating missing series entries: {missing_series_names}")
-            for missing_name in missing_series_names:
-                new_series = Series(name=missing_name, library_id=library_id)
-                session.add(new_series)
-            await session.commit()
-            refill_stmt = select(Series).where(
-                Series.library_id == library_id,
-                Series.name.in_(tuple(missing_series_names)),
+    )
+    if use_fts:
+        stmt = join_search_index(stmt, dialect)
+
+    page_conditions = list(conditions)
+    if cursor:
+        position = decode_cursor(cursor)
+        if position.get("sort") != sort.value or position.get("order") != order.value:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not match the requested sort order",
             )
-            created_series = (await session.exec(refill_stmt)).all()
-            for series in created_series:
-                series_lookup[series.name] = SeriesRead.model_validate(series)
-        print(f"DEBUG final series lookup keys: {list(series_lookup.keys())}")
-
-    items = []
-    for library_book, book, user_data in rows:
-        series_obj = (
-            series_lookup.get(library_book.series)
-            if library_book.series
-            else None
+        try:
+            after_value = parse_sort_value(position["value"])
+            after_id = UUID(position["id"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        key = tuple_(sort_expr, LibraryBook.id)
+        after = tuple_(
+            literal(after_value, sort_expr.type),
+            literal(after_id, LibraryBook.id.type),
+        )
+        page_conditions.append(key < after if descending else key > after)
+
+    if descending:
+        stmt = stmt.order_by(sort_expr.desc(), LibraryBook.id.desc())
+    else:
+        stmt = stmt.order_by(sort_expr.asc(), LibraryBook.id.asc())
+    stmt = stmt.where(*page_conditions).limit(limit + 1)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    page = (await session.exec(stmt)).all()
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last_library_book, *_, last_value = page[-1]
+        next_cursor = encode_cursor(
+            {
+                "sort": sort.value,
+                "order": order.value,
+                "value": last_value.isoformat()
+                if isinstance(last_value, (date, datetime))
+                else last_value,
+                "id": str(last_library_book.id),
+            }
         )
-        if library_book.series:
-            print(f"DEBUG assigning series for book {library_book.id}: {library_book.series} -> {series_obj}")
-        item = LibraryBookDetail(
+    items = [
+        LibraryBookDetail(
             book=BookV2Read.model_validate(book),
             library_book=LibraryBookRead.model_validate(library_book),
             personal_data=UserBookDataRead.model_validate(user_data) if user_data else None,
-            series=series_obj,
+            series=SeriesRead.model_validate(series) if series else None,
         )
-        items.append(item)
-
-    count_stmt = (
-        select(func.count())
-        .select_from(LibraryBook)
-        .join(BookV2, LibraryBook.book_id == BookV2.id)
-        .where(*conditions)
+        for library_book, book, user_data, series, _ in page
+    ]
+
+    count_signature = (metadata_status, match_query if use_fts else q)
+    total_count: int | None = None
+    if total != TotalMode.NONE:
+        total_count = get_cached_count(
+            library_id,
+            count_signature,
+            allow_stale=total == TotalMode.ESTIMATE,
+        )
+    if total != TotalMode.NONE and total_count is None:
+        count_stmt = (
+            select(func.count())
+            .select_from(LibraryBook)
+            .join(BookV2, LibraryBook.book_id == BookV2.id)
+        )
+        if use_fts:
+            count_stmt = join_search_index(count_stmt, dialect)
+        count_stmt = count_stmt.where(*conditions)
+        total_count = (await session.exec(count_stmt)).one()
+        store_count(library_id, count_signature, total_count)
+
+    result = LibraryBookListResponse(
+        items=items, total=total_count, next_cursor=next_cursor
     )
-    total = (await session.exec(count_stmt)).one()
-
-    result = LibraryBookListResponse(items=items, total=total)
-
-    # Debug: Check if series is in the response
-    if items and items[0].series:
-        print(f"DEBUG: First item series field: {items[0].series}")
-        print(f"DEBUG: Response dict keys: {result.model_dump().get('items', [{}])[0].keys() if result.model_dump().get('items') else 'No items'}")
-
     # Manual serialization to ensure series field is included
     return result.model_dump(mode='json', exclude_none=False)
 
@@ -208,11 +310,6 @@ async def get_library_book(
             & (Series.library_id == library_id)
         )
         series = (await session.exec(stmt)).first()
-        if not series:
-            series = Series(name=library_book.series, library_id=library_id)
-            session.add(series)
-            await session.commit()
-            await session.refresh(series)
 
     return LibraryBookDetail(
         book=BookV2Read.model_validate(book),
@@ -279,8 +376,11 @@ async def create_library_book(
         library_id=library_id,
         **library_fields,
     )
+    library_book.series = normalize_series_name(library_book.series)
     session.add(library_book)
+    await ensure_series(session, library_id, library_book.series)
     await session.commit()
+    bump_library_version(library_id)
     await session.refresh(library_book)
     await session.refresh(book)
 
@@ -321,8 +421,12 @@ async def update_library_book(
         update_data = payload.library_book.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(library_book, field, value)
+        if "series" in update_data:
+            library_book.series = normalize_series_name(library_book.series)
         library_book.updated_at = datetime.utcnow()
         session.add(library_book)
+        if "series" in update_data:
+            await ensure_series(session, library_id, library_book.series)
 
     personal_record: UserBookData | None = None
     if payload.personal_data:
@@ -340,6 +444,10 @@ async def update_library_book(
         session.add(personal_record)
 
     await session.commit()
+    if payload.book:
+        await bump_book_libraries(session, book.id)
+    elif payload.library_book:
+        bump_library_version(library_id)
     await session.refresh(book)
     await session.refresh(library_book)
     if personal_record:
@@ -386,18 +494,43 @@ async def delete_library_book(
     )
     await session.delete(library_book)
     await session.commit()
+    bump_library_version(library_id)
 
     remaining_stmt = select(func.count()).select_from(LibraryBook).where(
         LibraryBook.book_id == book.id
     )
     remaining = (await session.exec(remaining_stmt)).one()
     if remaining == 0:
-        await session.delete(book)
-        await session.commit()
+        await _delete_orphaned_book(book, session)
 
     return None
 
 
+async def _delete_orphaned_book(book: BookV2, session: AsyncSession) -> None:
+    """Delete a book no library holds any more, unless a book club still uses it."""
+    club_stmt = select(BookClubBook.id).where(BookClubBook.book_id == book.id).limit(1)
+    if (await session.exec(club_stmt)).first() is not None:
+        return
+
+    # Detach optional references; SQLite enforces foreign keys
+    await session.exec(delete(EnrichmentJob).where(EnrichmentJob.book_id == book.id))
+    await session.exec(
+        update(Series).where(Series.cover_book_id == book.id).values(cover_book_id=None)
+    )
+    await session.exec(
+        update(ReadingListItem)
+        .where(ReadingListItem.book_id == book.id)
+        .values(book_id=None)
+    )
+    await session.exec(
+        update(BookClub)
+        .where(BookClub.current_book_id == book.id)
+        .values(current_book_id=None)
+    )
+    await session.delete(book)
+    await session.commit()
+
+
 @router.post("/{library_book_id}/cover", response_model=LibraryBookDetail)
 async def upload_cover(
     library_id: UUID,
@@ -485,6 +618,8 @@ async def seed_sample_books(
         book = (await session.exec(existing_book_stmt)).one_or_none()
 
         if not book:
+            # Hand the writer connection back while waiting on the network
+            await session.commit()
             metadata = await fetch_metadata(isbn)
             if not metadata:
                 continue
@@ -519,6 +654,7 @@ async def seed_sample_books(
         )
         session.add(library_book)
         await session.commit()
+        bump_library_version(library_id)
         await session.refresh(library_book)
 
         created.append(
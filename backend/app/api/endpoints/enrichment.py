@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -17,8 +18,10 @@ from app.api.utils.library_access import (
     require_library_permission,
 )
 from app.models import (
+    BookV2,
     BookV2Read,
     EnrichmentJob,
+    EnrichmentJobGroup,
     EnrichmentStatus,
     LibraryBook,
     LibraryBookRead,
@@ -28,11 +31,13 @@ from app.models import (
 )
 from app.services.enrichment import (
     apply_metadata_candidate,
-    process_enrichment_job,
+    get_group_progress,
+    queue_bulk_enrichment,
     queue_enrichment,
     reject_metadata_candidate,
 )
-from app.services.metadata import fetch_metadata, search_books as search_external_metadata
+from app.services.enrichment_worker import notify_enrichment_workers
+from app.services.metadata import lookup_metadata, search_books as search_external_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +50,38 @@ class CandidateResponse(BaseModel):
     metadata_status: str
 
 
+class EnrichmentJobResponse(BaseModel):
+    job_id: int
+    book_id: UUID
+    status: str
+    attempts: int
+    last_error: str | None
+    scheduled_at: datetime
+    updated_at: datetime
+    metadata_status: str
+
+
+class BulkEnrichmentRequest(BaseModel):
+    metadata_status: list[str] | None = Field(
+        default=None,
+        description="Queue books whose metadata_status is one of these, e.g. pending, failed.",
+    )
+    library_book_ids: list[UUID] | None = Field(
+        default=None,
+        description="Queue exactly these library books.",
+    )
+
+
+class EnrichmentGroupResponse(BaseModel):
+    group_id: int
+    library_id: UUID
+    created_at: datetime
+    total: int
+    done: int
+    failed: int
+    remaining: int
+
+
 class CandidateApplyRequest(BaseModel):
     fields: list[str] = Field(
         default_factory=list,
@@ -52,13 +89,58 @@ class CandidateApplyRequest(BaseModel):
     )
 
 
-@router.post("/books/{library_book_id}", response_model=LibraryBookDetail)
+def _job_response(job: EnrichmentJob, book: BookV2) -> EnrichmentJobResponse:
+    assert job.id is not None
+    return EnrichmentJobResponse(
+        job_id=job.id,
+        book_id=job.book_id,
+        status=job.status,
+        attempts=job.attempts,
+        last_error=job.last_error,
+        scheduled_at=job.scheduled_at,
+        updated_at=job.updated_at,
+        metadata_status=book.metadata_status,
+    )
+
+
+async def _get_library_job(
+    library_id: UUID,
+    job_id: int,
+    session: AsyncSession,
+) -> tuple[EnrichmentJob, BookV2]:
+    job = await session.get(EnrichmentJob, job_id, populate_existing=True)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    library_book_stmt = select(LibraryBook).where(
+        LibraryBook.book_id == job.book_id,
+        LibraryBook.library_id == library_id,
+    )
+    library_book = (await session.exec(library_book_stmt)).one_or_none()
+    if not library_book:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Enrichment job not associated with this library",
+        )
+
+    book = await session.get(BookV2, job.book_id, populate_existing=True)
+    if not book:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    return job, book
+
+
+@router.post(
+    "/books/{library_book_id}",
+    response_model=EnrichmentJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def enrich_book(
     library_id: UUID,
     library_book_id: UUID,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
-) -> LibraryBookDetail:
+) -> EnrichmentJobResponse:
+    """Queue enrichment for a book; poll ``GET /jobs/{job_id}`` for the outcome."""
     await require_library_permission(
         library_id,
         current_user.id,
@@ -66,59 +148,116 @@ async def enrich_book(
         (MemberRole.OWNER, MemberRole.ADMIN),
     )
 
-    library_book, book = await get_library_book(library_id, library_book_id, session)
+    _, book = await get_library_book(library_id, library_book_id, session)
 
     job = await queue_enrichment(book, session)
-    if job.status == EnrichmentStatus.IN_PROGRESS:
-        await session.refresh(book)
-    else:
-        book = await process_enrichment_job(job, session)
+    notify_enrichment_workers()
+    return _job_response(job, book)
 
-    user_data = await get_user_book_data(library_book, current_user.id, session)
-    return LibraryBookDetail(
-        book=BookV2Read.model_validate(book),
-        library_book=LibraryBookRead.model_validate(library_book),
-        personal_data=UserBookDataRead.model_validate(user_data) if user_data else None,
-    )
 
-
-@router.post("/jobs/{job_id}", response_model=LibraryBookDetail)
-async def process_job(
+@router.post(
+    "/bulk",
+    response_model=EnrichmentGroupResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def enrich_books_bulk(
     library_id: UUID,
-    job_id: int,
+    payload: BulkEnrichmentRequest,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
-) -> LibraryBookDetail:
+) -> EnrichmentGroupResponse:
+    """Queue enrichment for every matching book; poll ``GET /bulk/{group_id}``."""
     await require_library_permission(
         library_id,
         current_user.id,
         session,
         (MemberRole.OWNER, MemberRole.ADMIN),
     )
+    if not payload.metadata_status and not payload.library_book_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide metadata_status or library_book_ids",
+        )
+
+    group = await queue_bulk_enrichment(
+        session,
+        library_id,
+        current_user.id,
+        metadata_statuses=payload.metadata_status,
+        library_book_ids=payload.library_book_ids,
+    )
+    notify_enrichment_workers()
+    return await _group_response(group, session)
 
-    job = await session.get(EnrichmentJob, job_id)
-    if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
 
-    library_book_stmt = select(LibraryBook).where(
-        LibraryBook.book_id == job.book_id,
-        LibraryBook.library_id == library_id,
+@router.get("/bulk/{group_id}", response_model=EnrichmentGroupResponse)
+async def get_bulk_enrichment(
+    library_id: UUID,
+    group_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> EnrichmentGroupResponse:
+    await require_library_member(library_id, current_user.id, session)
+    group = await session.get(EnrichmentJobGroup, group_id)
+    if not group or group.library_id != library_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job group not found")
+    return await _group_response(group, session)
+
+
+async def _group_response(group: EnrichmentJobGroup, session: AsyncSession) -> EnrichmentGroupResponse:
+    assert group.id is not None
+    progress = await get_group_progress(session, group)
+    return EnrichmentGroupResponse(
+        group_id=group.id,
+        library_id=group.library_id,
+        created_at=group.created_at,
+        **progress,
     )
-    library_book = (await session.exec(library_book_stmt)).one_or_none()
-    if not library_book:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Enrichment job not associated with this library",
-        )
 
-    book = await process_enrichment_job(job, session)
-    user_data = await get_user_book_data(library_book, current_user.id, session)
-    return LibraryBookDetail(
-        book=BookV2Read.model_validate(book),
-        library_book=LibraryBookRead.model_validate(library_book),
-        personal_data=UserBookDataRead.model_validate(user_data) if user_data else None,
+
+@router.get("/jobs/{job_id}", response_model=EnrichmentJobResponse)
+async def get_job(
+    library_id: UUID,
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> EnrichmentJobResponse:
+    await require_library_member(library_id, current_user.id, session)
+    job, book = await _get_library_job(library_id, job_id, session)
+    return _job_response(job, book)
+
+
+@router.post(
+    "/jobs/{job_id}",
+    response_model=EnrichmentJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def process_job(
+    library_id: UUID,
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> EnrichmentJobResponse:
+    """Re-queue a finished job so the workers pick it up immediately."""
+    await require_library_permission(
+        library_id,
+        current_user.id,
+        session,
+        (MemberRole.OWNER, MemberRole.ADMIN),
     )
 
+    job, book = await _get_library_job(library_id, job_id, session)
+    if job.status not in (EnrichmentStatus.PENDING, EnrichmentStatus.IN_PROGRESS):
+        now = datetime.utcnow()
+        job.status = EnrichmentStatus.PENDING
+        job.scheduled_at = now
+        job.updated_at = now
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+    notify_enrichment_workers()
+    return _job_response(job, book)
+
 
 @router.get("/books/{library_book_id}/candidate", response_model=CandidateResponse)
 async def get_candidate(
@@ -236,16 +375,15 @@ async def get_metadata_preview(
 ) -> dict[str, object]:
     await require_library_member(library_id, current_user.id, session)
 
-    from app.services.metadata import fetch_metadata
-
     logger.info(f"Metadata preview requested for identifier: {identifier}")
 
-    metadata = await fetch_metadata(identifier)
-    logger.info("Metadata preview response for %s: %s", identifier, metadata)
+    lookup = await lookup_metadata(identifier)
+    metadata = lookup.metadata
+    logger.info("Metadata preview response for %s: %s (%s)", identifier, metadata, lookup.summary())
     if not metadata:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No metadata found for this identifier",
         )
-    return metadata
+    return {**metadata, "providers": lookup.report()}
 
@@ -22,6 +22,8 @@ from app.models import (
     NotificationType,
     User,
 )
+from app.services.membership import get_library_member, invalidate_membership
+from app.services.notifications import publish_notification
 
 router = APIRouter(prefix="/invitations", tags=["invitations"])
 
@@ -39,12 +41,7 @@ async def create_invitation(
 ) -> LibraryInvitation:
     """Create a library invitation. Requires owner or admin role."""
     # Verify user has permission (owner or admin)
-    stmt = select(LibraryMember).where(
-        LibraryMember.library_id == library_id,
-        LibraryMember.user_id == current_user.id,
-    )
-    result = await session.execute(stmt)
-    member = result.scalar_one_or_none()
+    member = await get_library_member(session, library_id, current_user.id)
 
     if not member or member.role not in [MemberRole.OWNER, MemberRole.ADMIN]:
         raise HTTPException(
@@ -141,6 +138,7 @@ async def create_invitation(
     session.add(notification)
     await session.commit()
     await session.refresh(invitation)
+    publish_notification(notification)
 
     return invitation
 
@@ -229,12 +227,7 @@ async def accept_invitation(
         )
 
     # Check if user is already a member
-    existing_member_stmt = select(LibraryMember).where(
-        LibraryMember.library_id == invitation.library_id,
-        LibraryMember.user_id == current_user.id,
-    )
-    existing_member_result = await session.execute(existing_member_stmt)
-    if existing_member_result.scalar_one_or_none():
+    if await get_library_member(session, invitation.library_id, current_user.id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You are already a member of this library",
@@ -255,6 +248,7 @@ async def accept_invitation(
     invitation.responded_at = datetime.utcnow()
 
     await session.commit()
+    invalidate_membership(invitation.library_id, current_user.id)
 
     return {"message": "Invitation accepted successfully"}
 
@@ -308,12 +302,7 @@ async def list_library_invitations(
 ) -> list[LibraryInvitation]:
     """List all invitations for a library. Requires owner or admin role."""
     # Verify user has permission
-    stmt = select(LibraryMember).where(
-        LibraryMember.library_id == library_id,
-        LibraryMember.user_id == current_user.id,
-    )
-    result = await session.execute(stmt)
-    member = result.scalar_one_or_none()
+    member = await get_library_member(session, library_id, current_user.id)
 
     if not member or member.role not in [MemberRole.OWNER, MemberRole.ADMIN]:
         raise HTTPException(
@@ -350,12 +339,7 @@ async def cancel_invitation(
         )
 
     # Verify user has permission (owner only)
-    member_stmt = select(LibraryMember).where(
-        LibraryMember.library_id == invitation.library_id,
-        LibraryMember.user_id == current_user.id,
-    )
-    member_result = await session.execute(member_stmt)
-    member = member_result.scalar_one_or_none()
+    member = await get_library_member(session, invitation.library_id, current_user.id)
 
     if not member or member.role != MemberRole.OWNER:
         raise HTTPException(
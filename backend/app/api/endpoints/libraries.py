@@ -3,12 +3,18 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_current_user, get_session
+from app.api.utils.library_access import current_library_member, library_role_required
 from app.models import (
+    EnrichmentJob,
+    EnrichmentJobGroup,
     Library,
+    LibraryBook,
+    LibraryInvitation,
     LibraryCreate,
     LibraryMember,
     LibraryMemberCreate,
@@ -19,8 +25,11 @@ from app.models import (
     LibraryUpdate,
     LibraryWithRole,
     MemberRole,
+    Series,
     User,
+    UserBookData,
 )
+from app.services.membership import invalidate_membership
 
 router = APIRouter(prefix="/libraries", tags=["libraries"])
 
@@ -52,6 +61,7 @@ async def create_library(
 
     session.add(member)
     await session.commit()
+    invalidate_membership(library.id, current_user.id)
 
     return library
 
@@ -91,12 +101,10 @@ async def list_libraries(
 @router.get("/{library_id}", response_model=LibraryRead)
 async def get_library(
     library_id: UUID,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(current_library_member),
     session: AsyncSession = Depends(get_session),
 ) -> Library:
     """Get a single library by ID."""
-    # Verify user is a member
-    await _verify_library_member(library_id, current_user.id, session)
 
     # Fetch library
     stmt = select(Library).where(Library.id == library_id)
@@ -116,14 +124,10 @@ async def get_library(
 async def update_library(
     library_id: UUID,
     library_data: LibraryUpdate,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(library_role_required(MemberRole.OWNER, MemberRole.ADMIN)),
     session: AsyncSession = Depends(get_session),
 ) -> Library:
     """Update a library. Requires owner or admin role."""
-    # Verify user has permission
-    await _verify_library_permission(
-        library_id, current_user.id, [MemberRole.OWNER, MemberRole.ADMIN], session
-    )
 
     # Fetch library
     stmt = select(Library).where(Library.id == library_id)
@@ -152,14 +156,10 @@ async def update_library(
 @router.delete("/{library_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_library(
     library_id: UUID,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(library_role_required(MemberRole.OWNER)),
     session: AsyncSession = Depends(get_session),
 ) -> None:
     """Delete a library. Requires owner role."""
-    # Verify user is owner
-    await _verify_library_permission(
-        library_id, current_user.id, [MemberRole.OWNER], session
-    )
 
     # Fetch library
     stmt = select(Library).where(Library.id == library_id)
@@ -172,17 +172,25 @@ async def delete_library(
             detail="Library not found",
         )
 
-    # Delete all memberships first
-    members_stmt = select(LibraryMember).where(LibraryMember.library_id == library_id)
-    members_result = await session.execute(members_stmt)
-    members = members_result.scalars().all()
-
-    for member in members:
-        await session.delete(member)
+    # Delete dependent rows first; SQLite enforces foreign keys
+    group_ids = select(EnrichmentJobGroup.id).where(EnrichmentJobGroup.library_id == library_id)
+    await session.execute(
+        update(EnrichmentJob).where(EnrichmentJob.group_id.in_(group_ids)).values(group_id=None)
+    )
+    for model in (
+        EnrichmentJobGroup,
+        UserBookData,
+        LibraryBook,
+        Series,
+        LibraryInvitation,
+        LibraryMember,
+    ):
+        await session.execute(delete(model).where(model.library_id == library_id))
 
     # Delete library
     await session.delete(library)
     await session.commit()
+    invalidate_membership(library_id)
 
 
 # Library Member Management
@@ -191,12 +199,10 @@ async def delete_library(
 @router.get("/{library_id}/members", response_model=list[LibraryMemberWithUser])
 async def list_library_members(
     library_id: UUID,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(current_library_member),
     session: AsyncSession = Depends(get_session),
 ) -> list[LibraryMemberWithUser]:
     """List all members of a library with user details."""
-    # Verify user is a member
-    await _verify_library_member(library_id, current_user.id, session)
 
     # Fetch members with user details
     stmt = (
@@ -233,14 +239,10 @@ async def list_library_members(
 async def add_library_member(
     library_id: UUID,
     member_data: LibraryMemberCreate,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(library_role_required(MemberRole.OWNER, MemberRole.ADMIN)),
     session: AsyncSession = Depends(get_session),
 ) -> LibraryMember:
     """Add a new member to a library. Requires admin or owner role."""
-    # Verify user has permission
-    await _verify_library_permission(
-        library_id, current_user.id, [MemberRole.OWNER, MemberRole.ADMIN], session
-    )
 
     # Verify user to be added exists
     user_stmt = select(User).where(User.id == member_data.user_id)
@@ -276,6 +278,7 @@ async def add_library_member(
 
     session.add(member)
     await session.commit()
+    invalidate_membership(library_id, member_data.user_id)
     await session.refresh(member)
 
     return member
@@ -286,14 +289,10 @@ async def update_library_member(
     library_id: UUID,
     user_id: UUID,
     member_data: LibraryMemberUpdate,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(library_role_required(MemberRole.OWNER)),
     session: AsyncSession = Depends(get_session),
 ) -> LibraryMember:
     """Update a library member's role. Requires owner role."""
-    # Verify user has permission
-    await _verify_library_permission(
-        library_id, current_user.id, [MemberRole.OWNER], session
-    )
 
     # Fetch member
     stmt = select(LibraryMember).where(
@@ -321,6 +320,7 @@ async def update_library_member(
 
     session.add(member)
     await session.commit()
+    invalidate_membership(library_id, user_id)
     await session.refresh(member)
 
     return member
@@ -330,14 +330,10 @@ async def update_library_member(
 async def remove_library_member(
     library_id: UUID,
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    _: LibraryMember = Depends(library_role_required(MemberRole.OWNER, MemberRole.ADMIN)),
     session: AsyncSession = Depends(get_session),
 ) -> None:
     """Remove a member from a library. Requires owner or admin role."""
-    # Verify user has permission
-    await _verify_library_permission(
-        library_id, current_user.id, [MemberRole.OWNER, MemberRole.ADMIN], session
-    )
 
     # Fetch member
     stmt = select(LibraryMember).where(
@@ -362,47 +358,5 @@ async def remove_library_member(
 
     await session.delete(member)
     await session.commit()
-
-
-# Helper Functions
-
-
-async def _verify_library_member(
-    library_id: UUID,
-    user_id: UUID,
-    session: AsyncSession,
-) -> LibraryMember:
-    """Verify user is a member of the library."""
-    stmt = select(LibraryMember).where(
-        LibraryMember.library_id == library_id,
-        LibraryMember.user_id == user_id,
-    )
-    result = await session.execute(stmt)
-    member = result.scalars().first()
-
-    if not member:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this library",
-        )
-
-    return member
-
-
-async def _verify_library_permission(
-    library_id: UUID,
-    user_id: UUID,
-    required_roles: list[MemberRole],
-    session: AsyncSession,
-) -> LibraryMember:
-    """Verify user has required role in the library."""
-    member = await _verify_library_member(library_id, user_id, session)
-
-    if member.role not in required_roles:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Requires one of the following roles: {', '.join(r.value for r in required_roles)}",
-        )
-
-    return member
+    invalidate_membership(library_id, user_id)
 
@@ -5,7 +5,7 @@ from typing import Iterable
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -230,6 +230,9 @@ async def delete_reading_list(
     if reading_list.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the owner can delete the list.")
 
+    # Dependent rows first; SQLite enforces foreign keys
+    for model in (ReadingListProgress, ReadingListItem, ReadingListMember):
+        await session.execute(delete(model).where(model.list_id == list_id))
     await session.delete(reading_list)
     await session.commit()
 
@@ -337,6 +340,9 @@ async def delete_list_item(
     if list_item is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="List item not found.")
 
+    await session.execute(
+        delete(ReadingListProgress).where(ReadingListProgress.list_item_id == list_item.id)
+    )
     await session.delete(list_item)
     await session.commit()
 
@@ -1,36 +1,84 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import literal, tuple_, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.background import BackgroundTask
 
 from app.api.deps import get_current_user, get_session
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.api.utils.sse import KEEPALIVE, event_stream_response, format_sse
+from app.core.config import get_settings
+from app.core.pubsub import SubscriptionLagged
 from app.models import Notification, NotificationRead, NotificationUpdate, User
+from app.services.notifications import (
+    count_unread,
+    notification_events,
+    publish_unread_count,
+)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
+settings = get_settings()
 
 
 @router.get("", response_model=list[NotificationRead])
 async def list_notifications(
+    response: Response,
     unread_only: bool = False,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(
+        None, description="Opaque X-Next-Cursor value from the previous page"
+    ),
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[Notification]:
-    """List notifications for the current user."""
+    """
+    List notifications for the current user, newest first.
+
+    When more remain, the ``X-Next-Cursor`` response header carries the
+    cursor for the next page.
+    """
     stmt = select(Notification).where(Notification.user_id == current_user.id)
 
     if unread_only:
         stmt = stmt.where(Notification.read == False)
 
-    stmt = stmt.order_by(Notification.created_at.desc()).limit(limit)
+    if cursor:
+        position = decode_cursor(cursor)
+        try:
+            after = tuple_(
+                literal(
+                    datetime.fromisoformat(position["created_at"]),
+                    Notification.created_at.type,
+                ),
+                literal(UUID(position["id"]), Notification.id.type),
+            )
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        stmt = stmt.where(tuple_(Notification.created_at, Notification.id) < after)
+
+    stmt = stmt.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1)
 
     result = await session.execute(stmt)
-    notifications = result.scalars().all()
+    notifications = list(result.scalars().all())
 
-    return list(notifications)
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        last = notifications[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            {"created_at": last.created_at.isoformat(), "id": str(last.id)}
+        )
+    return notifications
 
 
 @router.get("/unread-count", response_model=dict)
@@ -39,15 +87,48 @@ async def get_unread_count(
     session: AsyncSession = Depends(get_session),
 ) -> dict:
     """Get count of unread notifications."""
-    stmt = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.read == False,
-    )
+    return {"count": await count_unread(session, current_user.id)}
 
-    result = await session.execute(stmt)
-    notifications = result.scalars().all()
 
-    return {"count": len(notifications)}
+@router.get("/events")
+async def stream_notifications(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Server-Sent Events channel for the current user's notifications.
+
+    Opens with a ``ready`` event carrying the unread count, then sends a
+    ``notification`` event for each new notification and ``unread_count``
+    whenever read state changes. A ``resync`` event means events were
+    dropped and the client should refetch.
+    """
+    subscription = notification_events.subscribe(current_user.id)
+    try:
+        unread = await count_unread(session, current_user.id)
+        # The stream outlives the request's queries; hand the connection back
+        await session.commit()
+    except BaseException:
+        subscription.close()
+        raise
+
+    async def stream() -> AsyncIterator[str]:
+        with subscription:
+            yield format_sse({"count": unread}, event="ready")
+            while True:
+                try:
+                    event, data = await subscription.get(
+                        timeout=settings.event_keepalive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+                    continue
+                except SubscriptionLagged:
+                    yield format_sse({}, event="resync")
+                    return
+                yield format_sse(data, event=event)
+
+    return event_stream_response(stream(), background=BackgroundTask(subscription.close))
 
 
 @router.patch("/{notification_id}", response_model=NotificationRead)
@@ -82,6 +163,7 @@ async def update_notification(
     session.add(notification)
     await session.commit()
     await session.refresh(notification)
+    await publish_unread_count(session, current_user.id)
 
     return notification
 
@@ -92,21 +174,21 @@ async def mark_all_read(
     session: AsyncSession = Depends(get_session),
 ) -> dict:
     """Mark all notifications as read for the current user."""
-    stmt = select(Notification).where(
-        Notification.user_id == current_user.id,
-        Notification.read == False,
+    stmt = (
+        update(Notification)
+        .where(
+            Notification.user_id == current_user.id,
+            Notification.read == False,
+        )
+        .values(read=True)
     )
 
     result = await session.execute(stmt)
-    notifications = result.scalars().all()
-
-    for notification in notifications:
-        notification.read = True
-        session.add(notification)
-
+    marked = result.rowcount
     await session.commit()
+    await publish_unread_count(session, current_user.id)
 
-    return {"message": f"Marked {len(notifications)} notifications as read"}
+    return {"message": f"Marked {marked} notifications as read"}
 
 
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -136,3 +218,5 @@ async def delete_notification(
 
     await session.delete(notification)
     await session.commit()
+    if not notification.read:
+        await publish_unread_count(session, current_user.id)
@@ -5,11 +5,12 @@ from pathlib import Path
 from uuid import UUID
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
 from sqlalchemy import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_current_user, get_session
+from app.api.schemas.series import SeriesReadingStatus
 from app.api.utils.library_access import (
     require_library_member,
     require_library_permission,
@@ -23,8 +24,9 @@ from app.models import (
     SeriesRead,
     SeriesUpdate,
     User,
-    UserBookData,
 )
+from app.services.library_counts import bump_library_version
+from app.services.series import series_reading_statuses
 
 router = APIRouter(prefix="/libraries/{library_id}/series", tags=["series"])
 
@@ -59,42 +61,27 @@ async def list_series(
 ) -> list[SeriesRead]:
     await require_library_member(library_id, current_user.id, session)
 
-    # Query series - explicitly fetch as dict to avoid metadata cache issues
     result = await session.execute(
         select(Series).where(Series.library_id == library_id)
     )
-    series_list = result.scalars().all()
-    series_records = {s.name: s for s in series_list}
+    return [SeriesRead.model_validate(s) for s in result.scalars().all()]
 
-    book_statement = (
-        select(LibraryBook.series)
-        .where(
-            LibraryBook.library_id == library_id,
-            LibraryBook.series.isnot(None),
-        )
-        .distinct()
-    )
-    book_result = await session.exec(book_statement)
-    book_series_names = {
-        name.strip()
-        for name in book_result.scalars().all()
-        if isinstance(name, str) and name.strip()
-    }
 
-    created = False
-    for series_name in book_series_names:
-        if series_name not in series_records:
-            new_series = Series(name=series_name, library_id=library_id)
-            session.add(new_series)
-            series_records[series_name] = new_series
-            created = True
-
-    if created:
-        await session.commit()
-        for series in series_records.values():
-            await session.refresh(series)
+@router.get("/reading-status", response_model=list[SeriesReadingStatus])
+async def list_series_reading_status(
+    library_id: UUID,
+    ids: list[int] | None = Query(None, max_length=1000),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[dict]:
+    """
+    Reading status for many series in one request.
 
-    return [SeriesRead.model_validate(s) for s in series_records.values()]
+    Pass ``ids`` (repeatable) to pick series; without it every series in the
+    library is returned. Unknown ids are skipped rather than rejected.
+    """
+    await require_library_member(library_id, current_user.id, session)
+    return await series_reading_statuses(session, library_id, current_user.id, ids)
 
 
 @router.get("/{series_id}", response_model=SeriesRead)
@@ -146,7 +133,7 @@ async def get_series_books(
     ]
 
 
-@router.get("/{series_id}/reading-status")
+@router.get("/{series_id}/reading-status", response_model=SeriesReadingStatus)
 async def get_series_reading_status(
     library_id: UUID,
     series_id: int,
@@ -162,54 +149,12 @@ async def get_series_reading_status(
     """
     await require_library_member(library_id, current_user.id, session)
 
-    series = await session.get(Series, series_id)
-    if not series or series.library_id != library_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
-
-    # Get all library books in this series
-    stmt = select(LibraryBook).where(
-        LibraryBook.library_id == library_id,
-        LibraryBook.series == series.name,
+    statuses = await series_reading_statuses(
+        session, library_id, current_user.id, [series_id]
     )
-    library_books = (await session.exec(stmt)).scalars().all()
-
-    if not library_books:
-        return {
-            "series_id": series_id,
-            "reading_status": "not_started",
-            "total_books": 0,
-            "read_books": 0,
-        }
-
-    # Get user's reading status for each book
-    read_count = 0
-    for library_book in library_books:
-        user_data_stmt = select(UserBookData).where(
-            UserBookData.user_id == current_user.id,
-            UserBookData.library_id == library_id,
-            UserBookData.book_id == library_book.book_id,
-        )
-        user_data = (await session.exec(user_data_stmt)).scalars().first()
-
-        if user_data and user_data.reading_status == "Read":
-            read_count += 1
-
-    total_books = len(library_books)
-
-    # Calculate aggregate status
-    if read_count == 0:
-        status_value = "not_started"
-    elif read_count == total_books:
-        status_value = "completed"
-    else:
-        status_value = "reading"
-
-    return {
-        "series_id": series_id,
-        "reading_status": status_value,
-        "total_books": total_books,
-        "read_books": read_count,
-    }
+    if not statuses:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
+    return statuses[0]
 
 
 @router.post("", response_model=SeriesRead, status_code=status.HTTP_201_CREATED)
@@ -370,4 +315,5 @@ async def delete_series(
 
     await session.delete(series)
     await session.commit()
+    bump_library_version(library_id)
     return None
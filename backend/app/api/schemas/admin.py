@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import Any, List
 from uuid import UUID
 
 from pydantic import ConfigDict
@@ -53,3 +53,41 @@ class AdminUpdatePassword(SQLModel):
 
 class AdminUpdateLibraryRole(SQLModel):
     role: MemberRole
+
+
+class AdminMetadataCacheEntry(SQLModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    provider: str
+    identifier: str
+    status: str
+    payload: dict[str, Any] | None = None
+    fetched_at: datetime
+    expires_at: datetime
+    expired: bool
+
+
+class AdminMetadataCacheList(SQLModel):
+    entries: List[AdminMetadataCacheEntry]
+    total: int
+
+
+class AdminMetadataCachePurgeResult(SQLModel):
+    deleted: int
+
+
+class AdminDatabaseDiagnostics(SQLModel):
+    dialect: str
+    configured: dict[str, Any]
+    effective: dict[str, Any]
+
+
+class AdminMetadataProviderState(SQLModel):
+    provider: str
+    rate_per_second: float
+    capacity: int
+    tokens: float
+    paused_for_seconds: float
+    state: str
+    consecutive_failures: int
+    open_for_seconds: float
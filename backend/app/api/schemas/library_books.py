@@ -16,4 +16,5 @@ class LibraryBookDetail(SQLModel):
 
 class LibraryBookListResponse(SQLModel):
     items: list[LibraryBookDetail]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
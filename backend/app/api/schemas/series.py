@@ -0,0 +1,10 @@
+from typing import Literal
+
+from sqlmodel import SQLModel
+
+
+class SeriesReadingStatus(SQLModel):
+    series_id: int
+    reading_status: Literal["not_started", "reading", "completed"]
+    total_books: int
+    read_books: int
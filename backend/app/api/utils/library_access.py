@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from uuid import UUID
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import BookV2, LibraryBook, LibraryMember, MemberRole, UserBookData
+from app.api.deps import get_current_user, get_session
+from app.models import BookV2, LibraryBook, LibraryMember, MemberRole, User, UserBookData
+from app.services.membership import get_library_member
 
 
 async def require_library_member(
@@ -14,11 +17,7 @@ async def require_library_member(
     user_id: UUID,
     session: AsyncSession,
 ) -> LibraryMember:
-    stmt = select(LibraryMember).where(
-        LibraryMember.library_id == library_id,
-        LibraryMember.user_id == user_id,
-    )
-    member = (await session.exec(stmt)).one_or_none()
+    member = await get_library_member(session, library_id, user_id)
     if not member:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -43,6 +42,34 @@ async def require_library_permission(
     return member
 
 
+async def current_library_member(
+    library_id: UUID,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> LibraryMember:
+    """Dependency: the caller's membership in the path's library, or 403."""
+    return await require_library_member(library_id, current_user.id, session)
+
+
+def library_role_required(
+    *roles: MemberRole,
+) -> Callable[..., Awaitable[LibraryMember]]:
+    """Dependency factory: the caller's membership, which must hold one of ``roles``."""
+
+    async def dependency(
+        member: LibraryMember = Depends(current_library_member),
+    ) -> LibraryMember:
+        if member.role not in roles:
+            allowed = ", ".join(role.value for role in roles)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Requires one of the following roles: {allowed}",
+            )
+        return member
+
+    return dependency
+
+
 async def get_library_book(
     library_id: UUID,
     library_book_id: UUID,
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+KEEPALIVE = ": keepalive\n\n"
+
+
+def format_sse(data: Any, event: str | None = None) -> str:
+    """Encode one Server-Sent Events message with a JSON payload."""
+    payload = json.dumps(data, separators=(",", ":"), default=str)
+    if event:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
+
+
+def event_stream_response(
+    stream: AsyncIterator[str],
+    *,
+    background: BackgroundTask | None = None,
+) -> StreamingResponse:
+    """Wrap an SSE generator; proxies are asked not to buffer or cache it."""
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=background,
+    )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache whose entries also expire after ``ttl`` seconds.
+
+    Not shared between worker processes; callers pick TTLs that bound how
+    stale another worker's view can be.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry  # type: ignore[misc]
+        if expires_at <= self._timer():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (self._timer() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``."""
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def discard_values_where(self, predicate: Callable[[V], bool]) -> int:
+        """Drop every entry whose value matches ``predicate``."""
+        stale = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._entries))
@@ -7,13 +7,55 @@ class Settings(BaseSettings):
 
     app_name: str = "Book Inventory API"
     database_url: str = "sqlite+aiosqlite:///./data/books.db"
+    database_read_pool_size: int = 8
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_mmap_size_bytes: int = 256 * 1024 * 1024
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_foreign_keys: bool = True
     secret_key: str = "change-me"  # Override in production via APP_SECRET_KEY
     jwt_algorithm: str = "HS256"
     access_token_expire_hours: int = 24
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
     metadata_retry_interval_seconds: int = 3600
+    metadata_retry_max_delay_seconds: int = 24 * 3600
+    metadata_retry_max_attempts: int = 5
     openlibrary_base_url: str = "https://openlibrary.org"
     google_books_base_url: str = "https://www.googleapis.com/books/v1/volumes"
+    openlibrary_timeout_seconds: float = 10.0
+    google_books_timeout_seconds: float = 10.0
+    metadata_http_max_connections: int = 20
+    metadata_http_max_keepalive_connections: int = 10
+    metadata_http_keepalive_expiry_seconds: float = 30.0
+    metadata_http2: bool = True
+    metadata_fetch_deadline_seconds: float = 8.0
+    metadata_provider_concurrency: int = 4
+    openlibrary_rate_per_second: float = 3.0
+    google_books_rate_per_second: float = 2.0
+    metadata_rate_burst: int = 5
+    metadata_rate_limit_pause_seconds: float = 60.0
+    metadata_circuit_failure_threshold: int = 5
+    metadata_circuit_cooldown_seconds: float = 120.0
+    metadata_cache_ttl_seconds: int = 30 * 24 * 3600
+    metadata_cache_negative_ttl_seconds: int = 24 * 3600
+    enrichment_workers: int = 4
+    enrichment_poll_interval_seconds: float = 5.0
+    enrichment_job_lease_seconds: int = 600
     frontend_dist_dir: str | None = None
+    book_count_cache_size: int = 1024
+    book_count_cache_ttl_seconds: int = 300
+    user_cache_size: int = 4096
+    user_cache_ttl_seconds: int = 60
+    membership_cache_size: int = 8192
+    membership_cache_ttl_seconds: int = 60
+    event_queue_size: int = 256
+    event_keepalive_seconds: float = 15.0
+    notification_retention_days: int = 90
+    notification_retention_interval_seconds: float = 6 * 3600
+    notification_retention_batch_size: int = 1000
 
 
 def get_settings() -> Settings:
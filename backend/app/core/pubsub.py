@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+_LAGGED = object()
+
+
+class SubscriptionLagged(Exception):
+    """The subscriber fell too far behind and missed messages."""
+
+
+class Subscription(Generic[K, T]):
+    """
+    One subscriber's bounded queue of messages for a single topic.
+
+    A subscriber that lets its queue fill up is dropped rather than slowing
+    down publishers; its next :meth:`get` raises :class:`SubscriptionLagged`
+    so it can reload state and subscribe again.
+    """
+
+    def __init__(self, broker: Broker[K, T], key: K, maxsize: int) -> None:
+        self.key = key
+        self._broker = broker
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize + 1)
+        self._maxsize = maxsize
+        self.closed = False
+
+    def _deliver(self, message: T) -> None:
+        if self._queue.qsize() < self._maxsize:
+            self._queue.put_nowait(message)
+            return
+        # The spare slot holds the marker, so queued messages are kept
+        self._queue.put_nowait(_LAGGED)
+        self.close()
+
+    async def get(self, timeout: float | None = None) -> T:
+        """
+        Wait for the next message.
+
+        Raises ``asyncio.TimeoutError`` when nothing arrives within ``timeout``
+        seconds and :class:`SubscriptionLagged` once messages were dropped.
+        """
+        message = await asyncio.wait_for(self._queue.get(), timeout)
+        if message is _LAGGED:
+            raise SubscriptionLagged()
+        return message
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._broker._remove(self)
+
+    def __enter__(self) -> Subscription[K, T]:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class Broker(Generic[K, T]):
+    """
+    In-process publish/subscribe keyed by topic.
+
+    Publishing never blocks and delivers only to subscribers in this
+    process; with several workers each one sees the events published by
+    requests it served itself.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._subscribers: dict[K, set[Subscription[K, T]]] = {}
+
+    def subscribe(self, key: K) -> Subscription[K, T]:
+        subscription: Subscription[K, T] = Subscription(self, key, self.maxsize)
+        self._subscribers.setdefault(key, set()).add(subscription)
+        return subscription
+
+    def publish(self, key: K, message: T) -> int:
+        """Queue ``message`` for every subscriber of ``key``; returns how many."""
+        subscribers = list(self._subscribers.get(key, ()))
+        for subscription in subscribers:
+            subscription._deliver(message)
+        return len(subscribers)
+
+    def subscriber_count(self, key: K) -> int:
+        return len(self._subscribers.get(key, ()))
+
+    def _remove(self, subscription: Subscription[K, T]) -> None:
+        subscribers = self._subscribers.get(subscription.key)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.key]
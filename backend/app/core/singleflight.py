@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """
+    Coalesce concurrent calls that share a key into one in-flight call.
+
+    The first caller's coroutine runs as a task and every caller awaits it
+    through ``asyncio.shield``, so a caller that is cancelled (for example a
+    client disconnecting) does not cancel the work for the others. The key
+    is released as soon as the call finishes; later calls start afresh.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Task[T]] = {}
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: K, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
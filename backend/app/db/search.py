@@ -0,0 +1,297 @@
+"""
+Full-text search index for library books.
+
+On SQLite the catalogue is mirrored into an FTS5 virtual table, one row per
+``library_books`` record, using the library book's rowid as the FTS rowid.
+Triggers on ``library_books`` and ``books_v2`` keep the index in sync on
+every insert, update and delete, so application code never writes to it.
+
+The rowid of ``library_books`` is only stable while the table is not
+VACUUMed; run :func:`rebuild_search_index` after a VACUUM.
+
+On PostgreSQL the same fields are folded into a weighted ``tsvector`` column
+on ``library_books`` with a GIN index. Triggers maintain it the same way,
+so both backends answer the same prefix queries.
+"""
+from __future__ import annotations
+
+import re
+from typing import TypeVar
+
+from sqlalchemy import Connection, Float, Select, cast, event, func, literal_column, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.sql import ColumnElement, column, table
+from sqlmodel import SQLModel
+
+S = TypeVar("S", bound=Select)
+
+FTS_TABLE = "library_books_fts"
+
+# Indexed columns and their bm25 weights (higher means more relevant).
+FTS_COLUMNS: dict[str, float] = {
+    "title": 10.0,
+    "authors": 5.0,
+    "isbn": 5.0,
+    "series": 4.0,
+    "subjects": 2.0,
+    "publisher": 1.0,
+    "description": 1.0,
+    "physical_location": 1.0,
+}
+
+library_books_fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+
+_JSON_TEXT = "COALESCE((SELECT group_concat(value, ' ') FROM json_each({ref})), '')"
+
+
+def _row_select(book: str, library_book: str) -> str:
+    """SELECT list producing one FTS row from a books_v2/library_books pair."""
+    return ", ".join(
+        [
+            f"{library_book}.rowid",
+            f"{book}.title",
+            _JSON_TEXT.format(ref=f"{book}.authors"),
+            f"{book}.isbn",
+            f"{library_book}.series",
+            _JSON_TEXT.format(ref=f"{book}.subjects"),
+            f"{book}.publisher",
+            f"{book}.description",
+            f"{library_book}.physical_location",
+        ]
+    )
+
+
+_INSERT_COLUMNS = "rowid, " + ", ".join(FTS_COLUMNS)
+
+_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {", ".join(FTS_COLUMNS)},
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS library_books_fts_ai AFTER INSERT ON library_books
+    BEGIN
+        INSERT INTO {FTS_TABLE} ({_INSERT_COLUMNS})
+        SELECT {_row_select("b", "NEW")} FROM books_v2 AS b WHERE b.id = NEW.book_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS library_books_fts_ad AFTER DELETE ON library_books
+    BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS library_books_fts_au
+    AFTER UPDATE OF book_id, series, physical_location ON library_books
+    BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid;
+        INSERT INTO {FTS_TABLE} ({_INSERT_COLUMNS})
+        SELECT {_row_select("b", "NEW")} FROM books_v2 AS b WHERE b.id = NEW.book_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS books_v2_fts_au
+    AFTER UPDATE OF title, authors, isbn, subjects, publisher, description ON books_v2
+    BEGIN
+        DELETE FROM {FTS_TABLE}
+        WHERE rowid IN (SELECT rowid FROM library_books WHERE book_id = NEW.id);
+        INSERT INTO {FTS_TABLE} ({_INSERT_COLUMNS})
+        SELECT {_row_select("NEW", "lb")} FROM library_books AS lb WHERE lb.book_id = NEW.id;
+    END
+    """,
+]
+
+
+# PostgreSQL: weights map the FTS5 bm25 weights onto tsvector's A-D classes
+_PG_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION library_book_search_vector(uuid, text, text)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('simple', coalesce(b.title, '')), 'A')
+        || setweight(jsonb_to_tsvector('simple', coalesce(b.authors, '[]'::jsonb), '["string"]'), 'B')
+        || setweight(to_tsvector('simple', concat_ws(' ', b.isbn, $2)), 'B')
+        || setweight(jsonb_to_tsvector('simple', coalesce(b.subjects, '[]'::jsonb), '["string"]'), 'C')
+        || setweight(to_tsvector('simple', concat_ws(' ', b.publisher, b.description, $3)), 'D')
+    FROM books_v2 AS b
+    WHERE b.id = $1
+$$
+"""
+
+_PG_DDL = [
+    "ALTER TABLE library_books ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    _PG_VECTOR_FUNCTION,
+    """
+    CREATE OR REPLACE FUNCTION library_books_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := library_book_search_vector(
+            NEW.book_id, NEW.series, NEW.physical_location
+        );
+        RETURN NEW;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS library_books_search_vector_biu ON library_books",
+    """
+    CREATE TRIGGER library_books_search_vector_biu
+    BEFORE INSERT OR UPDATE OF book_id, series, physical_location ON library_books
+    FOR EACH ROW EXECUTE FUNCTION library_books_search_vector_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION books_v2_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE library_books AS lb
+        SET search_vector = library_book_search_vector(lb.book_id, lb.series, lb.physical_location)
+        WHERE lb.book_id = NEW.id;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS books_v2_search_vector_au ON books_v2",
+    """
+    CREATE TRIGGER books_v2_search_vector_au
+    AFTER UPDATE OF title, authors, isbn, subjects, publisher, description ON books_v2
+    FOR EACH ROW EXECUTE FUNCTION books_v2_search_vector_update()
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_library_books_search_vector
+    ON library_books USING gin (search_vector)
+    """,
+]
+
+_PG_VECTOR = literal_column("library_books.search_vector")
+
+
+def _pg_search_column_exists(connection: Connection) -> bool:
+    result = connection.execute(
+        text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'library_books' AND column_name = 'search_vector'"
+        )
+    )
+    return result.first() is not None
+
+
+def _fts_table_exists(connection: Connection) -> bool:
+    result = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    )
+    return result.first() is not None
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Repopulate the search index from the current catalogue."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text(
+                "UPDATE library_books SET search_vector = "
+                "library_book_search_vector(book_id, series, physical_location)"
+            )
+        )
+        return
+    connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    connection.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} ({_INSERT_COLUMNS}) "
+            f"SELECT {_row_select('b', 'lb')} FROM library_books AS lb "
+            "JOIN books_v2 AS b ON b.id = lb.book_id"
+        )
+    )
+
+
+def create_search_index(connection: Connection) -> None:
+    """Create the search index and triggers, backfilling when newly created."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        backfill = not _fts_table_exists(connection)
+        statements = _DDL
+    elif dialect == "postgresql":
+        backfill = not _pg_search_column_exists(connection)
+        statements = _PG_DDL
+    else:
+        return
+    for statement in statements:
+        connection.execute(text(statement))
+    if backfill:
+        rebuild_search_index(connection)
+
+
+def drop_search_index(connection: Connection) -> None:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+    elif dialect == "postgresql":
+        # The column and triggers go with the tables; only the functions remain
+        for name in (
+            "library_books_search_vector_update()",
+            "books_v2_search_vector_update()",
+        ):
+            connection.execute(text(f"DROP FUNCTION IF EXISTS {name} CASCADE"))
+        connection.execute(
+            text("DROP FUNCTION IF EXISTS library_book_search_vector(uuid, text, text)")
+        )
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _after_create(target, connection: Connection, **kw) -> None:  # noqa: ANN001
+    create_search_index(connection)
+
+
+@event.listens_for(SQLModel.metadata, "before_drop")
+def _before_drop(target, connection: Connection, **kw) -> None:  # noqa: ANN001
+    drop_search_index(connection)
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def supports_full_text(dialect: str) -> bool:
+    return dialect in ("sqlite", "postgresql")
+
+
+def build_match_query(q: str, dialect: str = "sqlite") -> str | None:
+    """
+    Turn free text into a full-text query matching every term as a prefix:
+    FTS5 syntax on SQLite, ``to_tsquery`` syntax on PostgreSQL.
+
+    Returns None when the text contains nothing searchable.
+    """
+    terms = _TOKEN_RE.findall(q)
+    if not terms:
+        return None
+    if dialect == "postgresql":
+        return " & ".join(f"{term.lower()}:*" for term in terms)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _tsquery(match_query: str) -> ColumnElement:
+    return func.to_tsquery(cast("simple", REGCONFIG), match_query)
+
+
+def fts_match(match_query: str, dialect: str = "sqlite") -> ColumnElement[bool]:
+    if dialect == "postgresql":
+        return _PG_VECTOR.op("@@")(_tsquery(match_query))
+    return literal_column(FTS_TABLE).op("MATCH")(match_query)
+
+
+def fts_rank(match_query: str, dialect: str = "sqlite") -> ColumnElement[float]:
+    """Relevance of the current match; lower values are more relevant."""
+    if dialect == "postgresql":
+        # Negated so both backends sort ascending, like bm25
+        return -func.ts_rank(_PG_VECTOR, _tsquery(match_query), type_=Float)
+    return func.bm25(literal_column(FTS_TABLE), *FTS_COLUMNS.values())
+
+
+def fts_join_condition() -> ColumnElement[bool]:
+    return library_books_fts.c.rowid == literal_column("library_books.rowid")
+
+
+def join_search_index(stmt: S, dialect: str) -> S:
+    """Join the FTS5 table where the index lives outside ``library_books``."""
+    if dialect == "sqlite":
+        return stmt.join(library_books_fts, fts_join_condition())
+    return stmt
@@ -1,20 +1,132 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, Literal, TypeVar
 
+from fastapi import Request
+from sqlalchemy import URL, event, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 
 
 settings = get_settings()
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def sqlite_pragmas(settings: Settings) -> dict[str, Any]:
+    """PRAGMA values applied to every new SQLite connection, in order."""
+    return {
+        # journal_mode first: it is persistent and changes how the rest behave
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -settings.sqlite_cache_size_kib,
+        "mmap_size": settings.sqlite_mmap_size_bytes,
+        "temp_store": settings.sqlite_temp_store,
+        "foreign_keys": "ON" if settings.sqlite_foreign_keys else "OFF",
+    }
+
+
+def configure_sqlite_engine(
+    engine: AsyncEngine, settings: Settings, *, read_only: bool = False
+) -> None:
+    """Apply the configured pragmas whenever ``engine`` opens a connection."""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(settings)
+    if read_only:
+        # journal_mode is persistent and set by the writer; a read-only
+        # connection cannot change it
+        pragmas.pop("journal_mode")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ANN001
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def read_only_url(url: str | URL) -> URL | None:
+    """
+    URL opening the same SQLite file with ``mode=ro``, or None when the
+    database is not a file (in-memory SQLite or another dialect).
+    """
+    url = make_url(url)
+    database = url.database
+    if url.get_backend_name() != "sqlite" or not database or database == ":memory:":
+        return None
+    if database.startswith("file:"):
+        return None
+    return url.set(database=f"file:{database}", query={**url.query, "mode": "ro", "uri": "true"})
+
+
 database_url = settings.database_url
-engine: AsyncEngine = create_async_engine(database_url, echo=False, future=True)
+ro_url = read_only_url(database_url)
+
+# SQLite allows one writer at a time. Funnelling writes through a single
+# pooled connection queues them in the pool instead of failing with
+# "database is locked"; reads get their own read-only pool, which WAL lets
+# run alongside the writer.
+engine: AsyncEngine = create_async_engine(
+    database_url,
+    echo=False,
+    future=True,
+    **({"pool_size": 1, "max_overflow": 0} if ro_url is not None else {}),
+)
+configure_sqlite_engine(engine, settings)
 AsyncSessionLocal = async_sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
 )
 
+if ro_url is not None:
+    read_engine: AsyncEngine = create_async_engine(
+        ro_url,
+        echo=False,
+        future=True,
+        pool_size=settings.database_read_pool_size,
+        max_overflow=0,
+    )
+    configure_sqlite_engine(read_engine, settings, read_only=True)
+else:
+    read_engine = engine
+ReadSessionLocal = async_sessionmaker(
+    read_engine, expire_on_commit=False, class_=AsyncSession
+)
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+DatabaseAccess = Literal["read", "write"]
+
+
+def database_access(mode: DatabaseAccess) -> Callable[[F], F]:
+    """
+    Override method-based session routing for one endpoint.
+
+    ``@database_access("write")`` gives a GET endpoint that writes (for
+    example lazily creating rows) the writer session; ``"read"`` lets a
+    POST endpoint that only reads use the read pool.
+    """
+
+    def decorator(endpoint: F) -> F:
+        endpoint.__database_access__ = mode  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorator
+
+
+def session_factory_for(request: Request) -> async_sessionmaker[AsyncSession]:
+    endpoint = request.scope.get("endpoint")
+    mode = getattr(endpoint, "__database_access__", None)
+    if mode is None:
+        mode = "read" if request.method in _READ_METHODS else "write"
+    return ReadSessionLocal if mode == "read" else AsyncSessionLocal
+
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session on the read-only pool for reads, or the single writer connection."""
+    async with session_factory_for(request)() as session:
         yield session
@@ -0,0 +1,8 @@
+"""Column types that map onto the best native type of each supported backend."""
+from __future__ import annotations
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSON text on SQLite, binary JSONB (GIN-indexable) on PostgreSQL
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
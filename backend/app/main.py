@@ -11,6 +11,12 @@ from sqlmodel import SQLModel
 from app.api import api_router
 from app.core.config import get_settings
 from app.db.session import engine
+from app.services.enrichment_worker import start_enrichment_workers, stop_enrichment_workers
+from app.services.http_clients import close_http_clients, start_http_clients
+from app.services.notification_retention import (
+    start_notification_retention,
+    stop_notification_retention,
+)
 from app.models import (
     BookClub,
     BookClubBook,
@@ -46,7 +52,15 @@ async def lifespan(app: FastAPI):
     # Create database tables on startup
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-    yield
+    await start_http_clients()
+    await start_enrichment_workers()
+    await start_notification_retention()
+    try:
+        yield
+    finally:
+        await stop_notification_retention()
+        await stop_enrichment_workers()
+        await close_http_clients()
 
 
 def create_app() -> FastAPI:
@@ -1,6 +1,6 @@
 # Legacy Book model removed - now using BookV2
 from .book_v2 import BookV2, BookV2Base, BookV2Create, BookV2Read, BookV2Update
-from .enrichment import EnrichmentJob, EnrichmentStatus
+from .enrichment import EnrichmentJob, EnrichmentJobGroup, EnrichmentStatus
 from .library import Library, LibraryCreate, LibraryRead, LibraryUpdate, LibraryWithRole
 from .library_book import (
     LibraryBook,
@@ -23,6 +23,7 @@ from .library_member import (
     LibraryMemberWithUser,
     MemberRole,
 )
+from .metadata_cache import MetadataCacheEntry, MetadataCacheStatus
 from .notification import (
     Notification,
     NotificationCreate,
@@ -83,3 +84,6 @@ from .book_club import (
     BookClubRole,
     BookClubUpdate,
 )
+
+# Register the full-text search DDL hooks alongside the tables they mirror
+from app.db import search as _search  # noqa: E402,F401
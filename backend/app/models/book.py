@@ -4,28 +4,29 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import Column
-from sqlalchemy.dialects.sqlite import JSON
 from sqlmodel import Field, SQLModel
 
+from app.db.types import JSONDocument
+
 
 class BookBase(SQLModel):
     title: str = Field(index=True)
-    creator: list[str] | None = Field(default=None, sa_column=Column(JSON))
-    subject: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    creator: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
+    subject: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
     description: str | None = None
     publisher: str | None = None
-    contributor: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    contributor: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
     date: str | None = None
     type: str | None = None
     format: str | None = None
     identifier: str = Field(index=True)
     source: str | None = None
-    language: list[str] | None = Field(default=None, sa_column=Column(JSON))
-    relation: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    language: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
+    relation: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
     coverage: str | None = None
     rights: str | None = None
     auxiliary_fields: dict[str, Any] | None = Field(
-        default=None, sa_column=Column(JSON)
+        default=None, sa_column=Column(JSONDocument)
     )
 
     # Auxiliary operational fields
@@ -55,7 +56,7 @@ class BookBase(SQLModel):
     )
     metadata_candidate: dict[str, Any] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONDocument),
         description="Suggested metadata values awaiting review",
     )
     series: str | None = Field(
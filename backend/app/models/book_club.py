@@ -4,6 +4,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, UniqueConstraint
 
 
@@ -20,6 +21,8 @@ class BookClub(BookClubBase, table=True):
     owner_id: UUID = Field(foreign_key="users.id", nullable=False, index=True)
     current_book_id: UUID | None = Field(default=None, foreign_key="books_v2.id")
     pages_total_override: int | None = Field(default=None, ge=1)
+    # Active members (left_at IS NULL); maintained by the member endpoints
+    member_count: int = Field(default=0, nullable=False)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
 
@@ -120,6 +123,10 @@ class BookClubCommentBase(SQLModel):
 
 class BookClubComment(BookClubCommentBase, table=True):
     __tablename__ = "book_club_comments"
+    __table_args__ = (
+        # Comment threads are read per club in page order
+        Index("ix_book_club_comments_club_page_created", "club_id", "page_number", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, nullable=False)
     club_id: UUID = Field(foreign_key="book_clubs.id", nullable=False, index=True)
@@ -9,22 +9,23 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column
-from sqlalchemy.dialects.sqlite import JSON
+from sqlalchemy import Column, Index
 from sqlmodel import Field, SQLModel
 
+from app.db.types import JSONDocument
+
 
 class BookV2Base(SQLModel):
     """Intrinsic book metadata - data that's true for all copies of this book."""
 
     title: str = Field(index=True)
-    authors: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    authors: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
     isbn: str | None = Field(default=None, index=True)
     publisher: str | None = None
     description: str | None = None
     publish_date: str | None = None
-    subjects: list[str] | None = Field(default=None, sa_column=Column(JSON))
-    language: list[str] | None = Field(default=None, sa_column=Column(JSON))
+    subjects: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
+    language: list[str] | None = Field(default=None, sa_column=Column(JSONDocument))
     page_count: int | None = None
     cover_url: str | None = Field(
         default=None, description="External cover URL from metadata provider"
@@ -36,7 +37,7 @@ class BookV2Base(SQLModel):
     )
     metadata_candidate: dict[str, Any] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONDocument),
         description="Suggested metadata values awaiting review",
     )
 
@@ -45,6 +46,15 @@ class BookV2(BookV2Base, table=True):
     """Book table - stores intrinsic metadata shared across all copies."""
 
     __tablename__ = "books_v2"
+    __table_args__ = (
+        # JSONB containment lookups (authors @> '["..."]') on PostgreSQL only
+        Index("ix_books_v2_authors_gin", "authors", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        Index("ix_books_v2_subjects_gin", "subjects", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
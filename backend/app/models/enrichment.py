@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+from sqlmodel import Column, Field, SQLModel
+
+from app.db.types import JSONDocument
 
 
 class EnrichmentStatus:
@@ -14,11 +18,33 @@ class EnrichmentStatus:
     AWAITING_REVIEW = "awaiting_review"
 
 
+class EnrichmentJobGroup(SQLModel, table=True):
+    """A bulk enrichment request; progress is derived from its jobs."""
+
+    __tablename__ = "enrichment_job_groups"
+
+    id: int | None = Field(default=None, primary_key=True)
+    library_id: UUID = Field(foreign_key="libraries.id", index=True)
+    created_by: UUID = Field(foreign_key="users.id")
+    filters: dict[str, Any] = Field(default={}, sa_column=Column(JSONDocument))
+    total: int = Field(default=0)
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+
+
 class EnrichmentJob(SQLModel, table=True):
     __tablename__ = "enrichment_jobs"
+    __table_args__ = (
+        # Lets workers find due jobs without scanning the whole table
+        Index("ix_enrichment_jobs_status_scheduled_at", "status", "scheduled_at"),
+        # Outstanding-job check before queueing a book
+        Index("ix_enrichment_jobs_book_status", "book_id", "status"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     book_id: UUID = Field(foreign_key="books_v2.id", index=True)
+    group_id: int | None = Field(
+        default=None, foreign_key="enrichment_job_groups.id", index=True
+    )
     identifier: str
     provider: str = Field(default="openlibrary")
     status: str = Field(default=EnrichmentStatus.PENDING)
@@ -8,6 +8,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, UniqueConstraint
 
 
@@ -70,7 +71,13 @@ class LibraryBook(LibraryBookBase, table=True):
     """
 
     __tablename__ = "library_books"
-    __table_args__ = (UniqueConstraint("book_id", "library_id"),)
+    __table_args__ = (
+        UniqueConstraint("book_id", "library_id"),
+        # Keyset pagination over a library's books in creation order
+        Index("ix_library_books_library_created_id", "library_id", "created_at", "id"),
+        # Series endpoints: books of one series, and the distinct series names
+        Index("ix_library_books_library_series", "library_id", "series"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     book_id: UUID = Field(foreign_key="books_v2.id", index=True)
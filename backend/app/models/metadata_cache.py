@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlmodel import Column, Field, SQLModel
+
+from app.db.types import JSONDocument
+
+
+class MetadataCacheStatus:
+    FOUND = "found"
+    NOT_FOUND = "not_found"
+
+
+class MetadataCacheEntry(SQLModel, table=True):
+    """Normalized provider response for one identifier, shared by all libraries."""
+
+    __tablename__ = "metadata_cache"
+
+    provider: str = Field(primary_key=True)
+    identifier: str = Field(primary_key=True)
+    status: str = Field(default=MetadataCacheStatus.FOUND)
+    payload: dict[str, Any] | None = Field(default=None, sa_column=Column(JSONDocument))
+    fetched_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    expires_at: datetime = Field(nullable=False, index=True)
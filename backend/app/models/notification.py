@@ -5,7 +5,10 @@ from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlmodel import Column, Field, JSON, SQLModel
+from sqlalchemy import Index
+from sqlmodel import Column, Field, SQLModel
+
+from app.db.types import JSONDocument
 
 
 class NotificationType(str, Enum):
@@ -21,12 +24,18 @@ class NotificationBase(SQLModel):
     type: NotificationType
     title: str
     message: str
-    data: dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    data: dict[str, Any] = Field(default={}, sa_column=Column(JSONDocument))
     read: bool = Field(default=False)
 
 
 class Notification(NotificationBase, table=True):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # A user's (unread) notifications, newest first
+        Index("ix_notifications_user_read_created", "user_id", "read", "created_at"),
+        # Retention sweeps old read notifications across all users
+        Index("ix_notifications_read_created", "read", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
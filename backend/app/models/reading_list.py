@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Enum as SQLAlchemyEnum, Index
 from sqlmodel import Field, SQLModel, UniqueConstraint
 
 
@@ -73,6 +73,10 @@ class ReadingListItemBase(SQLModel):
 
 class ReadingListItem(ReadingListItemBase, table=True):
     __tablename__ = "reading_list_items"
+    __table_args__ = (
+        # Items are listed per list in display order
+        Index("ix_reading_list_items_list_order", "list_id", "order_index", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, nullable=False)
     list_id: UUID = Field(foreign_key="reading_lists.id", nullable=False, index=True)
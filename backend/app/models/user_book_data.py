@@ -8,9 +8,11 @@ from __future__ import annotations
 from datetime import date, datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column
 from sqlmodel import Field, SQLModel, UniqueConstraint
 
+from app.db.types import JSONDocument
+
 
 class UserBookDataBase(SQLModel):
     """Personal reading tracking data - unique to each user per book."""
@@ -34,7 +36,7 @@ class UserBookDataBase(SQLModel):
     )
     completion_history: list[str] | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(JSONDocument),
         description="Array of ISO date strings for all times user finished reading",
     )
 
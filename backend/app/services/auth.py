@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -14,8 +16,23 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = settings.jwt_algorithm
 ACCESS_TOKEN_EXPIRE_HOURS = settings.access_token_expire_hours
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. Pinning min/max rounds to the configured cost makes hashes
+# created under a different cost report ``needs_update`` so they are
+# re-hashed on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds,
+)
+
+# bcrypt is CPU-bound and takes hundreds of milliseconds at production cost;
+# async callers run it here so the event loop keeps serving other requests.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -28,6 +45,27 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def hash_password(password: str) -> str:
+    """Hash a password for storage without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password without blocking the event loop.
+
+    Returns ``(valid, new_hash)``; ``new_hash`` is set when the stored hash
+    was made with a different cost and should replace it.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
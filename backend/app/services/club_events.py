@@ -0,0 +1,73 @@
+"""
+Live book club activity for ``GET /book-clubs/{id}/events``.
+
+Endpoints publish a :class:`ClubEvent` after committing a change to a
+club's progress, comments, members or settings. Each stream wraps its
+subscription in a :class:`ClubViewer`, which applies the spoiler rule for
+that subscriber: comments beyond the viewer's current page are withheld,
+and the page moves forward as the viewer's own progress events arrive.
+"""
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.pubsub import Broker, Subscription
+
+settings = get_settings()
+
+PROGRESS = "progress"
+PROGRESS_RESET = "progress_reset"
+COMMENT = "comment"
+CLUB = "club"
+MEMBER_JOINED = "member_joined"
+MEMBER_UPDATED = "member_updated"
+MEMBER_LEFT = "member_left"
+
+
+class ClubEvent:
+    """A change to one club, with a JSON-ready payload for the stream."""
+
+    def __init__(
+        self,
+        type: str,
+        data: dict[str, Any],
+        *,
+        user_id: UUID | None = None,
+        page_number: int | None = None,
+    ) -> None:
+        self.type = type
+        self.data = data
+        self.user_id = user_id
+        self.page_number = page_number
+
+
+club_events: Broker[UUID, ClubEvent] = Broker(settings.event_queue_size)
+
+
+def publish_club_event(club_id: UUID, event: ClubEvent) -> int:
+    return club_events.publish(club_id, event)
+
+
+class ClubViewer:
+    """Per-subscriber spoiler filter over a club's event stream."""
+
+    def __init__(self, subscription: Subscription[UUID, ClubEvent], user_id: UUID, current_page: int) -> None:
+        self.subscription = subscription
+        self.user_id = user_id
+        self.current_page = current_page
+
+    def accept(self, event: ClubEvent) -> bool:
+        """Track the viewer's page and decide whether they may see ``event``."""
+        if event.type == PROGRESS_RESET:
+            self.current_page = 0
+        elif event.type == PROGRESS and event.user_id == self.user_id:
+            self.current_page = event.data["current_page"]
+        elif event.type == COMMENT:
+            return event.page_number is not None and event.page_number <= self.current_page
+        return True
+
+    def ends_stream(self, event: ClubEvent) -> bool:
+        """The viewer left or was removed, so their stream stops."""
+        return event.type == MEMBER_LEFT and event.user_id == self.user_id
@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import random
 from collections.abc import Iterable
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
+from uuid import UUID
+from weakref import WeakValueDictionary
 
 from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, func, insert, or_, update
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import BookV2, EnrichmentJob, EnrichmentStatus
-from app.services.metadata import fetch_metadata
+from app.core.config import get_settings
+from app.models import BookV2, EnrichmentJob, EnrichmentJobGroup, EnrichmentStatus, LibraryBook
+from app.services.library_counts import bump_book_libraries
+from app.services.metadata import lookup_metadata
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
 
 MetadataDict = dict[str, Any]
 CandidateEntry = dict[str, Any]
 
+# How many due jobs a worker looks at per claim attempt
+_CLAIM_BATCH = 5
+# Stay well under SQLite's bound-parameter limit for IN (...) lists
+_ID_CHUNK = 500
+
+_OUTSTANDING = (EnrichmentStatus.PENDING, EnrichmentStatus.IN_PROGRESS)
+
+
+_queue_locks: WeakValueDictionary[UUID, asyncio.Lock] = WeakValueDictionary()
+
+
+def _book_queue_lock(book_id: UUID) -> asyncio.Lock:
+    lock = _queue_locks.get(book_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _queue_locks[book_id] = lock
+    return lock
+
 
 async def queue_enrichment(
     book: BookV2,
@@ -28,21 +57,200 @@ async def queue_enrichment(
             detail="Cannot queue enrichment without an ISBN or identifier",
         )
 
-    statement = select(EnrichmentJob).where(
-        EnrichmentJob.book_id == book.id,
-        EnrichmentJob.status.in_(
-            [EnrichmentStatus.PENDING, EnrichmentStatus.IN_PROGRESS]
-        ),
+    # Serialize check-then-insert per book so concurrent requests share a job
+    async with _book_queue_lock(book.id):
+        statement = select(EnrichmentJob).where(
+            EnrichmentJob.book_id == book.id,
+            EnrichmentJob.status.in_(_OUTSTANDING),
+        )
+        existing_job = (await session.exec(statement)).first()
+        if existing_job:
+            return existing_job
+
+        job = EnrichmentJob(book_id=book.id, identifier=job_identifier)
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+
+async def queue_bulk_enrichment(
+    session: AsyncSession,
+    library_id: UUID,
+    user_id: UUID,
+    *,
+    metadata_statuses: list[str] | None = None,
+    library_book_ids: list[UUID] | None = None,
+) -> EnrichmentJobGroup:
+    """
+    Queue one job per matching book in a library under a new job group.
+
+    Books without an ISBN, or with a job already outstanding, are skipped.
+    All jobs are written with a single multi-row INSERT.
+    """
+    outstanding = exists().where(
+        EnrichmentJob.book_id == BookV2.id,
+        EnrichmentJob.status.in_(_OUTSTANDING),
+    )
+    base = (
+        select(BookV2.id, BookV2.isbn)
+        .join(LibraryBook, LibraryBook.book_id == BookV2.id)
+        .where(
+            LibraryBook.library_id == library_id,
+            BookV2.isbn.is_not(None),
+            BookV2.isbn != "",
+            ~outstanding,
+        )
+    )
+    if metadata_statuses:
+        base = base.where(BookV2.metadata_status.in_(metadata_statuses))
+
+    if library_book_ids:
+        rows = []
+        for start in range(0, len(library_book_ids), _ID_CHUNK):
+            chunk = library_book_ids[start : start + _ID_CHUNK]
+            rows.extend((await session.exec(base.where(LibraryBook.id.in_(chunk)))).all())
+    else:
+        rows = list((await session.exec(base)).all())
+
+    group = EnrichmentJobGroup(
+        library_id=library_id,
+        created_by=user_id,
+        filters={
+            "metadata_status": metadata_statuses,
+            "library_book_ids": [str(item) for item in library_book_ids] if library_book_ids else None,
+        },
+        total=len(rows),
     )
-    existing_job = (await session.exec(statement)).first()
-    if existing_job:
-        return existing_job
+    session.add(group)
+    await session.flush()
 
-    job = EnrichmentJob(book_id=book.id, identifier=job_identifier)
+    if rows:
+        now = datetime.utcnow()
+        await session.exec(  # type: ignore[call-overload]
+            insert(EnrichmentJob),
+            params=[
+                {
+                    "book_id": book_id,
+                    "group_id": group.id,
+                    "identifier": isbn,
+                    "provider": "openlibrary",
+                    "status": EnrichmentStatus.PENDING,
+                    "attempts": 0,
+                    "scheduled_at": now,
+                    "updated_at": now,
+                }
+                for book_id, isbn in rows
+            ],
+        )
+    await session.commit()
+    await session.refresh(group)
+    return group
+
+
+async def get_group_progress(session: AsyncSession, group: EnrichmentJobGroup) -> dict[str, int]:
+    """Count a group's jobs as done, failed or remaining in one grouped query."""
+    stmt = (
+        select(EnrichmentJob.status, func.count())
+        .where(EnrichmentJob.group_id == group.id)
+        .group_by(EnrichmentJob.status)
+    )
+    counts = dict((await session.exec(stmt)).all())
+    remaining = sum(counts.get(key, 0) for key in _OUTSTANDING)
+    failed = counts.get(EnrichmentStatus.FAILED, 0)
+    return {
+        "total": group.total,
+        "done": sum(counts.values()) - remaining - failed,
+        "failed": failed,
+        "remaining": remaining,
+    }
+
+
+async def claim_next_job(session: AsyncSession) -> EnrichmentJob | None:
+    """
+    Atomically take the next due job and mark it IN_PROGRESS.
+
+    Each claim is a compare-and-set UPDATE that only matches while the row
+    still has the status and updated_at we read, so concurrent workers (in
+    this process or another) never claim the same job. Jobs that stayed
+    IN_PROGRESS past the lease are treated as abandoned and claimed again.
+    """
+    now = datetime.utcnow()
+    lease_cutoff = now - timedelta(seconds=settings.enrichment_job_lease_seconds)
+    due_stmt = (
+        select(EnrichmentJob.id, EnrichmentJob.status, EnrichmentJob.updated_at)
+        .where(
+            or_(
+                and_(
+                    EnrichmentJob.status == EnrichmentStatus.PENDING,
+                    EnrichmentJob.scheduled_at <= now,
+                ),
+                and_(
+                    EnrichmentJob.status == EnrichmentStatus.IN_PROGRESS,
+                    EnrichmentJob.updated_at < lease_cutoff,
+                ),
+            )
+        )
+        .order_by(EnrichmentJob.scheduled_at, EnrichmentJob.id)
+        .limit(_CLAIM_BATCH)
+    )
+    candidates = (await session.exec(due_stmt)).all()
+
+    for job_id, job_status, updated_at in candidates:
+        claim = (
+            update(EnrichmentJob)
+            .where(
+                EnrichmentJob.id == job_id,
+                EnrichmentJob.status == job_status,
+                EnrichmentJob.updated_at == updated_at,
+            )
+            .values(
+                status=EnrichmentStatus.IN_PROGRESS,
+                attempts=EnrichmentJob.attempts + 1,
+                updated_at=now,
+            )
+        )
+        result = await session.exec(claim)  # type: ignore[call-overload]
+        await session.commit()
+        if result.rowcount == 1:
+            return await session.get(EnrichmentJob, job_id, populate_existing=True)
+    return None
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Seconds to wait before retry number ``attempts``.
+
+    Doubles from ``metadata_retry_interval_seconds`` per attempt, capped at
+    ``metadata_retry_max_delay_seconds``, then jittered into the upper half
+    of the window so jobs failed by the same outage do not retry in lockstep.
+    """
+    base = settings.metadata_retry_interval_seconds
+    delay = min(base * 2 ** max(attempts - 1, 0), settings.metadata_retry_max_delay_seconds)
+    return random.uniform(delay / 2, delay)
+
+
+def _schedule_retry_or_fail(job: EnrichmentJob, error: str) -> bool:
+    """Re-queue a job after a transient failure; returns False once attempts run out."""
+    now = datetime.utcnow()
+    job.last_error = error
+    job.updated_at = now
+    if job.attempts >= settings.metadata_retry_max_attempts:
+        job.status = EnrichmentStatus.FAILED
+        return False
+    job.status = EnrichmentStatus.PENDING
+    job.scheduled_at = now + timedelta(seconds=retry_delay(job.attempts))
+    return True
+
+
+async def fail_enrichment_job(session: AsyncSession, job_id: int, error: str) -> None:
+    """Record an unexpected processing error on a claimed job, retrying if allowed."""
+    job = await session.get(EnrichmentJob, job_id, populate_existing=True)
+    if job is None:
+        return
+    _schedule_retry_or_fail(job, error)
     session.add(job)
     await session.commit()
-    await session.refresh(job)
-    return job
 
 
 def _is_empty(value: Any) -> bool:
@@ -77,6 +285,7 @@ def _update_metadata_state(book: BookV2, candidate: dict[str, CandidateEntry]) -
 
 
 async def process_enrichment_job(job: EnrichmentJob, session: AsyncSession) -> BookV2:
+    """Fetch metadata for a job already claimed via :func:`claim_next_job`."""
     book = await session.get(BookV2, job.book_id)
     if not book:
         raise HTTPException(
@@ -84,26 +293,37 @@ async def process_enrichment_job(job: EnrichmentJob, session: AsyncSession) -> B
             detail="Book not found for enrichment",
         )
 
-    job.status = EnrichmentStatus.IN_PROGRESS
-    job.attempts += 1
-    job.updated_at = datetime.utcnow()
-    session.add(job)
+    # End the read transaction so the writer connection is free while the
+    # providers are queried
     await session.commit()
 
     print(f"[ENRICHMENT] Starting metadata fetch for identifier: {job.identifier}")
-    metadata = await fetch_metadata(job.identifier)
+    lookup = await lookup_metadata(job.identifier)
+    metadata = lookup.metadata
+    logger.info("Provider results for %s: %s", job.identifier, lookup.summary())
     print(f"[ENRICHMENT] Metadata result: {metadata}")
 
     if not metadata:
         print(f"[ENRICHMENT] No metadata found for identifier: {job.identifier}")
+        error = f"No metadata found ({lookup.summary()})"
+        if lookup.transient_failure() and _schedule_retry_or_fail(job, error):
+            logger.warning(
+                "Provider failure for %s, retrying at %s", job.identifier, job.scheduled_at
+            )
+            session.add(job)
+            await session.commit()
+            await session.refresh(book)
+            return book
+
         job.status = EnrichmentStatus.FAILED
-        job.last_error = "No metadata found"
+        job.last_error = error
         job.updated_at = datetime.utcnow()
         book.metadata_status = EnrichmentStatus.FAILED
         book.updated_at = datetime.utcnow()
         session.add(job)
         session.add(book)
         await session.commit()
+        await bump_book_libraries(session, book.id)
         await session.refresh(book)
         return book
 
@@ -111,6 +331,9 @@ async def process_enrichment_job(job: EnrichmentJob, session: AsyncSession) -> B
     candidate = _build_candidate(book, metadata)
     print(f"[ENRICHMENT] Candidate: {candidate}")
     book.updated_at = datetime.utcnow()
+    if book.metadata_status == EnrichmentStatus.FAILED:
+        # A successful retry clears the earlier failure
+        book.metadata_status = EnrichmentStatus.PENDING
     _update_metadata_state(book, candidate)
 
     job.status = EnrichmentStatus.COMPLETE
@@ -118,6 +341,7 @@ async def process_enrichment_job(job: EnrichmentJob, session: AsyncSession) -> B
     session.add(job)
     session.add(book)
     await session.commit()
+    await bump_book_libraries(session, book.id)
     await session.refresh(book)
     return book
 
@@ -153,6 +377,7 @@ async def apply_metadata_candidate(
     _update_metadata_state(book, remaining)
     session.add(book)
     await session.commit()
+    await bump_book_libraries(session, book.id)
     await session.refresh(book)
     return book
 
@@ -164,5 +389,6 @@ async def reject_metadata_candidate(book: BookV2, session: AsyncSession) -> Book
     book.updated_at = datetime.utcnow()
     session.add(book)
     await session.commit()
+    await bump_book_libraries(session, book.id)
     await session.refresh(book)
     return book
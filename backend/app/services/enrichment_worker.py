@@ -0,0 +1,92 @@
+"""
+In-process worker pool that drains the ``enrichment_jobs`` table.
+
+``enrichment_workers`` asyncio tasks are started in the FastAPI lifespan.
+Each claims one due job at a time through :func:`claim_next_job`, so the
+pool bounds how many provider lookups run at once. Idle workers sleep for
+``enrichment_poll_interval_seconds`` or until :func:`notify_enrichment_workers`
+is called after a job is queued.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.services.enrichment import (
+    claim_next_job,
+    fail_enrichment_job,
+    process_enrichment_job,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_tasks: list[asyncio.Task[None]] = []
+_wakeup: asyncio.Event | None = None
+
+
+async def run_next_job(
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+) -> int | None:
+    """Claim and process one due job; returns its id, or None when idle."""
+    async with session_factory() as session:
+        job = await claim_next_job(session)
+        if job is None:
+            return None
+        job_id = job.id
+        assert job_id is not None
+        try:
+            await process_enrichment_job(job, session)
+        except Exception as e:  # noqa: BLE001 - keep the worker alive
+            logger.exception("Enrichment job %s failed", job_id)
+            await session.rollback()
+            await fail_enrichment_job(session, job_id, str(e) or type(e).__name__)
+        return job_id
+
+
+async def _worker(index: int) -> None:
+    assert _wakeup is not None
+    while True:
+        try:
+            job_id = await run_next_job()
+        except Exception:  # noqa: BLE001 - e.g. database briefly unavailable
+            logger.exception("Enrichment worker %s could not claim a job", index)
+            job_id = None
+        if job_id is not None:
+            continue
+        try:
+            await asyncio.wait_for(_wakeup.wait(), settings.enrichment_poll_interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+
+
+def notify_enrichment_workers() -> None:
+    """Wake idle workers after queueing a job."""
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def start_enrichment_workers() -> None:
+    global _wakeup
+    if _tasks or settings.enrichment_workers <= 0:
+        return
+    _wakeup = asyncio.Event()
+    for index in range(settings.enrichment_workers):
+        _tasks.append(asyncio.create_task(_worker(index), name=f"enrichment-worker-{index}"))
+    logger.info("Started %s enrichment workers", settings.enrichment_workers)
+
+
+async def stop_enrichment_workers() -> None:
+    global _wakeup
+    tasks = list(_tasks)
+    _tasks.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _wakeup = None
@@ -0,0 +1,73 @@
+"""
+Application-scoped HTTP clients for the metadata providers.
+
+One pooled ``httpx.AsyncClient`` per provider is opened in the FastAPI
+lifespan and closed on shutdown, so lookups reuse DNS results and
+keep-alive TLS connections instead of handshaking on every call.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+OPENLIBRARY = "openlibrary"
+GOOGLE_BOOKS = "google_books"
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_enabled() -> bool:
+    # httpx only negotiates HTTP/2 when the optional h2 package is installed
+    return settings.metadata_http2 and importlib.util.find_spec("h2") is not None
+
+
+def _build_client(provider: str) -> httpx.AsyncClient:
+    timeouts = {
+        OPENLIBRARY: settings.openlibrary_timeout_seconds,
+        GOOGLE_BOOKS: settings.google_books_timeout_seconds,
+    }
+    if provider not in timeouts:
+        raise ValueError(f"Unknown metadata provider: {provider}")
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeouts[provider]),
+        limits=httpx.Limits(
+            max_connections=settings.metadata_http_max_connections,
+            max_keepalive_connections=settings.metadata_http_max_keepalive_connections,
+            keepalive_expiry=settings.metadata_http_keepalive_expiry_seconds,
+        ),
+        http2=_http2_enabled(),
+        follow_redirects=provider == OPENLIBRARY,
+    )
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Return the shared client for a provider, creating it on first use."""
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        client = _build_client(provider)
+        _clients[provider] = client
+    return client
+
+
+async def start_http_clients() -> None:
+    for provider in (OPENLIBRARY, GOOGLE_BOOKS):
+        get_http_client(provider)
+    logger.info(
+        "Metadata HTTP clients ready (http2=%s, max_connections=%s)",
+        _http2_enabled(),
+        settings.metadata_http_max_connections,
+    )
+
+
+async def close_http_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,66 @@
+"""
+Cached book totals for library listings.
+
+Every library carries an in-process version counter that write paths bump
+whenever a change could alter which books a listing filter matches. Counts
+are cached per (library, filter signature) together with the version they
+were computed at, so an exact lookup only hits while the library is
+unchanged and an estimate may reuse an older value until the TTL expires.
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.models import LibraryBook
+
+settings = get_settings()
+
+_library_versions: dict[UUID, int] = {}
+_counts: TTLCache[tuple[UUID, Hashable], tuple[int, int]] = TTLCache(
+    maxsize=settings.book_count_cache_size,
+    ttl=settings.book_count_cache_ttl_seconds,
+)
+
+
+def library_version(library_id: UUID) -> int:
+    return _library_versions.get(library_id, 0)
+
+
+def bump_library_version(*library_ids: UUID) -> None:
+    for library_id in library_ids:
+        _library_versions[library_id] = library_version(library_id) + 1
+
+
+async def bump_book_libraries(session: AsyncSession, book_id: UUID) -> None:
+    """Invalidate every library holding a copy of a shared book."""
+    stmt = select(LibraryBook.library_id).where(LibraryBook.book_id == book_id)
+    bump_library_version(*(await session.exec(stmt)).all())
+
+
+def get_cached_count(
+    library_id: UUID,
+    signature: Hashable,
+    *,
+    allow_stale: bool = False,
+) -> int | None:
+    entry = _counts.get((library_id, signature))
+    if entry is None:
+        return None
+    version, count = entry
+    if not allow_stale and version != library_version(library_id):
+        return None
+    return count
+
+
+def store_count(library_id: UUID, signature: Hashable, count: int) -> None:
+    _counts.set((library_id, signature), (library_version(library_id), count))
+
+
+def clear_counts() -> None:
+    _counts.clear()
@@ -0,0 +1,60 @@
+"""
+Cached library membership resolution.
+
+Every library-scoped request starts by checking the caller's membership, so
+(user, library) lookups are cached with a short TTL, including the absence
+of a membership. Write paths that add, remove or re-role members call
+:func:`invalidate_membership`; other worker processes may act on a stale
+role for at most ``membership_cache_ttl_seconds``.
+"""
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.models import LibraryMember
+
+settings = get_settings()
+
+_members: TTLCache[tuple[UUID, UUID], LibraryMember | None] = TTLCache(
+    maxsize=settings.membership_cache_size,
+    ttl=settings.membership_cache_ttl_seconds,
+)
+_MISSING = object()
+
+
+async def get_library_member(
+    session: AsyncSession,
+    library_id: UUID,
+    user_id: UUID,
+) -> LibraryMember | None:
+    """Return a detached snapshot of the user's membership, if any."""
+    key = (library_id, user_id)
+    cached = _members.get(key, _MISSING)  # type: ignore[arg-type]
+    if cached is not _MISSING:
+        return cached  # type: ignore[return-value]
+
+    stmt = select(LibraryMember).where(
+        LibraryMember.library_id == library_id,
+        LibraryMember.user_id == user_id,
+    )
+    member = (await session.exec(stmt)).one_or_none()
+    snapshot = LibraryMember(**member.model_dump()) if member else None
+    _members.set(key, snapshot)
+    return snapshot
+
+
+def invalidate_membership(library_id: UUID, user_id: UUID | None = None) -> None:
+    """Forget one user's membership, or every membership in a library."""
+    if user_id is not None:
+        _members.pop((library_id, user_id))
+    else:
+        _members.discard_where(lambda key: key[0] == library_id)
+
+
+def clear_memberships() -> None:
+    _members.clear()
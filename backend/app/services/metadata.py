@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
 
 from app.core.config import get_settings
+from app.core.singleflight import SingleFlight
+from app.services import metadata_cache
+from app.services.http_clients import GOOGLE_BOOKS, OPENLIBRARY, get_http_client
+from app.services.provider_limits import get_provider_guard
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -87,6 +96,73 @@ def _extract_google_series(volume: dict[str, Any]) -> str | None:
     return None
 
 
+class ProviderError(Exception):
+    """A provider lookup failed for a transient reason; the result is not cached."""
+
+    status = "error"
+
+
+class ProviderRateLimited(ProviderError):
+    status = "rate_limited"
+
+    def __init__(self, provider: str, retry_after: float) -> None:
+        super().__init__(f"{provider} is rate limited for another {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class ProviderCircuitOpen(ProviderError):
+    status = "circuit_open"
+
+    def __init__(self, provider: str) -> None:
+        super().__init__(f"{provider} is failing; requests are paused")
+
+
+def _parse_retry_after(value: str | None) -> float:
+    if not value:
+        return settings.metadata_rate_limit_pause_seconds
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return settings.metadata_rate_limit_pause_seconds
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+async def _provider_get(provider: str, url: str, **kwargs: Any) -> httpx.Response:
+    """GET through the provider's shared client, rate limiter and circuit breaker."""
+    guard = get_provider_guard(provider)
+    paused_for = guard.bucket.paused_for()
+    if paused_for:
+        raise ProviderRateLimited(provider, paused_for)
+    if not guard.breaker.allow():
+        raise ProviderCircuitOpen(provider)
+
+    try:
+        await guard.bucket.acquire()
+        response = await get_http_client(provider).get(url, **kwargs)
+    except httpx.HTTPError:
+        guard.breaker.record_failure()
+        raise
+    except BaseException:
+        guard.breaker.release_probe()
+        raise
+
+    if response.status_code == 429:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        logger.warning(f"{provider} rate limited us; pausing for {retry_after:.0f}s")
+        guard.bucket.pause(retry_after)
+        guard.breaker.record_failure(retry_after)
+        raise ProviderRateLimited(provider, retry_after)
+    if response.status_code >= 500:
+        guard.breaker.record_failure()
+    else:
+        guard.breaker.record_success()
+    return response
+
+
 def _merge_metadata(*records: dict[str, Any]) -> dict[str, Any]:
     merged: dict[str, Any] = {}
     for record in records:
@@ -104,136 +180,280 @@ def _merge_metadata(*records: dict[str, Any]) -> dict[str, Any]:
 async def fetch_openlibrary(identifier: str) -> dict[str, Any] | None:
     url = f"{settings.openlibrary_base_url}/isbn/{identifier}.json"
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            response = await client.get(url)
-            if response.status_code != 200:
-                logger.warning(f"OpenLibrary returned status {response.status_code} for ISBN {identifier}")
-                return None
-            payload = response.json()
-            work_data: dict[str, Any] | None = None
-            work_key = None
-            works = payload.get("works")
-            if isinstance(works, list) and works:
-                first_work = works[0]
-                if isinstance(first_work, dict):
-                    work_key = first_work.get("key")
-
-            if work_key:
-                work_url = f"{settings.openlibrary_base_url}{work_key}.json"
-                work_response = await client.get(work_url)
-                if work_response.status_code == 200:
-                    work_data = work_response.json()
-
-            # OpenLibrary provides cover images via their Cover API
-            cover_url = f"https://covers.openlibrary.org/b/isbn/{identifier}-L.jpg"
-
-            description = _normalize_description(payload.get("description"))
-            if not description and work_data:
-                description = _normalize_description(work_data.get("description"))
-
-            series = _extract_series(payload.get("series"))
-            if not series and work_data:
-                series = _extract_series(work_data.get("series"))
-            if not series and work_data:
-                series = _extract_series_from_subjects(work_data.get("subjects"))
-
-            metadata: dict[str, Any] = {
-                "title": payload.get("title"),
-                "authors": _normalize_list(payload.get("authors")),
-                "publisher": payload.get("publishers", [None])[0] if payload.get("publishers") else None,
-                "publish_date": payload.get("publish_date"),
-                "isbn": identifier,
-                "language": _normalize_list(payload.get("languages")),
-                "description": description,
-                "series": series,
-                "cover_url": cover_url,
-            }
-            if cover_url:
-                logger.info("OpenLibrary cover URL for ISBN %s: %s", identifier, cover_url)
-            else:
-                logger.info("OpenLibrary cover URL missing for ISBN %s", identifier)
-            logger.info(f"Successfully fetched metadata from OpenLibrary for ISBN {identifier}")
-            return metadata
-    except httpx.TimeoutException:
+        response = await _provider_get(OPENLIBRARY, url)
+        if response.status_code == 404:
+            logger.info(f"OpenLibrary has no record for ISBN {identifier}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"OpenLibrary returned status {response.status_code} for ISBN {identifier}")
+            raise ProviderError(f"OpenLibrary returned status {response.status_code}")
+        payload = response.json()
+        work_data: dict[str, Any] | None = None
+        work_key = None
+        works = payload.get("works")
+        if isinstance(works, list) and works:
+            first_work = works[0]
+            if isinstance(first_work, dict):
+                work_key = first_work.get("key")
+
+        if work_key:
+            work_url = f"{settings.openlibrary_base_url}{work_key}.json"
+            work_response = await _provider_get(OPENLIBRARY, work_url)
+            if work_response.status_code == 200:
+                work_data = work_response.json()
+
+        # OpenLibrary provides cover images via their Cover API
+        cover_url = f"https://covers.openlibrary.org/b/isbn/{identifier}-L.jpg"
+
+        description = _normalize_description(payload.get("description"))
+        if not description and work_data:
+            description = _normalize_description(work_data.get("description"))
+
+        series = _extract_series(payload.get("series"))
+        if not series and work_data:
+            series = _extract_series(work_data.get("series"))
+        if not series and work_data:
+            series = _extract_series_from_subjects(work_data.get("subjects"))
+
+        metadata: dict[str, Any] = {
+            "title": payload.get("title"),
+            "authors": _normalize_list(payload.get("authors")),
+            "publisher": payload.get("publishers", [None])[0] if payload.get("publishers") else None,
+            "publish_date": payload.get("publish_date"),
+            "isbn": identifier,
+            "language": _normalize_list(payload.get("languages")),
+            "description": description,
+            "series": series,
+            "cover_url": cover_url,
+        }
+        if cover_url:
+            logger.info("OpenLibrary cover URL for ISBN %s: %s", identifier, cover_url)
+        else:
+            logger.info("OpenLibrary cover URL missing for ISBN %s", identifier)
+        logger.info(f"Successfully fetched metadata from OpenLibrary for ISBN {identifier}")
+        return metadata
+    except ProviderError:
+        raise
+    except httpx.TimeoutException as e:
         logger.error(f"OpenLibrary request timed out for ISBN {identifier}")
-        return None
+        raise ProviderError("OpenLibrary request timed out") from e
     except httpx.HTTPError as e:
         logger.error(f"OpenLibrary HTTP error for ISBN {identifier}: {e}")
-        return None
+        raise ProviderError(f"OpenLibrary HTTP error: {e}") from e
     except Exception as e:
         logger.error(f"Unexpected error fetching from OpenLibrary for ISBN {identifier}: {e}")
-        return None
+        raise ProviderError(f"Unexpected OpenLibrary error: {e}") from e
 
 
 async def fetch_google_books(identifier: str) -> dict[str, Any] | None:
     params = {"q": f"isbn:{identifier}", "projection": "full"}
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(settings.google_books_base_url, params=params)
-            if response.status_code != 200:
-                logger.warning(f"Google Books returned status {response.status_code} for ISBN {identifier}")
-                return None
-            data = response.json()
-            items = data.get("items")
-            if not items:
-                logger.info(f"Google Books returned no results for ISBN {identifier}")
-                return None
-            item = items[0]
-            volume = item.get("volumeInfo", {}) if isinstance(item, dict) else {}
-
-            self_link = item.get("selfLink") if isinstance(item, dict) else None
-            if isinstance(self_link, str) and self_link:
-                full_response = await client.get(self_link, params={"projection": "full"})
-                if full_response.status_code == 200:
-                    full_item = full_response.json()
-                    if isinstance(full_item, dict) and "volumeInfo" in full_item:
-                        volume = full_item.get("volumeInfo", volume)
-
-            description = volume.get("description")
-            if not description and isinstance(item, dict):
-                search_info = item.get("searchInfo")
-                if isinstance(search_info, dict):
-                    description = search_info.get("textSnippet")
-
-            metadata: dict[str, Any] = {
-                "title": volume.get("title"),
-                "authors": _normalize_list(volume.get("authors")),
-                "subjects": _normalize_list(volume.get("categories")),
-                "description": _normalize_description(description),
-                "publisher": volume.get("publisher"),
-                "publish_date": volume.get("publishedDate"),
-                "isbn": identifier,
-                "language": _normalize_list(volume.get("language")),
-                "cover_url": volume.get("imageLinks", {}).get("thumbnail"),
-                "series": _extract_google_series(volume),
-            }
-            if metadata.get("cover_url"):
-                logger.info("Google Books cover URL for ISBN %s: %s", identifier, metadata.get("cover_url"))
-            else:
-                logger.info("Google Books cover URL missing for ISBN %s", identifier)
-            logger.info(f"Successfully fetched metadata from Google Books for ISBN {identifier}")
-            return metadata
-    except httpx.TimeoutException:
+        response = await _provider_get(GOOGLE_BOOKS, settings.google_books_base_url, params=params)
+        if response.status_code == 404:
+            logger.info(f"Google Books has no record for ISBN {identifier}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"Google Books returned status {response.status_code} for ISBN {identifier}")
+            raise ProviderError(f"Google Books returned status {response.status_code}")
+        data = response.json()
+        items = data.get("items")
+        if not items:
+            logger.info(f"Google Books returned no results for ISBN {identifier}")
+            return None
+        item = items[0]
+        volume = item.get("volumeInfo", {}) if isinstance(item, dict) else {}
+
+        self_link = item.get("selfLink") if isinstance(item, dict) else None
+        if isinstance(self_link, str) and self_link:
+            full_response = await _provider_get(GOOGLE_BOOKS, self_link, params={"projection": "full"})
+            if full_response.status_code == 200:
+                full_item = full_response.json()
+                if isinstance(full_item, dict) and "volumeInfo" in full_item:
+                    volume = full_item.get("volumeInfo", volume)
+
+        description = volume.get("description")
+        if not description and isinstance(item, dict):
+            search_info = item.get("searchInfo")
+            if isinstance(search_info, dict):
+                description = search_info.get("textSnippet")
+
+        metadata: dict[str, Any] = {
+            "title": volume.get("title"),
+            "authors": _normalize_list(volume.get("authors")),
+            "subjects": _normalize_list(volume.get("categories")),
+            "description": _normalize_description(description),
+            "publisher": volume.get("publisher"),
+            "publish_date": volume.get("publishedDate"),
+            "isbn": identifier,
+            "language": _normalize_list(volume.get("language")),
+            "cover_url": volume.get("imageLinks", {}).get("thumbnail"),
+            "series": _extract_google_series(volume),
+        }
+        if metadata.get("cover_url"):
+            logger.info("Google Books cover URL for ISBN %s: %s", identifier, metadata.get("cover_url"))
+        else:
+            logger.info("Google Books cover URL missing for ISBN %s", identifier)
+        logger.info(f"Successfully fetched metadata from Google Books for ISBN {identifier}")
+        return metadata
+    except ProviderError:
+        raise
+    except httpx.TimeoutException as e:
         logger.error(f"Google Books request timed out for ISBN {identifier}")
-        return None
+        raise ProviderError("Google Books request timed out") from e
     except httpx.HTTPError as e:
         logger.error(f"Google Books HTTP error for ISBN {identifier}: {e}")
-        return None
+        raise ProviderError(f"Google Books HTTP error: {e}") from e
     except Exception as e:
         logger.error(f"Unexpected error fetching from Google Books for ISBN {identifier}: {e}")
-        return None
+        raise ProviderError(f"Unexpected Google Books error: {e}") from e
+
+
+TRANSIENT_STATUSES = ("error", "timeout", "rate_limited", "circuit_open")
+
+
+class ProviderResult:
+    """Outcome of one provider lookup within a :func:`lookup_metadata` call."""
+
+    def __init__(
+        self,
+        provider: str,
+        status: str,
+        latency_ms: float,
+        metadata: dict[str, Any] | None = None,
+        *,
+        cached: bool = False,
+    ) -> None:
+        self.provider = provider
+        self.status = status
+        self.latency_ms = latency_ms
+        self.metadata = metadata
+        self.cached = cached
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "latency_ms": round(self.latency_ms, 1),
+            "cached": self.cached,
+        }
+
+
+class MetadataLookup:
+    """Merged metadata for an identifier plus the per-provider report."""
+
+    def __init__(self, metadata: dict[str, Any] | None, providers: list[ProviderResult]) -> None:
+        self.metadata = metadata
+        self.providers = providers
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        return {result.provider: result.as_dict() for result in self.providers}
+
+    def transient_failure(self) -> bool:
+        """True when a provider failed or was held back rather than reporting a miss."""
+        return any(result.status in TRANSIENT_STATUSES for result in self.providers)
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{result.provider}: {result.status} "
+            f"({'cached' if result.cached else f'{result.latency_ms:.0f} ms'})"
+            for result in self.providers
+        )
+
+
+PROVIDER_FETCHERS: dict[str, Callable[[str], Awaitable[dict[str, Any] | None]]] = {
+    OPENLIBRARY: fetch_openlibrary,
+    GOOGLE_BOOKS: fetch_google_books,
+}
+
+
+_provider_slots: dict[str, asyncio.Semaphore] = {}
+
+
+def _provider_slot(provider: str) -> asyncio.Semaphore:
+    """Cap in-flight requests per provider, however many workers are running."""
+    slot = _provider_slots.get(provider)
+    if slot is None:
+        slot = asyncio.Semaphore(settings.metadata_provider_concurrency)
+        _provider_slots[provider] = slot
+    return slot
+
+
+async def _timed_fetch(provider: str, identifier: str) -> ProviderResult:
+    started = time.perf_counter()
+    cached = await metadata_cache.get_cached_response(provider, identifier)
+    if cached is not None:
+        elapsed = (time.perf_counter() - started) * 1000
+        status = "ok" if cached.payload else "not_found"
+        return ProviderResult(provider, status, elapsed, cached.payload, cached=True)
+
+    try:
+        async with _provider_slot(provider):
+            metadata = await PROVIDER_FETCHERS[provider](identifier)
+    except Exception as e:  # noqa: BLE001 - one provider must not sink the other
+        if not isinstance(e, ProviderError):
+            logger.error(f"Unexpected error from {provider} for ISBN {identifier}: {e}")
+        status = e.status if isinstance(e, ProviderError) else "error"
+        return ProviderResult(provider, status, (time.perf_counter() - started) * 1000)
+    elapsed = (time.perf_counter() - started) * 1000
+    await metadata_cache.store_response(provider, identifier, metadata)
+    return ProviderResult(provider, "ok" if metadata else "not_found", elapsed, metadata)
+
+
+_inflight_lookups: SingleFlight[str, MetadataLookup] = SingleFlight()
+
+
+async def lookup_metadata(identifier: str, *, deadline: float | None = None) -> MetadataLookup:
+    """
+    Query every provider concurrently and merge whatever arrives in time.
+
+    Providers still running when ``deadline`` seconds have passed are
+    cancelled and reported as ``timeout``; results from the others are
+    merged in provider order so precedence does not depend on timing.
+
+    Concurrent lookups of the same identifier (previews, seeding and
+    enrichment alike) share one in-flight fetch and its result.
+    """
+    if deadline is None:
+        deadline = settings.metadata_fetch_deadline_seconds
+    key = metadata_cache.normalize_identifier(identifier)
+    return await _inflight_lookups.do(key, lambda: _lookup_metadata(identifier, deadline))
+
+
+async def _lookup_metadata(identifier: str, deadline: float) -> MetadataLookup:
+    started = time.perf_counter()
+    tasks = {
+        provider: asyncio.create_task(_timed_fetch(provider, identifier))
+        for provider in PROVIDER_FETCHERS
+    }
+    _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: list[ProviderResult] = []
+    for provider, task in tasks.items():
+        if task in pending:
+            elapsed = (time.perf_counter() - started) * 1000
+            logger.warning(f"{provider} missed the {deadline}s deadline for ISBN {identifier}")
+            results.append(ProviderResult(provider, "timeout", elapsed))
+        else:
+            results.append(task.result())
+
+    records = [result.metadata for result in results if result.metadata]
+    merged = _merge_metadata(*records) if records else None
+    return MetadataLookup(merged, results)
 
 
 async def fetch_metadata(identifier: str) -> dict[str, Any] | None:
     logger.info(f"Fetching metadata for ISBN {identifier}")
-    openlibrary_data = await fetch_openlibrary(identifier)
-    google_data = await fetch_google_books(identifier)
+    lookup = await lookup_metadata(identifier)
+    merged = lookup.metadata
+    logger.info(f"Provider results for ISBN {identifier}: {lookup.summary()}")
 
-    if not openlibrary_data and not google_data:
+    if not merged:
         logger.warning(f"No metadata found from any source for ISBN {identifier}")
         return None
 
-    merged = _merge_metadata(*(record for record in [openlibrary_data, google_data] if record))
     if merged.get("cover_url"):
         logger.info("Merged cover URL for ISBN %s: %s", identifier, merged.get("cover_url"))
     else:
@@ -274,34 +494,33 @@ async def search_books(query: str, search_type: str = "auto", max_results: int =
             search_query = f"intitle:{query}"
 
         params: dict[str, str | int] = {"q": search_query, "maxResults": max_results}
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(settings.google_books_base_url, params=params)  # type: ignore[arg-type]
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("items", [])
-                for item in items:
-                    volume = item.get("volumeInfo", {})
-                    # Get ISBN if available
-                    isbn = None
-                    for identifier in volume.get("industryIdentifiers", []):
-                        if identifier.get("type") in ["ISBN_13", "ISBN_10"]:
-                            isbn = identifier.get("identifier")
-                            break
-
-                    result = {
-                        "title": volume.get("title"),
-                        "creator": _normalize_list(volume.get("authors")),
-                        "subject": _normalize_list(volume.get("categories")),
-                        "description": volume.get("description"),
-                        "publisher": volume.get("publisher"),
-                        "date": volume.get("publishedDate"),
-                        "identifier": isbn or f"google:{item.get('id')}",
-                        "language": _normalize_list(volume.get("language")),
-                        "cover_image_url": volume.get("imageLinks", {}).get("thumbnail"),
-                        "source": "Google Books"
-                    }
-                    results.append(result)
-                logger.info(f"Found {len(results)} results from Google Books")
+        response = await _provider_get(GOOGLE_BOOKS, settings.google_books_base_url, params=params)
+        if response.status_code == 200:
+            data = response.json()
+            items = data.get("items", [])
+            for item in items:
+                volume = item.get("volumeInfo", {})
+                # Get ISBN if available
+                isbn = None
+                for identifier in volume.get("industryIdentifiers", []):
+                    if identifier.get("type") in ["ISBN_13", "ISBN_10"]:
+                        isbn = identifier.get("identifier")
+                        break
+
+                result = {
+                    "title": volume.get("title"),
+                    "creator": _normalize_list(volume.get("authors")),
+                    "subject": _normalize_list(volume.get("categories")),
+                    "description": volume.get("description"),
+                    "publisher": volume.get("publisher"),
+                    "date": volume.get("publishedDate"),
+                    "identifier": isbn or f"google:{item.get('id')}",
+                    "language": _normalize_list(volume.get("language")),
+                    "cover_image_url": volume.get("imageLinks", {}).get("thumbnail"),
+                    "source": "Google Books"
+                }
+                results.append(result)
+            logger.info(f"Found {len(results)} results from Google Books")
     except Exception as e:
         logger.error(f"Error searching Google Books: {e}")
 
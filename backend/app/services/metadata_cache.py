@@ -0,0 +1,147 @@
+"""
+Persistent cache of normalized metadata provider responses.
+
+Entries are keyed by (provider, identifier) and shared by every library,
+since ``BookV2`` records are shared. Hits are kept for
+``metadata_cache_ttl_seconds``; misses (404s, empty result sets) for the
+shorter ``metadata_cache_negative_ttl_seconds``. Transient failures are
+never cached.
+
+The cache uses its own short-lived sessions so reads and writes do not
+join the caller's transaction, and any database error is logged and
+treated as a miss: the cache must never make a lookup fail. Lookups use
+the read pool so cache hits never queue behind the single writer
+connection; only stores take the writer.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal, ReadSessionLocal
+from app.models import MetadataCacheEntry, MetadataCacheStatus
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+_read_session_factory: Callable[[], AsyncSession] = ReadSessionLocal
+
+
+def configure_session_factory(
+    factory: Callable[[], AsyncSession],
+    read_factory: Callable[[], AsyncSession] | None = None,
+) -> None:
+    """Point the cache at another database (used by the test suite)."""
+    global _session_factory, _read_session_factory
+    _session_factory = factory
+    _read_session_factory = read_factory or factory
+
+
+def normalize_identifier(identifier: str) -> str:
+    return re.sub(r"[\s-]", "", identifier).upper()
+
+
+async def get_cached_response(provider: str, identifier: str) -> MetadataCacheEntry | None:
+    """Return the live cache entry for a provider lookup, if any."""
+    try:
+        async with _read_session_factory() as session:
+            entry = await session.get(
+                MetadataCacheEntry, (provider, normalize_identifier(identifier))
+            )
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Metadata cache read failed for {provider}/{identifier}: {e}")
+        return None
+    if entry is None or entry.expires_at <= datetime.utcnow():
+        return None
+    return entry
+
+
+async def store_response(provider: str, identifier: str, payload: dict[str, Any] | None) -> None:
+    """Cache a provider result; ``None`` records a negative entry."""
+    now = datetime.utcnow()
+    if payload:
+        status = MetadataCacheStatus.FOUND
+        ttl = settings.metadata_cache_ttl_seconds
+    else:
+        status = MetadataCacheStatus.NOT_FOUND
+        ttl = settings.metadata_cache_negative_ttl_seconds
+    if ttl <= 0:
+        return
+
+    key = (provider, normalize_identifier(identifier))
+    try:
+        async with _session_factory() as session:
+            entry = await session.get(MetadataCacheEntry, key)
+            if entry is None:
+                entry = MetadataCacheEntry(
+                    provider=key[0],
+                    identifier=key[1],
+                    expires_at=now,
+                )
+            entry.status = status
+            entry.payload = payload or None
+            entry.fetched_at = now
+            entry.expires_at = now + timedelta(seconds=ttl)
+            session.add(entry)
+            await session.commit()
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Metadata cache write failed for {provider}/{identifier}: {e}")
+
+
+def _filters(
+    provider: str | None,
+    identifier: str | None,
+    expired_only: bool = False,
+) -> list[Any]:
+    filters: list[Any] = []
+    if provider:
+        filters.append(MetadataCacheEntry.provider == provider)
+    if identifier:
+        filters.append(MetadataCacheEntry.identifier == normalize_identifier(identifier))
+    if expired_only:
+        filters.append(MetadataCacheEntry.expires_at <= datetime.utcnow())
+    return filters
+
+
+async def list_entries(
+    session: AsyncSession,
+    *,
+    provider: str | None = None,
+    identifier: str | None = None,
+    skip: int = 0,
+    limit: int = 50,
+) -> tuple[list[MetadataCacheEntry], int]:
+    filters = _filters(provider, identifier)
+    total_stmt = select(func.count()).select_from(MetadataCacheEntry).where(*filters)
+    total = (await session.exec(total_stmt)).one()
+    stmt = (
+        select(MetadataCacheEntry)
+        .where(*filters)
+        .order_by(MetadataCacheEntry.fetched_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    entries = list((await session.exec(stmt)).all())
+    return entries, total
+
+
+async def purge_entries(
+    session: AsyncSession,
+    *,
+    provider: str | None = None,
+    identifier: str | None = None,
+    expired_only: bool = False,
+) -> int:
+    stmt = delete(MetadataCacheEntry).where(*_filters(provider, identifier, expired_only))
+    result = await session.exec(stmt)  # type: ignore[call-overload]
+    await session.commit()
+    return result.rowcount or 0
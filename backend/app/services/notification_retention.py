@@ -0,0 +1,101 @@
+"""
+Periodic pruning of old read notifications.
+
+Read notifications older than ``notification_retention_days`` are deleted
+in batches of ``notification_retention_batch_size``. Each batch commits on
+its own so the job never holds the write lock for long. Unread
+notifications are always kept. The task is started in the FastAPI lifespan
+and runs every ``notification_retention_interval_seconds``; a retention of
+0 days disables it.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal
+from app.models import Notification
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_task: asyncio.Task[None] | None = None
+
+
+async def prune_read_notifications(
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    *,
+    older_than: timedelta | None = None,
+    batch_size: int | None = None,
+) -> dict[str, float]:
+    """Delete read notifications older than the cutoff; returns run stats."""
+    if older_than is None:
+        older_than = timedelta(days=settings.notification_retention_days)
+    batch_size = batch_size or settings.notification_retention_batch_size
+    cutoff = datetime.utcnow() - older_than
+
+    started = time.perf_counter()
+    deleted = 0
+    batches = 0
+    while True:
+        async with session_factory() as session:
+            batch = (
+                select(Notification.id)
+                .where(Notification.read == True, Notification.created_at < cutoff)  # noqa: E712
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await session.exec(delete(Notification).where(Notification.id.in_(batch)))
+            await session.commit()
+        batches += 1
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+        # Let queued writers in between batches
+        await asyncio.sleep(0)
+
+    stats = {
+        "deleted": deleted,
+        "batches": batches,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info(
+        "Pruned %s read notifications older than %s in %s batches (%.1f ms)",
+        deleted,
+        cutoff.isoformat(timespec="seconds"),
+        batches,
+        stats["elapsed_ms"],
+    )
+    return stats
+
+
+async def _run() -> None:
+    while True:
+        try:
+            await prune_read_notifications()
+        except Exception:  # noqa: BLE001 - e.g. database briefly unavailable
+            logger.exception("Notification retention run failed")
+        await asyncio.sleep(settings.notification_retention_interval_seconds)
+
+
+async def start_notification_retention() -> None:
+    global _task
+    if _task is not None or settings.notification_retention_days <= 0:
+        return
+    _task = asyncio.create_task(_run(), name="notification-retention")
+
+
+async def stop_notification_retention() -> None:
+    global _task
+    task, _task = _task, None
+    if task is None:
+        return
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
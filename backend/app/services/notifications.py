@@ -0,0 +1,47 @@
+"""
+Per-user notification channel for ``GET /notifications/events``.
+
+Code that inserts a :class:`Notification` calls :func:`publish_notification`
+after committing; endpoints that change read state call
+:func:`publish_unread_count` so every open tab shows the same counter.
+"""
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import get_settings
+from app.core.pubsub import Broker
+from app.models import Notification, NotificationRead
+
+settings = get_settings()
+
+NOTIFICATION = "notification"
+UNREAD_COUNT = "unread_count"
+
+# Messages are (event name, JSON-ready payload)
+notification_events: Broker[UUID, tuple[str, dict[str, Any]]] = Broker(settings.event_queue_size)
+
+
+async def count_unread(session: AsyncSession, user_id: UUID) -> int:
+    stmt = select(func.count()).select_from(Notification).where(
+        Notification.user_id == user_id,
+        Notification.read == False,  # noqa: E712
+    )
+    return (await session.exec(stmt)).scalar_one()
+
+
+def publish_notification(notification: Notification) -> None:
+    payload = NotificationRead.model_validate(notification).model_dump(mode="json")
+    notification_events.publish(notification.user_id, (NOTIFICATION, payload))
+
+
+async def publish_unread_count(session: AsyncSession, user_id: UUID) -> None:
+    """Push a fresh unread count, skipping the query when nobody listens."""
+    if not notification_events.subscriber_count(user_id):
+        return
+    count = await count_unread(session, user_id)
+    notification_events.publish(user_id, (UNREAD_COUNT, {"count": count}))
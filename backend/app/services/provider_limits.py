@@ -0,0 +1,183 @@
+"""
+Per-provider rate limiting and circuit breaking for metadata lookups.
+
+Every request to a provider goes through that provider's
+:class:`ProviderGuard`, shared across the whole process: a token bucket
+paces requests (and pauses entirely while a ``Retry-After`` is in force),
+and a circuit breaker stops calling a provider that keeps failing until a
+cool-down has passed, then lets a single probe request through.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._timer = timer
+        self._tokens = float(capacity)
+        self._updated = timer()
+        self._paused_until = 0.0
+
+    def _refill(self) -> None:
+        now = self._timer()
+        # Nothing accrues during a pause; refilling starts when it ends
+        since = max(self._updated, self._paused_until)
+        if now > since:
+            self._tokens = min(self.capacity, self._tokens + (now - since) * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. from Retry-After)."""
+        self._paused_until = max(self._paused_until, self._timer() + seconds)
+        self._tokens = 0.0
+
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - self._timer())
+
+    async def acquire(self) -> None:
+        while True:
+            paused = self.paused_for()
+            if paused > 0:
+                # Callers already waiting here also honour a new Retry-After
+                await asyncio.sleep(paused)
+                continue
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def state(self) -> dict[str, Any]:
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 2),
+            "paused_for_seconds": round(self.paused_for(), 1),
+        }
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown: float,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._timer = timer
+        self._state = self.CLOSED
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    @property
+    def status(self) -> str:
+        if self._state == self.OPEN and self._timer() >= self._open_until:
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may go out now; in half-open only one probe may."""
+        if self.status == self.OPEN:
+            return False
+        if self.status == self.HALF_OPEN:
+            if self._probing:
+                return False
+            self._state = self.HALF_OPEN
+            self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Let another probe through if this one ended without an outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self, cooldown: float | None = None) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self.trip(cooldown)
+
+    def trip(self, cooldown: float | None = None) -> None:
+        self._state = self.OPEN
+        self._probing = False
+        self._open_until = self._timer() + max(cooldown or 0.0, self.cooldown)
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "state": self.status,
+            "consecutive_failures": self._failures,
+            "open_for_seconds": round(max(0.0, self._open_until - self._timer()), 1)
+            if self.status == self.OPEN
+            else 0.0,
+        }
+
+
+class ProviderGuard:
+    def __init__(self, provider: str, bucket: TokenBucket, breaker: CircuitBreaker) -> None:
+        self.provider = provider
+        self.bucket = bucket
+        self.breaker = breaker
+
+    def state(self) -> dict[str, Any]:
+        return {"provider": self.provider, **self.bucket.state(), **self.breaker.state()}
+
+
+_guards: dict[str, ProviderGuard] = {}
+
+
+def _rate_for(provider: str) -> float:
+    rates = {
+        "openlibrary": settings.openlibrary_rate_per_second,
+        "google_books": settings.google_books_rate_per_second,
+    }
+    return rates.get(provider, settings.openlibrary_rate_per_second)
+
+
+def get_provider_guard(provider: str) -> ProviderGuard:
+    guard = _guards.get(provider)
+    if guard is None:
+        guard = ProviderGuard(
+            provider,
+            TokenBucket(_rate_for(provider), settings.metadata_rate_burst),
+            CircuitBreaker(
+                settings.metadata_circuit_failure_threshold,
+                settings.metadata_circuit_cooldown_seconds,
+            ),
+        )
+        _guards[provider] = guard
+    return guard
+
+
+def provider_states(providers: list[str]) -> list[dict[str, Any]]:
+    return [get_provider_guard(provider).state() for provider in providers]
+
+
+def reset_provider_guards() -> None:
+    _guards.clear()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, case, func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import LibraryBook, Series, UserBookData
+
+
+def normalize_series_name(name: str | None) -> str | None:
+    """Strip surrounding whitespace; blank names mean "no series"."""
+    if name is None:
+        return None
+    return name.strip() or None
+
+
+async def ensure_series(
+    session: AsyncSession,
+    library_id: UUID,
+    name: str | None,
+) -> Series | None:
+    """
+    Make sure a Series row exists for a library book's series name.
+
+    Called from write paths so reads can resolve series with a plain join.
+    The new row is added to the session and committed with the caller's
+    transaction. Callers store the same :func:`normalize_series_name` form on
+    the library book so the two join.
+    """
+    name = normalize_series_name(name)
+    if name is None:
+        return None
+
+    stmt = select(Series).where(Series.library_id == library_id, Series.name == name)
+    series = (await session.exec(stmt)).first()
+    if series is None:
+        series = Series(name=name, library_id=library_id)
+        session.add(series)
+    return series
+
+
+def _reading_status(read_books: int, total_books: int) -> str:
+    if read_books == 0:
+        return "not_started"
+    if read_books == total_books:
+        return "completed"
+    return "reading"
+
+
+async def series_reading_statuses(
+    session: AsyncSession,
+    library_id: UUID,
+    user_id: UUID,
+    series_ids: Sequence[int] | None = None,
+) -> list[dict]:
+    """
+    Aggregate a user's reading status for series in a library.
+
+    One grouped query counts each series' books and how many of them the
+    user has marked "Read". Series without books are reported as
+    ``not_started``. Restrict to ``series_ids`` when given; ids that do not
+    belong to the library are left out.
+    """
+    read_flag = case((UserBookData.reading_status == "Read", 1), else_=0)
+    stmt = (
+        select(
+            Series.id,
+            func.count(LibraryBook.id),
+            func.coalesce(func.sum(read_flag), 0),
+        )
+        .select_from(Series)
+        .outerjoin(
+            LibraryBook,
+            and_(
+                LibraryBook.library_id == Series.library_id,
+                LibraryBook.series == Series.name,
+            ),
+        )
+        .outerjoin(
+            UserBookData,
+            and_(
+                UserBookData.book_id == LibraryBook.book_id,
+                UserBookData.library_id == library_id,
+                UserBookData.user_id == user_id,
+            ),
+        )
+        .where(Series.library_id == library_id)
+        .group_by(Series.id)
+        .order_by(Series.id)
+    )
+    if series_ids is not None:
+        stmt = stmt.where(Series.id.in_(series_ids))
+
+    rows = (await session.exec(stmt)).all()
+    return [
+        {
+            "series_id": series_id,
+            "reading_status": _reading_status(read_books, total_books),
+            "total_books": total_books,
+            "read_books": read_books,
+        }
+        for series_id, total_books, read_books in rows
+    ]
@@ -0,0 +1,54 @@
+"""
+Cached bearer-token resolution for ``get_current_user``.
+
+Maps a raw token to the token's expiry and a detached snapshot of its user,
+so a hit skips both JWT verification and the users query. Admin write paths
+call :func:`invalidate_user`; other worker processes may serve a changed
+user for at most ``user_cache_ttl_seconds``.
+"""
+from __future__ import annotations
+
+import time
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.models import User
+
+settings = get_settings()
+
+_users: TTLCache[str, tuple[float, User]] = TTLCache(
+    maxsize=settings.user_cache_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+
+def get_cached_user(token: str) -> User | None:
+    entry = _users.get(token)
+    if entry is None:
+        return None
+    expires_at, user = entry
+    if expires_at <= time.time():
+        _users.pop(token)
+        return None
+    return user
+
+
+def cache_user(token: str, expires_at: float, user: User) -> None:
+    # Copy the row so the cached object is never attached to a request session
+    _users.set(token, (expires_at, User(**user.model_dump())))
+
+
+def invalidate_user(user_id: UUID) -> None:
+    _users.discard_values_where(lambda entry: entry[1].id == user_id)
+
+
+def clear_users() -> None:
+    _users.clear()
+
+
+@event.listens_for(User, "after_delete")
+def _forget_deleted_user(mapper, connection, target: User) -> None:  # noqa: ANN001
+    invalidate_user(target.id)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Measure event-loop latency while a burst of logins verifies passwords.
+
+Runs the same burst twice: once calling bcrypt inline (the old behaviour)
+and once through the password executor. A heartbeat task sleeps in short
+steps and records how late each wake-up is; the worst and p95 delays show
+how long other requests on the worker would have stalled.
+
+Usage (from backend/):
+    python benchmark_password_hashing.py --logins 20 --rounds 12
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+
+async def heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.005) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run_burst(logins: int, password: str, hashed: str, offload: bool) -> dict[str, float]:
+    from app.services.auth import verify_and_update_password, verify_password
+
+    async def login() -> None:
+        if offload:
+            await verify_and_update_password(password, hashed)
+        else:
+            verify_password(password, hashed)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    monitor = asyncio.create_task(heartbeat(stop, lags))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await monitor
+    lags.sort()
+    return {
+        "elapsed_s": elapsed,
+        "max_lag_ms": lags[-1] * 1000 if lags else 0.0,
+        "p95_lag_ms": lags[int(len(lags) * 0.95) - 1] * 1000 if lags else 0.0,
+        "median_lag_ms": statistics.median(lags) * 1000 if lags else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--logins", type=int, default=20, help="concurrent logins per burst")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=4, help="password executor threads")
+    args = parser.parse_args()
+
+    # Settings are read at import time, so configure them before importing the app
+    os.environ["APP_BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["APP_PASSWORD_HASH_WORKERS"] = str(args.workers)
+    from app.services.auth import get_password_hash
+
+    password = "correct horse battery staple"
+    hashed = get_password_hash(password)
+
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}, {args.workers} workers\n")
+    print(f"{'mode':<10}{'total s':>10}{'max lag ms':>14}{'p95 lag ms':>14}{'median ms':>12}")
+    for label, offload in (("inline", False), ("executor", True)):
+        result = await run_burst(args.logins, password, hashed, offload)
+        print(
+            f"{label:<10}{result['elapsed_s']:>10.2f}{result['max_lag_ms']:>14.1f}"
+            f"{result['p95_lag_ms']:>14.1f}{result['median_lag_ms']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+Migration: Add denormalized member_count to book_clubs
+Date: 2026-10-17
+
+The clubs list reads member_count straight from book_clubs instead of
+counting book_club_members per club. Existing rows are backfilled with the
+number of members who have not left.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-club-member-count-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def table_exists(cursor: sqlite3.Cursor, table_name: str) -> bool:
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+    )
+    return cursor.fetchone() is not None
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        if not table_exists(cursor, "book_clubs"):
+            print("[INFO] book_clubs table doesn't exist, skipping migration")
+            conn.close()
+            return True
+
+        cursor.execute("PRAGMA table_info(book_clubs)")
+        existing_columns = {col[1] for col in cursor.fetchall()}
+
+        if "member_count" not in existing_columns:
+            print("1. Adding member_count column to book_clubs...")
+            cursor.execute(
+                "ALTER TABLE book_clubs ADD COLUMN member_count INTEGER NOT NULL DEFAULT 0"
+            )
+            print("   [OK] member_count column added")
+        else:
+            print("1. [INFO] member_count column already exists")
+
+        print("2. Backfilling member counts...")
+        cursor.execute(
+            """
+            UPDATE book_clubs
+            SET member_count = (
+                SELECT COUNT(*)
+                FROM book_club_members
+                WHERE book_club_members.club_id = book_clubs.id
+                  AND book_club_members.left_at IS NULL
+            )
+            """
+        )
+        print(f"   [OK] {cursor.rowcount} clubs updated")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
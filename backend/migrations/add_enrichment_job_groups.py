@@ -0,0 +1,96 @@
+"""
+Migration: Add enrichment_job_groups and enrichment_jobs.group_id
+Date: 2026-10-17
+
+Bulk enrichment requests create one group row and tag each queued job with
+its group so progress can be counted per request.
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-enrichment-groups-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("1. Creating enrichment_job_groups table...")
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS enrichment_job_groups (
+                id INTEGER NOT NULL PRIMARY KEY,
+                library_id CHAR(32) NOT NULL REFERENCES libraries (id),
+                created_by CHAR(32) NOT NULL REFERENCES users (id),
+                filters JSON,
+                total INTEGER NOT NULL,
+                created_at DATETIME NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_enrichment_job_groups_library_id
+            ON enrichment_job_groups (library_id)
+            """
+        )
+        print("   [OK] Table ready")
+
+        print("2. Adding enrichment_jobs.group_id...")
+        cursor.execute("PRAGMA table_info(enrichment_jobs)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if "group_id" in columns:
+            print("   [SKIP] Column already exists")
+        else:
+            cursor.execute(
+                """
+                ALTER TABLE enrichment_jobs
+                ADD COLUMN group_id INTEGER REFERENCES enrichment_job_groups (id)
+                """
+            )
+            print("   [OK] Column added")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_enrichment_jobs_group_id
+            ON enrichment_jobs (group_id)
+            """
+        )
+        print("   [OK] Index ready")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
@@ -0,0 +1,79 @@
+"""
+Migration: Index enrichment_jobs (status, scheduled_at) and re-queue failed jobs
+Date: 2026-10-17
+
+Workers now pick due jobs by status and scheduled_at, and transient provider
+failures are retried with backoff. Jobs that failed before retries existed are
+re-queued once so an old outage does not leave their books marked failed.
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+# Keep in sync with Settings.metadata_retry_max_attempts
+MAX_ATTEMPTS = 5
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-enrichment-retry-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("1. Creating ix_enrichment_jobs_status_scheduled_at...")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_enrichment_jobs_status_scheduled_at
+            ON enrichment_jobs (status, scheduled_at)
+            """
+        )
+        print("   [OK] Index ready")
+
+        print("2. Re-queueing failed jobs with attempts left...")
+        now = datetime.utcnow().isoformat(sep=" ")
+        cursor.execute(
+            """
+            UPDATE enrichment_jobs
+            SET status = 'pending', scheduled_at = ?, updated_at = ?
+            WHERE status = 'failed' AND attempts < ?
+            """,
+            (now, now, MAX_ATTEMPTS),
+        )
+        print(f"   [OK] {cursor.rowcount} jobs re-queued")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
@@ -0,0 +1,96 @@
+"""
+Migration: Add composite indexes matching the hot query shapes
+Date: 2026-10-17
+
+- library_books (library_id, series): series endpoints
+- notifications (user_id, read, created_at): unread lists and counts
+- book_club_comments (club_id, page_number, created_at): comment threads
+- reading_list_items (list_id, order_index, created_at): list display order
+- enrichment_jobs (book_id, status): outstanding-job check when queueing
+
+user_book_data lookups by (book_id, library_id, user_id) are already served
+by the unique constraint's index.
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+INDEXES = [
+    ("ix_library_books_library_series", "library_books", "library_id, series"),
+    ("ix_notifications_user_read_created", "notifications", "user_id, read, created_at"),
+    (
+        "ix_book_club_comments_club_page_created",
+        "book_club_comments",
+        "club_id, page_number, created_at",
+    ),
+    (
+        "ix_reading_list_items_list_order",
+        "reading_list_items",
+        "list_id, order_index, created_at",
+    ),
+    ("ix_enrichment_jobs_book_status", "enrichment_jobs", "book_id, status"),
+]
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-composite-indexes-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def table_exists(cursor: sqlite3.Cursor, table: str) -> bool:
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+        (table,),
+    )
+    return cursor.fetchone() is not None
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        for step, (name, table, columns) in enumerate(INDEXES, start=1):
+            print(f"{step}. Creating {name}...")
+            if not table_exists(cursor, table):
+                print(f"   [SKIP] Table {table} does not exist yet")
+                continue
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+            print("   [OK] Index ready")
+
+        print(f"{len(INDEXES) + 1}. Refreshing planner statistics...")
+        cursor.execute("ANALYZE")
+        print("   [OK] Statistics updated")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
@@ -0,0 +1,60 @@
+"""
+Migration: Add keyset pagination index on library_books (library_id, created_at, id)
+Date: 2026-10-17
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-sort-indexes-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("1. Creating ix_library_books_library_created_id...")
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_library_books_library_created_id
+            ON library_books (library_id, created_at, id)
+            """
+        )
+        print("   [OK] Index ready")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
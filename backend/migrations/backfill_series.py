@@ -0,0 +1,81 @@
+"""
+Migration: Backfill Series rows for every series name used by library_books
+Date: 2026-10-17
+
+Listing endpoints resolve series with a read-only join, so every
+(library_id, series) pair referenced by a library book needs a Series row.
+Write paths keep this true going forward and store names stripped of
+surrounding whitespace; this script normalizes and fixes existing data.
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+def backup_database(db_path: Path) -> Path:
+    """Create a timestamped backup before running the migration."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    backup_path = db_path.parent / f"{db_path.name}.backup-series-backfill-{timestamp}"
+    shutil.copy2(db_path, backup_path)
+    print(f"[OK] Database backed up to: {backup_path}")
+    return backup_path
+
+
+def migrate() -> bool:
+    db_path = Path(__file__).parent.parent / "data" / "books.db"
+    if not db_path.exists():
+        print(f"[ERROR] Database not found at {db_path}")
+        return False
+
+    print(f"Running migration on: {db_path}")
+    backup_path = backup_database(db_path)
+
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        print("1. Normalizing series names on library books...")
+        cursor.execute(
+            """
+            UPDATE library_books
+            SET series = NULLIF(TRIM(series), '')
+            WHERE series != TRIM(series) OR series = ''
+            """
+        )
+        print(f"   [OK] {cursor.rowcount} library books updated")
+
+        print("2. Creating missing series rows...")
+        now = datetime.utcnow().isoformat(sep=" ")
+        cursor.execute(
+            """
+            INSERT INTO series (name, library_id, publication_status, created_at, updated_at)
+            SELECT DISTINCT lb.series, lb.library_id, 'in_progress', ?, ?
+            FROM library_books AS lb
+            LEFT JOIN series AS s
+                ON s.library_id = lb.library_id AND s.name = lb.series
+            WHERE lb.series IS NOT NULL AND s.id IS NULL
+            """,
+            (now, now),
+        )
+        print(f"   [OK] {cursor.rowcount} series rows created")
+
+        conn.commit()
+        conn.close()
+
+        print("\n[SUCCESS] Migration completed successfully!")
+        print(f"   Backup: {backup_path}")
+        return True
+    except Exception as exc:  # noqa: BLE001
+        print(f"\n[ERROR] Migration failed: {exc}")
+        print(f"   Restoring from backup: {backup_path}")
+        shutil.copy2(backup_path, db_path)
+        print("   [OK] Database restored from backup")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate()
+    exit(0 if success else 1)
@@ -2,26 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+# Production bcrypt cost makes every login fixture slow; the minimum is enough here
+os.environ.setdefault("APP_BCRYPT_ROUNDS", "4")
+
 from app.api.deps import get_session
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal, ReadSessionLocal, configure_sqlite_engine
 from app.main import app
 from app.models import Library, LibraryMember, MemberRole, User
+from app.services import membership, metadata_cache, user_cache
 from app.services.auth import get_password_hash
 # Import all model modules to ensure they're registered with SQLModel
 from app.models import reading_list, series, book_club  # noqa: F401
 
 
-# Test database URL (in-memory SQLite for tests)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL: in-memory SQLite unless APP_TEST_DATABASE_URL points at
+# another backend (test-postgres.sh runs the suite against PostgreSQL)
+TEST_DATABASE_URL = os.environ.get("APP_TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+IS_SQLITE = TEST_DATABASE_URL.startswith("sqlite")
+
+requires_sqlite = pytest.mark.skipif(not IS_SQLITE, reason="SQLite-specific behaviour")
 
 
 @pytest.fixture(scope="session")
@@ -38,8 +49,9 @@ async def test_engine():
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
-        connect_args={"check_same_thread": False},
+        connect_args={"check_same_thread": False} if IS_SQLITE else {},
     )
+    configure_sqlite_engine(engine, get_settings())
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
@@ -59,6 +71,25 @@ async def session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def metadata_cache_session(test_engine) -> AsyncGenerator[None, None]:
+    """Keep the metadata cache on the test database instead of the app's."""
+    factory = async_sessionmaker(test_engine, expire_on_commit=False, class_=AsyncSession)
+    metadata_cache.configure_session_factory(factory)
+    yield
+    metadata_cache.configure_session_factory(AsyncSessionLocal, ReadSessionLocal)
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache() -> Generator[None, None, None]:
+    """Tokens and memberships are cached per process; start every test empty."""
+    user_cache.clear_users()
+    membership.clear_memberships()
+    yield
+    user_cache.clear_users()
+    membership.clear_memberships()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client with test database session."""
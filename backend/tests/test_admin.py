@@ -6,7 +6,8 @@ from httpx import AsyncClient
 from sqlmodel import select
 
 from app.models import LibraryMember, MemberRole, User
-from tests.conftest import auth_headers
+from app.services import metadata_cache
+from tests.conftest import auth_headers, requires_sqlite
 
 
 @pytest.mark.asyncio
@@ -209,3 +210,93 @@ async def test_remove_user_from_library(
         )
     )
     assert deleted.first() is None
+
+
+@pytest.mark.asyncio
+async def test_admin_can_inspect_and_purge_metadata_cache(
+    client: AsyncClient,
+    admin_auth_token: str,
+) -> None:
+    await metadata_cache.store_response("openlibrary", "978-0441172719", {"title": "Dune"})
+    await metadata_cache.store_response("google_books", "9780441172719", None)
+
+    response = await client.get(
+        "/api/admin/metadata-cache",
+        params={"identifier": "9780441172719"},
+        headers=auth_headers(admin_auth_token),
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    statuses = {entry["provider"]: entry["status"] for entry in data["entries"]}
+    assert statuses == {"openlibrary": "found", "google_books": "not_found"}
+
+    response = await client.delete(
+        "/api/admin/metadata-cache",
+        params={"provider": "google_books"},
+        headers=auth_headers(admin_auth_token),
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1}
+
+    response = await client.get("/api/admin/metadata-cache", headers=auth_headers(admin_auth_token))
+    assert [entry["provider"] for entry in response.json()["entries"]] == ["openlibrary"]
+
+
+@pytest.mark.asyncio
+async def test_admin_can_view_metadata_provider_limits(
+    client: AsyncClient,
+    admin_auth_token: str,
+) -> None:
+    response = await client.get("/api/admin/metadata-providers", headers=auth_headers(admin_auth_token))
+
+    assert response.status_code == 200
+    states = {entry["provider"]: entry for entry in response.json()}
+    assert set(states) == {"openlibrary", "google_books"}
+    assert states["google_books"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_admin_status_change_applies_to_cached_sessions(
+    client: AsyncClient,
+    admin_auth_token: str,
+    auth_token: str,
+    test_user: User,
+) -> None:
+    """Granting admin takes effect at once even though the token was cached."""
+    response = await client.get("/api/admin/users", headers=auth_headers(auth_token))
+    assert response.status_code == 403
+
+    response = await client.patch(
+        f"/api/admin/users/{test_user.id}/admin",
+        json={"is_admin": True},
+        headers=auth_headers(admin_auth_token),
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/admin/users", headers=auth_headers(auth_token))
+    assert response.status_code == 200
+
+
+@requires_sqlite
+@pytest.mark.asyncio
+async def test_admin_can_view_database_pragmas(
+    client: AsyncClient,
+    admin_auth_token: str,
+) -> None:
+    response = await client.get("/api/admin/database", headers=auth_headers(admin_auth_token))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dialect"] == "sqlite"
+    assert data["configured"]["journal_mode"] == "WAL"
+    # In-memory databases cannot use WAL; the remaining pragmas apply as configured
+    assert data["effective"] | {"journal_mode": None} == {
+        "journal_mode": None,
+        "synchronous": 1,
+        "busy_timeout": 5000,
+        "cache_size": -65536,
+        "mmap_size": data["effective"]["mmap_size"],
+        "temp_store": 2,
+        "foreign_keys": 1,
+    }
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import pytest
+from sqlalchemy import event
 from httpx import AsyncClient
+from passlib.hash import bcrypt
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import User
+from app.services.auth import pwd_context
 from tests.conftest import auth_headers
 
 
@@ -127,3 +131,54 @@ async def test_get_current_user_invalid_token(client: AsyncClient):
     )
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_cached_per_token(
+    client: AsyncClient,
+    test_engine,
+    test_user: User,
+    auth_token: str,
+):
+    """Repeat requests with the same token skip the users lookup."""
+    user_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        for _ in range(3):
+            response = await client.get("/api/auth/me", headers=auth_headers(auth_token))
+            assert response.status_code == 200
+            assert response.json()["id"] == str(test_user.id)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(user_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_password_made_with_another_cost(
+    client: AsyncClient,
+    session: AsyncSession,
+    test_user: User,
+):
+    """A hash from an older bcrypt cost is upgraded on successful login."""
+    configured = pwd_context.handler("bcrypt").default_rounds
+    old_hash = bcrypt.using(rounds=configured + 1).hash("testpass123")
+    test_user.password_hash = old_hash
+    session.add(test_user)
+    await session.commit()
+
+    response = await client.post(
+        "/api/auth/login",
+        json={"email": test_user.email, "password": "testpass123"},
+    )
+    assert response.status_code == 200
+
+    await session.refresh(test_user)
+    assert test_user.password_hash != old_hash
+    assert bcrypt.from_string(test_user.password_hash).rounds == configured
+    assert pwd_context.verify("testpass123", test_user.password_hash)
@@ -1,11 +1,21 @@
 """Tests for book club feature."""
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlmodel import select
 
-from app.models import BookClub, BookClubProgress, BookV2
+from app.api.endpoints import book_clubs as book_clubs_endpoint
+from app.api.utils.sse import KEEPALIVE
+from app.core.pubsub import Broker, SubscriptionLagged
+from app.models import BookClub, BookClubComment, BookClubProgress, BookV2
+from app.services.club_events import club_events
 from tests.conftest import auth_headers
 
 
@@ -164,3 +174,230 @@ async def test_progress_and_comment_visibility(
     progress_stmt = select(BookClubProgress).where(BookClubProgress.club_id == club_id)
     progress_rows = (await session.exec(progress_stmt)).all()
     assert all(row.pages_total == 405 for row in progress_rows)
+
+
+@pytest.mark.asyncio
+async def test_list_book_clubs_tracks_member_count_in_one_query(
+    client: AsyncClient,
+    test_engine,
+    auth_token: str,
+    auth_token2: str,
+    test_user2,
+) -> None:
+    club_ids = []
+    for name in ("Beta Club", "Alpha Club"):
+        response = await client.post(
+            "/api/book-clubs", json={"name": name}, headers=auth_headers(auth_token)
+        )
+        club_ids.append(response.json()["id"])
+    joined = await client.post(
+        f"/api/book-clubs/{club_ids[0]}/members",
+        json={"user_id": str(test_user2.id)},
+        headers=auth_headers(auth_token),
+    )
+    assert joined.status_code == 201
+
+    club_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "book_club" in statement:
+            club_queries.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        owner_view = (await client.get("/api/book-clubs", headers=auth_headers(auth_token))).json()
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+    assert len(club_queries) == 1
+    assert [(club["name"], club["member_count"]) for club in owner_view] == [
+        ("Alpha Club", 1),
+        ("Beta Club", 2),
+    ]
+
+    member_view = (await client.get("/api/book-clubs", headers=auth_headers(auth_token2))).json()
+    assert [(club["id"], club["membership_role"]) for club in member_view] == [
+        (club_ids[0], "member")
+    ]
+
+    # Leaving decrements once; rejoining restores the count
+    for _ in range(2):
+        await client.delete(
+            f"/api/book-clubs/{club_ids[0]}/members/{test_user2.id}",
+            headers=auth_headers(auth_token2),
+        )
+    owner_view = (await client.get("/api/book-clubs", headers=auth_headers(auth_token))).json()
+    assert owner_view[1]["member_count"] == 1
+    await client.post(
+        f"/api/book-clubs/{club_ids[0]}/members",
+        json={"user_id": str(test_user2.id)},
+        headers=auth_headers(auth_token),
+    )
+    owner_view = (await client.get("/api/book-clubs", headers=auth_headers(auth_token))).json()
+    assert owner_view[1]["member_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_comments_filters_spoilers_and_paginates(
+    client: AsyncClient,
+    session,
+    auth_token: str,
+    test_user,
+) -> None:
+    response = await client.post(
+        "/api/book-clubs", json={"name": "Night Owls"}, headers=auth_headers(auth_token)
+    )
+    club_id = UUID(response.json()["id"])
+    started = datetime(2026, 1, 1)
+    for index, page in enumerate([1, 5, 5, 10, 40]):
+        session.add(
+            BookClubComment(
+                club_id=club_id,
+                user_id=test_user.id,
+                page_number=page,
+                body=f"comment {index}",
+                created_at=started + timedelta(minutes=index),
+            )
+        )
+    session.add(BookClubProgress(club_id=club_id, user_id=test_user.id, current_page=10))
+    await session.commit()
+
+    url = f"/api/book-clubs/{club_id}/comments"
+    bodies: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        page = await client.get(url, params=params, headers=auth_headers(auth_token))
+        assert page.status_code == 200
+        bodies.extend(comment["body"] for comment in page.json())
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    # The page-40 comment is past the viewer's progress
+    assert bodies == ["comment 0", "comment 1", "comment 2", "comment 3"]
+
+    # Without a limit every visible comment comes back in one response
+    everything = await client.get(url, headers=auth_headers(auth_token))
+    assert [comment["body"] for comment in everything.json()] == bodies
+    assert "X-Next-Cursor" not in everything.headers
+
+    recent = await client.get(
+        url,
+        params={"since": (started + timedelta(minutes=1)).isoformat() + "Z"},
+        headers=auth_headers(auth_token),
+    )
+    assert [comment["body"] for comment in recent.json()] == ["comment 2", "comment 3"]
+
+    bad = await client.get(url, params={"cursor": "nope"}, headers=auth_headers(auth_token))
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_club_event_stream_applies_spoiler_rule_per_viewer(
+    client: AsyncClient,
+    auth_token: str,
+    auth_token2: str,
+    test_user2,
+) -> None:
+    response = await client.post(
+        "/api/book-clubs", json={"name": "Live Readers"}, headers=auth_headers(auth_token)
+    )
+    club_id = response.json()["id"]
+    await client.post(
+        f"/api/book-clubs/{club_id}/members",
+        json={"user_id": str(test_user2.id)},
+        headers=auth_headers(auth_token),
+    )
+
+    stream = asyncio.create_task(
+        client.get(f"/api/book-clubs/{club_id}/events", headers=auth_headers(auth_token2))
+    )
+    for _ in range(100):
+        if club_events.subscriber_count(UUID(club_id)):
+            break
+        await asyncio.sleep(0.01)
+    assert club_events.subscriber_count(UUID(club_id)) == 1
+
+    base = f"/api/book-clubs/{club_id}"
+    # The owner jumps ahead; the viewer at page 0 must not see the comment
+    await client.post(
+        f"{base}/comments", json={"page_number": 50, "body": "Big twist"}, headers=auth_headers(auth_token)
+    )
+    await client.put(f"{base}/progress", json={"current_page": 10}, headers=auth_headers(auth_token2))
+    await client.post(
+        f"{base}/comments", json={"page_number": 5, "body": "Nice start"}, headers=auth_headers(auth_token)
+    )
+    # Leaving ends the viewer's stream
+    await client.delete(f"{base}/members/{test_user2.id}", headers=auth_headers(auth_token2))
+
+    response = await asyncio.wait_for(stream, timeout=5)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("data: ", 1)[1]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == [
+        "ready",
+        "progress",
+        "progress",
+        "comment",
+        "member_left",
+    ]
+    assert events[0][1] == {"current_page": 0}
+    assert events[3][1]["body"] == "Nice start"
+    assert club_events.subscriber_count(UUID(club_id)) == 0
+
+
+@pytest.mark.asyncio
+async def test_club_event_stream_requires_membership(
+    client: AsyncClient,
+    auth_token: str,
+    auth_token2: str,
+) -> None:
+    response = await client.post(
+        "/api/book-clubs", json={"name": "Private"}, headers=auth_headers(auth_token)
+    )
+    response = await client.get(
+        f"/api/book-clubs/{response.json()['id']}/events", headers=auth_headers(auth_token2)
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_is_dropped() -> None:
+    broker: Broker[str, int] = Broker(maxsize=2)
+    subscription = broker.subscribe("club")
+    for value in range(3):
+        broker.publish("club", value)
+
+    assert broker.subscriber_count("club") == 0
+    assert await subscription.get() == 0
+    assert await subscription.get() == 1
+    with pytest.raises(SubscriptionLagged):
+        await subscription.get()
+
+
+@pytest.mark.asyncio
+async def test_idle_club_event_stream_sends_keepalives(
+    client: AsyncClient,
+    session,
+    auth_token: str,
+    test_user,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(book_clubs_endpoint.settings, "event_keepalive_seconds", 0.01)
+    response = await client.post(
+        "/api/book-clubs", json={"name": "Quiet Club"}, headers=auth_headers(auth_token)
+    )
+    club_id = UUID(response.json()["id"])
+
+    response = await book_clubs_endpoint.stream_club_events(
+        club_id, current_user=test_user, session=session
+    )
+    stream = response.body_iterator
+    try:
+        assert (await anext(stream)).startswith("event: ready")
+        assert await asyncio.wait_for(anext(stream), timeout=1) == KEEPALIVE
+        assert await asyncio.wait_for(anext(stream), timeout=1) == KEEPALIVE
+    finally:
+        await stream.aclose()
+        await response.background()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import io
+from datetime import date
 from uuid import uuid4
 
 import pytest
@@ -10,6 +11,7 @@ from httpx import AsyncClient
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.db.search import build_match_query
 from app.models import BookV2, Library, LibraryBook, Series, User, UserBookData
 from tests.conftest import auth_headers
 
@@ -38,7 +40,7 @@ async def test_book(session: AsyncSession) -> BookV2:
 async def test_library_book(
     session: AsyncSession, test_library: Library, test_book: BookV2
 ) -> LibraryBook:
-    """Create a test library book."""
+    """Create a test library book (and its Series row, as the API would)."""
     library_book = LibraryBook(
         library_id=test_library.id,
         book_id=test_book.id,
@@ -48,6 +50,7 @@ async def test_library_book(
         loan_status="available",
     )
     session.add(library_book)
+    session.add(Series(name="Test Series", library_id=test_library.id))
     await session.commit()
     await session.refresh(library_book)
     return library_book
@@ -116,6 +119,57 @@ async def test_list_library_books_includes_series_metadata(
     assert created_series is not None
 
 
+@pytest.mark.asyncio
+async def test_series_rows_are_created_on_write_not_read(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    test_library_book: LibraryBook,
+    session: AsyncSession,
+):
+    """Assigning a series creates its row; listing never writes."""
+    url = f"/api/libraries/{test_library.id}/books"
+
+    response = await client.patch(
+        f"{url}/{test_library_book.id}",
+        json={"library_book": {"series": "Fresh Series"}},
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 200
+    create_response = await client.post(
+        url,
+        json={"book": {"title": "Sequel"}, "library_book": {"series": " Fresh Series "}},
+        headers=auth_headers(auth_token),
+    )
+    assert create_response.status_code == 201
+    assert create_response.json()["library_book"]["series"] == "Fresh Series"
+
+    stmt = select(Series).where(
+        Series.library_id == test_library.id, Series.name == "Fresh Series"
+    )
+    assert len((await session.exec(stmt)).all()) == 1
+    listed = await client.get(
+        f"/api/libraries/{test_library.id}/series", headers=auth_headers(auth_token)
+    )
+    assert [series["name"] for series in listed.json()].count("Fresh Series") == 1
+
+    # A copy whose series row is missing is listed without one, and none is created
+    orphan_book = BookV2(title="Orphan")
+    session.add(orphan_book)
+    await session.commit()
+    session.add(
+        LibraryBook(library_id=test_library.id, book_id=orphan_book.id, series="Ghost")
+    )
+    await session.commit()
+
+    response = await client.get(url, headers=auth_headers(auth_token))
+    items = {item["book"]["title"]: item for item in response.json()["items"]}
+    assert items["Sequel"]["series"]["name"] == "Fresh Series"
+    assert items["Orphan"]["series"] is None
+    stmt = select(Series).where(Series.name == "Ghost")
+    assert (await session.exec(stmt)).first() is None
+
+
 @pytest.mark.asyncio
 async def test_list_library_books_search(
     client: AsyncClient,
@@ -143,6 +197,92 @@ async def test_list_library_books_search(
     assert response.json()["total"] == 0
 
 
+@pytest.mark.asyncio
+async def test_list_library_books_search_prefix_and_fields(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    test_library_book: LibraryBook,
+):
+    """Search matches term prefixes across authors, subjects and location."""
+    for query in ("Tes Auth", "fict", "shelf a1", "Test Ser"):
+        response = await client.get(
+            f"/api/libraries/{test_library.id}/books",
+            params={"q": query},
+            headers=auth_headers(auth_token),
+        )
+        assert response.status_code == 200
+        assert response.json()["total"] == 1, query
+
+
+def test_build_match_query_uses_each_backends_prefix_syntax():
+    assert build_match_query("Dune, Herb") == '"Dune"* "Herb"*'
+    assert build_match_query("Dune, Herb", "postgresql") == "dune:* & herb:*"
+    assert build_match_query("  --  ", "postgresql") is None
+
+
+@pytest.mark.asyncio
+async def test_list_library_books_search_ranks_title_matches_first(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    session: AsyncSession,
+):
+    """Books matching in the title rank above books matching elsewhere."""
+    mention = BookV2(title="Gardening Basics", description="Mentions dragons once")
+    titled = BookV2(title="Dragons of Autumn")
+    session.add_all([mention, titled])
+    await session.commit()
+    session.add_all(
+        [
+            LibraryBook(library_id=test_library.id, book_id=mention.id),
+            LibraryBook(library_id=test_library.id, book_id=titled.id),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"/api/libraries/{test_library.id}/books",
+        params={"q": "dragon"},
+        headers=auth_headers(auth_token),
+    )
+
+    assert response.status_code == 200
+    titles = [item["book"]["title"] for item in response.json()["items"]]
+    assert titles == ["Dragons of Autumn", "Gardening Basics"]
+
+
+@pytest.mark.asyncio
+async def test_list_library_books_search_index_follows_writes(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    test_library_book: LibraryBook,
+):
+    """Updates and deletes are reflected in search results immediately."""
+    url = f"/api/libraries/{test_library.id}/books"
+
+    await client.patch(
+        f"{url}/{test_library_book.id}",
+        json={
+            "book": {"title": "Renamed Volume"},
+            "library_book": {"physical_location": "Attic"},
+        },
+        headers=auth_headers(auth_token),
+    )
+    for query, expected in (("Renamed", 1), ("attic", 1), ("Shelf", 0)):
+        response = await client.get(
+            url, params={"q": query}, headers=auth_headers(auth_token)
+        )
+        assert response.json()["total"] == expected, query
+
+    await client.delete(f"{url}/{test_library_book.id}", headers=auth_headers(auth_token))
+    response = await client.get(
+        url, params={"q": "Renamed"}, headers=auth_headers(auth_token)
+    )
+    assert response.json()["total"] == 0
+
+
 @pytest.mark.asyncio
 async def test_list_library_books_pagination(
     client: AsyncClient,
@@ -161,6 +301,150 @@ async def test_list_library_books_pagination(
     assert len(data["items"]) <= 10
 
 
+@pytest_asyncio.fixture
+async def many_library_books(
+    session: AsyncSession, test_library: Library
+) -> list[LibraryBook]:
+    """Create a handful of books with distinct titles and authors."""
+    library_books = []
+    for index, (title, author) in enumerate(
+        [
+            ("delta", "Zed"),
+            ("Alpha", "Young"),
+            ("charlie", "Xavier"),
+            ("Bravo", "Walker"),
+            ("echo", "Vance"),
+        ]
+    ):
+        book = BookV2(title=title, authors=[author])
+        session.add(book)
+        await session.commit()
+        library_book = LibraryBook(
+            library_id=test_library.id,
+            book_id=book.id,
+            acquisition_date=date(2024, 1, 1 + index) if index % 2 else None,
+        )
+        session.add(library_book)
+        await session.commit()
+        library_books.append(library_book)
+    return library_books
+
+
+async def _collect_pages(
+    client: AsyncClient, url: str, token: str, **params: object
+) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        query = dict(params, limit=2)
+        if cursor:
+            query["cursor"] = cursor
+        response = await client.get(url, params=query, headers=auth_headers(token))
+        assert response.status_code == 200
+        data = response.json()
+        pages.append([item["book"]["title"] for item in data["items"]])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+async def test_list_library_books_cursor_pagination(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    many_library_books: list[LibraryBook],
+):
+    """Cursor pages walk the whole library in a stable order."""
+    url = f"/api/libraries/{test_library.id}/books"
+
+    pages = await _collect_pages(client, url, auth_token)
+    assert pages == [["Alpha", "Bravo"], ["charlie", "delta"], ["echo"]]
+
+    pages = await _collect_pages(client, url, auth_token, sort="author", order="desc")
+    assert [title for page in pages for title in page] == [
+        "delta", "Alpha", "charlie", "Bravo", "echo"
+    ]
+
+    pages = await _collect_pages(client, url, auth_token, sort="acquisition_date")
+    titles = [title for page in pages for title in page]
+    assert titles[-2:] == ["Alpha", "Bravo"]
+    assert sorted(titles[:3]) == ["charlie", "delta", "echo"]
+
+    pages = await _collect_pages(client, url, auth_token, sort="created_at")
+    assert [title for page in pages for title in page] == [
+        "delta", "Alpha", "charlie", "Bravo", "echo"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_library_books_cursor_rejects_mismatched_sort(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    many_library_books: list[LibraryBook],
+):
+    """A cursor is only valid for the sort order that produced it."""
+    url = f"/api/libraries/{test_library.id}/books"
+    response = await client.get(url, params={"limit": 2}, headers=auth_headers(auth_token))
+    cursor = response.json()["next_cursor"]
+
+    response = await client.get(
+        url,
+        params={"limit": 2, "cursor": cursor, "sort": "author"},
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 400
+
+    response = await client.get(
+        url, params={"cursor": "not-a-cursor"}, headers=auth_headers(auth_token)
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_library_books_total_modes(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    test_library_book: LibraryBook,
+    session: AsyncSession,
+):
+    """Totals are cached per library version and can be skipped entirely."""
+    url = f"/api/libraries/{test_library.id}/books"
+
+    response = await client.get(url, params={"total": "none"}, headers=auth_headers(auth_token))
+    assert response.status_code == 200
+    assert response.json()["total"] is None
+
+    response = await client.get(url, headers=auth_headers(auth_token))
+    assert response.json()["total"] == 1
+
+    # A copy added behind the API's back is not seen until the library changes
+    hidden = BookV2(title="Hidden Copy")
+    session.add(hidden)
+    await session.commit()
+    session.add(LibraryBook(library_id=test_library.id, book_id=hidden.id))
+    await session.commit()
+    response = await client.get(url, headers=auth_headers(auth_token))
+    assert response.json()["total"] == 1
+
+    create_response = await client.post(
+        url,
+        json={"book": {"title": "Counted Book"}},
+        headers=auth_headers(auth_token),
+    )
+    assert create_response.status_code == 201
+
+    response = await client.get(
+        url, params={"total": "estimate"}, headers=auth_headers(auth_token)
+    )
+    assert response.json()["total"] == 1
+
+    response = await client.get(url, headers=auth_headers(auth_token))
+    assert response.json()["total"] == 3
+
+
 @pytest.mark.asyncio
 async def test_list_library_books_unauthorized(
     client: AsyncClient, auth_token2: str, test_library: Library
@@ -0,0 +1,41 @@
+"""Tests for read/write session routing."""
+from __future__ import annotations
+
+from fastapi import Request
+
+from app.api.endpoints.series import list_series
+from app.db.session import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    database_access,
+    read_only_url,
+    session_factory_for,
+)
+
+
+def _request(method: str, endpoint=None) -> Request:  # noqa: ANN001
+    return Request({"type": "http", "method": method, "headers": [], "endpoint": endpoint})
+
+
+def test_read_only_url_targets_file_databases_only():
+    url = read_only_url("sqlite+aiosqlite:///./data/books.db")
+    assert url is not None
+    assert url.database == "file:./data/books.db"
+    assert dict(url.query) == {"mode": "ro", "uri": "true"}
+
+    assert read_only_url("sqlite+aiosqlite:///:memory:") is None
+    assert read_only_url("postgresql+asyncpg://user@localhost/books") is None
+
+
+def test_sessions_route_on_method_unless_endpoint_is_marked():
+    async def endpoint() -> None:
+        return None
+
+    assert session_factory_for(_request("GET", endpoint)) is ReadSessionLocal
+    assert session_factory_for(_request("POST", endpoint)) is AsyncSessionLocal
+
+    read_only_post = database_access("read")(endpoint)
+    assert session_factory_for(_request("POST", read_only_post)) is ReadSessionLocal
+
+    # Series rows are created on write, so listing them stays on the read pool
+    assert session_factory_for(_request("GET", list_series)) is ReadSessionLocal
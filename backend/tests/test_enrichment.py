@@ -0,0 +1,247 @@
+"""Tests for the background enrichment workflow."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import BookV2, EnrichmentJob, EnrichmentStatus, Library, LibraryBook
+from app.services import enrichment as enrichment_service
+from app.services import metadata as metadata_service
+from app.services.enrichment import claim_next_job
+from app.services.enrichment_worker import run_next_job
+from app.services.http_clients import GOOGLE_BOOKS, OPENLIBRARY
+from tests.conftest import auth_headers
+
+
+@pytest_asyncio.fixture
+async def pending_library_book(session: AsyncSession, test_library: Library) -> LibraryBook:
+    book = BookV2(title="Dune", isbn="9780441172719", metadata_status="pending")
+    session.add(book)
+    await session.commit()
+    await session.refresh(book)
+    library_book = LibraryBook(library_id=test_library.id, book_id=book.id)
+    session.add(library_book)
+    await session.commit()
+    await session.refresh(library_book)
+    return library_book
+
+
+@pytest.fixture
+def worker_sessions(test_engine):
+    return async_sessionmaker(test_engine, expire_on_commit=False, class_=AsyncSession)
+
+
+@pytest.fixture
+def fake_providers(monkeypatch):
+    async def openlibrary(identifier: str) -> dict | None:
+        return {"title": "Dune", "publisher": "Chilton Books"}
+
+    async def google_books(identifier: str) -> dict | None:
+        return None
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, openlibrary)
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, GOOGLE_BOOKS, google_books)
+
+
+@pytest.mark.asyncio
+async def test_enrich_book_queues_job_and_worker_completes_it(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+    pending_library_book: LibraryBook,
+    worker_sessions,
+    fake_providers,
+) -> None:
+    base = f"/api/libraries/{test_library.id}/enrichment"
+    response = await client.post(
+        f"{base}/books/{pending_library_book.id}",
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == EnrichmentStatus.PENDING
+    assert job["attempts"] == 0
+
+    # Queueing again returns the same outstanding job
+    again = await client.post(
+        f"{base}/books/{pending_library_book.id}",
+        headers=auth_headers(auth_token),
+    )
+    assert again.json()["job_id"] == job["job_id"]
+
+    assert await run_next_job(worker_sessions) == job["job_id"]
+    assert await run_next_job(worker_sessions) is None
+
+    status_response = await client.get(
+        f"{base}/jobs/{job['job_id']}",
+        headers=auth_headers(auth_token),
+    )
+    assert status_response.status_code == 200
+    data = status_response.json()
+    assert data["status"] == EnrichmentStatus.COMPLETE
+    assert data["attempts"] == 1
+    assert data["metadata_status"] == EnrichmentStatus.COMPLETE
+
+
+@pytest.mark.asyncio
+async def test_claim_next_job_is_exclusive_and_honours_schedule(
+    session: AsyncSession,
+    pending_library_book: LibraryBook,
+    worker_sessions,
+) -> None:
+    now = datetime.utcnow()
+    due = EnrichmentJob(book_id=pending_library_book.book_id, identifier="9780441172719")
+    later = EnrichmentJob(
+        book_id=pending_library_book.book_id,
+        identifier="9780441172719",
+        scheduled_at=now + timedelta(hours=1),
+    )
+    session.add(due)
+    session.add(later)
+    await session.commit()
+
+    async with worker_sessions() as first, worker_sessions() as second:
+        claimed = await claim_next_job(first)
+        assert claimed is not None and claimed.id == due.id
+        assert claimed.status == EnrichmentStatus.IN_PROGRESS
+        assert claimed.attempts == 1
+        # The only due job is taken; the scheduled one is not yet eligible
+        assert await claim_next_job(second) is None
+
+
+def test_retry_delay_backs_off_exponentially_with_jitter(monkeypatch) -> None:
+    monkeypatch.setattr(enrichment_service.settings, "metadata_retry_interval_seconds", 60)
+    monkeypatch.setattr(enrichment_service.settings, "metadata_retry_max_delay_seconds", 300)
+
+    for attempts, ceiling in [(1, 60), (2, 120), (3, 240), (4, 300), (10, 300)]:
+        delays = [enrichment_service.retry_delay(attempts) for _ in range(50)]
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+
+
+@pytest.mark.asyncio
+async def test_transient_provider_failure_is_retried_until_attempts_run_out(
+    session: AsyncSession,
+    pending_library_book: LibraryBook,
+    worker_sessions,
+    monkeypatch,
+) -> None:
+    async def unavailable(identifier: str) -> dict | None:
+        raise metadata_service.ProviderError("503")
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, unavailable)
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, GOOGLE_BOOKS, unavailable)
+    monkeypatch.setattr(enrichment_service.settings, "metadata_retry_max_attempts", 2)
+
+    job = EnrichmentJob(book_id=pending_library_book.book_id, identifier="9780441172719")
+    session.add(job)
+    await session.commit()
+
+    assert await run_next_job(worker_sessions) == job.id
+    await session.refresh(job)
+    assert job.status == EnrichmentStatus.PENDING
+    assert job.attempts == 1
+    assert job.scheduled_at > datetime.utcnow()
+    assert "openlibrary: error" in (job.last_error or "")
+    book = await session.get(BookV2, pending_library_book.book_id, populate_existing=True)
+    assert book is not None and book.metadata_status == "pending"
+
+    # Not due yet, so nothing to claim
+    assert await run_next_job(worker_sessions) is None
+
+    job.scheduled_at = datetime.utcnow() - timedelta(seconds=1)
+    session.add(job)
+    await session.commit()
+    assert await run_next_job(worker_sessions) == job.id
+    await session.refresh(job)
+    assert job.status == EnrichmentStatus.FAILED
+    assert job.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_enrichment_queues_matching_books_and_reports_progress(
+    client: AsyncClient,
+    session: AsyncSession,
+    auth_token: str,
+    test_library: Library,
+    worker_sessions,
+    fake_providers,
+) -> None:
+    statuses = ["pending", "pending", "failed", "complete"]
+    for index, metadata_status in enumerate(statuses):
+        book = BookV2(title=f"Book {index}", isbn=f"97800000000{index}", metadata_status=metadata_status)
+        session.add(book)
+        await session.flush()
+        session.add(LibraryBook(library_id=test_library.id, book_id=book.id))
+    no_isbn = BookV2(title="No ISBN", metadata_status="pending")
+    session.add(no_isbn)
+    await session.flush()
+    session.add(LibraryBook(library_id=test_library.id, book_id=no_isbn.id))
+    await session.commit()
+
+    base = f"/api/libraries/{test_library.id}/enrichment/bulk"
+    response = await client.post(
+        base,
+        json={"metadata_status": ["pending", "failed"]},
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 202
+    group = response.json()
+    assert group | {"group_id": 0, "created_at": None} == {
+        "group_id": 0,
+        "library_id": str(test_library.id),
+        "created_at": None,
+        "total": 3,
+        "done": 0,
+        "failed": 0,
+        "remaining": 3,
+    }
+
+    # Books with an outstanding job are not queued twice
+    again = await client.post(base, json={"metadata_status": ["pending"]}, headers=auth_headers(auth_token))
+    assert again.json()["total"] == 0
+
+    assert await run_next_job(worker_sessions) is not None
+    progress = await client.get(f"{base}/{group['group_id']}", headers=auth_headers(auth_token))
+    assert progress.status_code == 200
+    assert (progress.json()["done"], progress.json()["remaining"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_bulk_enrichment_requires_a_filter(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+) -> None:
+    response = await client.post(
+        f"/api/libraries/{test_library.id}/enrichment/bulk",
+        json={},
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enrich_requests_share_one_job(
+    session: AsyncSession,
+    pending_library_book: LibraryBook,
+    worker_sessions,
+) -> None:
+    async def enqueue() -> int | None:
+        async with worker_sessions() as worker_session:
+            book = await worker_session.get(BookV2, pending_library_book.book_id)
+            assert book is not None
+            job = await enrichment_service.queue_enrichment(book, worker_session)
+            return job.id
+
+    job_ids = await asyncio.gather(*(enqueue() for _ in range(5)))
+
+    assert len(set(job_ids)) == 1
+    jobs = (await session.exec(select(EnrichmentJob))).all()
+    assert len(jobs) == 1
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import pytest
 from httpx import AsyncClient
+from sqlmodel import delete
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import Library, User
+from app.models import Library, LibraryMember, MemberRole, User
+from app.services.membership import get_library_member, invalidate_membership
 from tests.conftest import auth_headers
 
 
@@ -217,3 +220,84 @@ async def test_remove_library_member(
         headers=auth_headers(auth_token2),
     )
     assert get_response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_membership_lookups_are_cached_until_invalidated(
+    session: AsyncSession,
+    test_library: Library,
+    test_user: User,
+):
+    """Repeat lookups are served from the cache until a write invalidates them."""
+    member = await get_library_member(session, test_library.id, test_user.id)
+    assert member is not None and member.role == MemberRole.OWNER
+
+    # Bypass the endpoints so nothing invalidates the cached entry
+    await session.exec(delete(LibraryMember).where(LibraryMember.user_id == test_user.id))
+    await session.commit()
+    assert await get_library_member(session, test_library.id, test_user.id) is not None
+
+    invalidate_membership(test_library.id)
+    assert await get_library_member(session, test_library.id, test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_member_role_change_takes_effect_immediately(
+    client: AsyncClient,
+    auth_token: str,
+    auth_token2: str,
+    test_library: Library,
+    test_user2: User,
+):
+    """Promoting a cached viewer grants the new role on the next request."""
+    await client.post(
+        f"/api/libraries/{test_library.id}/members",
+        json={"user_id": str(test_user2.id), "role": "viewer"},
+        headers=auth_headers(auth_token),
+    )
+    update = {"name": "Renamed"}
+    response = await client.patch(
+        f"/api/libraries/{test_library.id}", json=update, headers=auth_headers(auth_token2)
+    )
+    assert response.status_code == 403
+
+    response = await client.patch(
+        f"/api/libraries/{test_library.id}/members/{test_user2.id}",
+        json={"role": "admin"},
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 200
+
+    response = await client.patch(
+        f"/api/libraries/{test_library.id}", json=update, headers=auth_headers(auth_token2)
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_removed_member_loses_cached_access(
+    client: AsyncClient,
+    auth_token: str,
+    auth_token2: str,
+    test_library: Library,
+    test_user2: User,
+):
+    """A member whose access was cached is refused right after removal."""
+    await client.post(
+        f"/api/libraries/{test_library.id}/members",
+        json={"user_id": str(test_user2.id), "role": "viewer"},
+        headers=auth_headers(auth_token),
+    )
+    response = await client.get(
+        f"/api/libraries/{test_library.id}", headers=auth_headers(auth_token2)
+    )
+    assert response.status_code == 200
+
+    await client.delete(
+        f"/api/libraries/{test_library.id}/members/{test_user2.id}",
+        headers=auth_headers(auth_token),
+    )
+    response = await client.get(
+        f"/api/libraries/{test_library.id}", headers=auth_headers(auth_token2)
+    )
+    assert response.status_code == 403
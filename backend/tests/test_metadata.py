@@ -0,0 +1,324 @@
+"""Tests for metadata provider lookups."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.singleflight import SingleFlight
+from app.models import MetadataCacheEntry, MetadataCacheStatus
+from app.services import metadata as metadata_service
+from app.services import http_clients, metadata_cache
+from app.services.http_clients import GOOGLE_BOOKS, OPENLIBRARY
+from app.services.provider_limits import (
+    CircuitBreaker,
+    TokenBucket,
+    get_provider_guard,
+    reset_provider_guards,
+)
+
+
+def _fake_provider(delay: float, result: dict | None):
+    async def fetch(identifier: str) -> dict | None:
+        await asyncio.sleep(delay)
+        return result
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_lookup_metadata_queries_providers_concurrently(monkeypatch):
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        OPENLIBRARY,
+        _fake_provider(0.2, {"title": "Dune", "authors": ["Frank Herbert"]}),
+    )
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        GOOGLE_BOOKS,
+        _fake_provider(0.2, {"title": "Dune (Google)", "publisher": "Ace"}),
+    )
+
+    started = time.perf_counter()
+    lookup = await metadata_service.lookup_metadata("9780441172719", deadline=2.0)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    # Merge order follows provider order, not completion order
+    assert lookup.metadata == {
+        "title": "Dune (Google)",
+        "authors": ["Frank Herbert"],
+        "publisher": "Ace",
+    }
+    report = lookup.report()
+    assert report[OPENLIBRARY]["status"] == "ok"
+    assert report[GOOGLE_BOOKS]["status"] == "ok"
+    assert report[OPENLIBRARY]["latency_ms"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_lookup_metadata_merges_partial_results_after_deadline(monkeypatch):
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        OPENLIBRARY,
+        _fake_provider(0.0, {"title": "Dune"}),
+    )
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        GOOGLE_BOOKS,
+        _fake_provider(5.0, {"title": "Never arrives"}),
+    )
+
+    lookup = await metadata_service.lookup_metadata("9780441172719", deadline=0.1)
+
+    assert lookup.metadata == {"title": "Dune"}
+    report = lookup.report()
+    assert report[OPENLIBRARY]["status"] == "ok"
+    assert report[GOOGLE_BOOKS]["status"] == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_lookup_metadata_reports_provider_errors(monkeypatch):
+    async def broken(identifier: str) -> dict | None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, broken)
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, GOOGLE_BOOKS, _fake_provider(0.0, None))
+
+    lookup = await metadata_service.lookup_metadata("9780441172719", deadline=1.0)
+
+    assert lookup.metadata is None
+    assert lookup.report()[OPENLIBRARY]["status"] == "error"
+    assert lookup.report()[GOOGLE_BOOKS]["status"] == "not_found"
+
+
+def _counting_provider(result: dict | None, calls: list[str]):
+    async def fetch(identifier: str) -> dict | None:
+        calls.append(identifier)
+        return result
+
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_lookup_metadata_serves_repeat_lookups_from_cache(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        OPENLIBRARY,
+        _counting_provider({"title": "Dune"}, calls),
+    )
+    monkeypatch.setitem(
+        metadata_service.PROVIDER_FETCHERS,
+        GOOGLE_BOOKS,
+        _counting_provider(None, calls),
+    )
+
+    first = await metadata_service.lookup_metadata("978-0441172719")
+    second = await metadata_service.lookup_metadata("9780441172719")
+
+    assert len(calls) == 2
+    assert second.metadata == first.metadata == {"title": "Dune"}
+    report = second.report()
+    assert report[OPENLIBRARY] | {"latency_ms": 0} == {"status": "ok", "cached": True, "latency_ms": 0}
+    assert report[GOOGLE_BOOKS]["status"] == "not_found"
+    assert report[GOOGLE_BOOKS]["cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_uses_negative_ttl_and_skips_errors(monkeypatch, session):
+    async def broken(identifier: str) -> dict | None:
+        raise metadata_service.ProviderError("503")
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, broken)
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, GOOGLE_BOOKS, _fake_provider(0.0, None))
+
+    await metadata_service.lookup_metadata("9780441172719")
+
+    entries = (await session.exec(select(MetadataCacheEntry))).all()
+    assert [(entry.provider, entry.status) for entry in entries] == [
+        (GOOGLE_BOOKS, MetadataCacheStatus.NOT_FOUND)
+    ]
+    ttl = entries[0].expires_at - entries[0].fetched_at
+    assert ttl == timedelta(seconds=metadata_cache.settings.metadata_cache_negative_ttl_seconds)
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_lookups_use_the_read_pool(test_engine):
+    factory = async_sessionmaker(test_engine, expire_on_commit=False, class_=AsyncSession)
+    await metadata_cache.store_response(OPENLIBRARY, "9780441172719", {"title": "Dune"})
+
+    def writer_unavailable() -> AsyncSession:
+        raise AssertionError("cache lookups must not take the writer connection")
+
+    metadata_cache.configure_session_factory(writer_unavailable, read_factory=factory)
+    entry = await metadata_cache.get_cached_response(OPENLIBRARY, "978-0441172719")
+    assert entry is not None and entry.payload == {"title": "Dune"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_opens_after_failures_and_probes_after_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=30, timer=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.status == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now += 31
+    assert breaker.status == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    # Only one probe at a time while half-open
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.status == CircuitBreaker.OPEN
+
+    clock.now += 31
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.status == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests_and_honours_pause():
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    started = time.perf_counter()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two burst tokens, then two more at 20/s
+    assert time.perf_counter() - started >= 0.09
+
+    bucket.pause(30)
+    assert 29 < bucket.paused_for() <= 30
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_back_waiting_callers():
+    bucket = TokenBucket(rate=20.0, capacity=1)
+    await bucket.acquire()
+    # The bucket is empty, so this caller is already waiting inside acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    started = time.perf_counter()
+    bucket.pause(0.3)
+    await waiter
+    assert time.perf_counter() - started >= 0.3
+
+
+@pytest_asyncio.fixture
+async def mock_google_books(monkeypatch):
+    """Route the shared Google Books client through a mock transport."""
+    responses: list[httpx.Response] = []
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    reset_provider_guards()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(http_clients._clients, GOOGLE_BOOKS, client)
+    yield responses, requests
+    await client.aclose()
+    reset_provider_guards()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_provider_pauses_all_callers(mock_google_books):
+    responses, requests = mock_google_books
+    responses.append(httpx.Response(429, headers={"Retry-After": "120"}))
+
+    with pytest.raises(metadata_service.ProviderRateLimited):
+        await metadata_service.fetch_google_books("9780441172719")
+    # Later callers are turned away without another request
+    with pytest.raises(metadata_service.ProviderRateLimited) as excinfo:
+        await metadata_service.fetch_google_books("9780441172720")
+    assert len(requests) == 1
+    assert 119 < excinfo.value.retry_after <= 120
+
+    state = get_provider_guard(GOOGLE_BOOKS).state()
+    assert state["paused_for_seconds"] > 119
+    assert state["consecutive_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_trips_circuit(mock_google_books, monkeypatch):
+    responses, requests = mock_google_books
+    monkeypatch.setattr(
+        get_provider_guard(GOOGLE_BOOKS).breaker, "failure_threshold", 2
+    )
+    responses.extend([httpx.Response(503), httpx.Response(503)])
+
+    for _ in range(2):
+        with pytest.raises(metadata_service.ProviderError):
+            await metadata_service.fetch_google_books("9780441172719")
+    with pytest.raises(metadata_service.ProviderCircuitOpen):
+        await metadata_service.fetch_google_books("9780441172719")
+    assert len(requests) == 2
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, _fake_provider(0.0, None))
+    lookup = await metadata_service.lookup_metadata("9780441172719")
+    assert lookup.report()[GOOGLE_BOOKS]["status"] == "circuit_open"
+    assert lookup.transient_failure()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_of_one_identifier_share_a_fetch(monkeypatch):
+    calls: list[str] = []
+
+    async def slow(identifier: str) -> dict | None:
+        calls.append(identifier)
+        await asyncio.sleep(0.05)
+        return {"title": "Dune"}
+
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, OPENLIBRARY, slow)
+    monkeypatch.setitem(metadata_service.PROVIDER_FETCHERS, GOOGLE_BOOKS, _fake_provider(0.05, None))
+
+    results = await asyncio.gather(
+        metadata_service.fetch_metadata("978-0441172719"),
+        metadata_service.fetch_metadata("9780441172719"),
+        metadata_service.lookup_metadata("9780441172719"),
+    )
+
+    assert calls == ["978-0441172719"]
+    assert results[0] == results[1] == results[2].metadata == {"title": "Dune"}
+    assert len(metadata_service._inflight_lookups) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_a_cancelled_caller():
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 42
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,202 @@
+"""Tests for notification endpoints."""
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.endpoints import notifications as notifications_endpoint
+from app.api.endpoints.notifications import stream_notifications
+from app.api.utils.sse import KEEPALIVE
+from app.models import Library, Notification, NotificationType, User
+from app.services.notification_retention import prune_read_notifications
+from app.services.notifications import notification_events
+from tests.conftest import auth_headers
+
+
+def _parse(message: str) -> tuple[str, dict]:
+    name, data = message.strip().split("\n")
+    return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+@pytest.mark.asyncio
+async def test_unread_count_is_a_single_count_query(
+    client: AsyncClient,
+    session: AsyncSession,
+    test_engine,
+    test_user: User,
+    auth_token: str,
+) -> None:
+    for index in range(3):
+        session.add(
+            Notification(
+                user_id=test_user.id,
+                type=NotificationType.LOAN_REQUEST,
+                title=f"Request {index}",
+                message="Can I borrow this?",
+                read=index == 0,
+            )
+        )
+    await session.commit()
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "FROM notifications" in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/notifications/unread-count", headers=auth_headers(auth_token))
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.json() == {"count": 2}
+    assert len(statements) == 1 and "count(" in statements[0].lower()
+
+
+@pytest.mark.asyncio
+async def test_notification_channel_pushes_new_notifications_and_counts(
+    client: AsyncClient,
+    session: AsyncSession,
+    test_user2: User,
+    auth_token: str,
+    auth_token2: str,
+    test_library: Library,
+) -> None:
+    response = await stream_notifications(current_user=test_user2, session=session)
+    stream = response.body_iterator
+    try:
+        assert _parse(await anext(stream)) == ("ready", {"count": 0})
+        assert notification_events.subscriber_count(test_user2.id) == 1
+
+        invite = await client.post(
+            f"/api/invitations/libraries/{test_library.id}/invite",
+            json={"invitee_username": test_user2.username, "role": "viewer"},
+            headers=auth_headers(auth_token),
+        )
+        assert invite.status_code == 201
+        name, data = _parse(await asyncio.wait_for(anext(stream), timeout=1))
+        assert name == "notification"
+        assert data["type"] == NotificationType.LIBRARY_INVITATION
+        assert data["data"]["invitation_id"] == invite.json()["id"]
+
+        await client.post("/api/notifications/mark-all-read", headers=auth_headers(auth_token2))
+        assert _parse(await asyncio.wait_for(anext(stream), timeout=1)) == (
+            "unread_count",
+            {"count": 0},
+        )
+    finally:
+        await stream.aclose()
+        await response.background()
+
+    assert notification_events.subscriber_count(test_user2.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_notification_stream_sends_keepalives(
+    session: AsyncSession,
+    test_user: User,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(notifications_endpoint.settings, "event_keepalive_seconds", 0.01)
+    response = await stream_notifications(current_user=test_user, session=session)
+    stream = response.body_iterator
+    try:
+        assert _parse(await anext(stream)) == ("ready", {"count": 0})
+        assert await asyncio.wait_for(anext(stream), timeout=1) == KEEPALIVE
+        assert await asyncio.wait_for(anext(stream), timeout=1) == KEEPALIVE
+    finally:
+        await stream.aclose()
+        await response.background()
+
+
+@pytest.mark.asyncio
+async def test_list_notifications_pages_with_cursor_header(
+    client: AsyncClient,
+    session: AsyncSession,
+    test_user: User,
+    auth_token: str,
+) -> None:
+    now = datetime.utcnow()
+    for index in range(5):
+        session.add(
+            Notification(
+                user_id=test_user.id,
+                type=NotificationType.LOAN_REQUEST,
+                title=f"Request {index}",
+                message="Can I borrow this?",
+                created_at=now - timedelta(minutes=index),
+            )
+        )
+    await session.commit()
+
+    titles: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await client.get("/api/notifications", params=params, headers=auth_headers(auth_token))
+        assert response.status_code == 200
+        titles.extend(item["title"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert titles == [f"Request {index}" for index in range(5)]
+
+    marked = await client.post("/api/notifications/mark-all-read", headers=auth_headers(auth_token))
+    assert marked.json() == {"message": "Marked 5 notifications as read"}
+    unread = await client.get("/api/notifications/unread-count", headers=auth_headers(auth_token))
+    assert unread.json() == {"count": 0}
+
+
+@pytest.mark.asyncio
+async def test_retention_prunes_old_read_notifications_in_batches(
+    session: AsyncSession,
+    test_engine,
+    test_user: User,
+) -> None:
+    old = datetime.utcnow() - timedelta(days=120)
+    for index in range(5):
+        session.add(
+            Notification(
+                user_id=test_user.id,
+                type=NotificationType.LOAN_OVERDUE,
+                title=f"Old read {index}",
+                message="Overdue",
+                read=True,
+                created_at=old,
+            )
+        )
+    session.add(
+        Notification(
+            user_id=test_user.id,
+            type=NotificationType.LOAN_OVERDUE,
+            title="Old unread",
+            message="Overdue",
+            created_at=old,
+        )
+    )
+    session.add(
+        Notification(
+            user_id=test_user.id,
+            type=NotificationType.LOAN_OVERDUE,
+            title="Recent read",
+            message="Overdue",
+            read=True,
+        )
+    )
+    await session.commit()
+
+    factory = async_sessionmaker(test_engine, expire_on_commit=False, class_=AsyncSession)
+    stats = await prune_read_notifications(factory, older_than=timedelta(days=90), batch_size=2)
+
+    assert (stats["deleted"], stats["batches"]) == (5, 3)
+    remaining = (await session.exec(select(Notification.title))).all()
+    assert sorted(remaining) == ["Old unread", "Recent read"]
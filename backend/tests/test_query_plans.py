@@ -0,0 +1,101 @@
+"""EXPLAIN QUERY PLAN regression tests for the hot query shapes."""
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import sqlite
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import (
+    BookClubComment,
+    EnrichmentJob,
+    EnrichmentStatus,
+    LibraryBook,
+    Notification,
+    ReadingListItem,
+    UserBookData,
+)
+from tests.conftest import requires_sqlite
+
+HOT_QUERIES = {
+    "user_book_data": (
+        select(UserBookData).where(
+            UserBookData.book_id == uuid4(),
+            UserBookData.library_id == uuid4(),
+            UserBookData.user_id == uuid4(),
+        ),
+        # The unique constraint's index; the primary key takes autoindex _1
+        "sqlite_autoindex_user_book_data_",
+    ),
+    "library_books_in_series": (
+        select(LibraryBook).where(
+            LibraryBook.library_id == uuid4(),
+            LibraryBook.series == "Dune",
+        ),
+        "ix_library_books_library_series",
+    ),
+    "library_series_names": (
+        select(LibraryBook.series)
+        .where(LibraryBook.library_id == uuid4(), LibraryBook.series.isnot(None))
+        .distinct(),
+        "ix_library_books_library_series",
+    ),
+    "unread_notifications": (
+        select(Notification)
+        .where(Notification.user_id == uuid4(), Notification.read == False)  # noqa: E712
+        .order_by(Notification.created_at.desc())
+        .limit(50),
+        "ix_notifications_user_read_created",
+    ),
+    "notification_retention": (
+        select(Notification.id)
+        .where(Notification.read == True, Notification.created_at < datetime(2026, 1, 1))  # noqa: E712
+        .limit(1000),
+        "ix_notifications_read_created",
+    ),
+    "club_comments": (
+        select(BookClubComment)
+        .where(BookClubComment.club_id == uuid4())
+        .order_by(BookClubComment.page_number.asc(), BookClubComment.created_at.asc()),
+        "ix_book_club_comments_club_page_created",
+    ),
+    "list_items": (
+        select(ReadingListItem)
+        .where(ReadingListItem.list_id == uuid4())
+        .order_by(ReadingListItem.order_index.asc(), ReadingListItem.created_at.asc()),
+        "ix_reading_list_items_list_order",
+    ),
+    "outstanding_enrichment": (
+        select(EnrichmentJob).where(
+            EnrichmentJob.book_id == uuid4(),
+            EnrichmentJob.status.in_([EnrichmentStatus.PENDING, EnrichmentStatus.IN_PROGRESS]),
+        ),
+        "ix_enrichment_jobs_book_status",
+    ),
+}
+
+
+async def _query_plan(session: AsyncSession, statement) -> list[str]:  # noqa: ANN001
+    compiled = statement.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"render_postcompile": True}
+    )
+    # The plan depends only on the SQL text, so placeholder values do
+    params = tuple(None for _ in compiled.positiontup or ())
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", params)
+    return [row[3] for row in result.all()]
+
+
+@requires_sqlite
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+async def test_hot_queries_use_their_index(session: AsyncSession, name: str) -> None:
+    statement, index = HOT_QUERIES[name]
+    plan = await _query_plan(session, statement)
+
+    full_scans = [step for step in plan if step.startswith("SCAN") and "INDEX" not in step]
+    assert not full_scans, plan
+    assert any(index in step for step in plan), plan
@@ -0,0 +1,123 @@
+"""Tests for series endpoints."""
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import BookV2, Library, LibraryBook, Series, User, UserBookData
+from tests.conftest import auth_headers
+
+
+@pytest_asyncio.fixture
+async def series_with_books(
+    session: AsyncSession, test_library: Library, test_user: User
+) -> dict[str, Series]:
+    """Three series: all read, partly read and empty."""
+    statuses = {"Dune": ["Read", "Read"], "Foundation": ["Read", "Reading", None], "Empty": []}
+    created: dict[str, Series] = {}
+    for name, reading_statuses in statuses.items():
+        series = Series(name=name, library_id=test_library.id)
+        session.add(series)
+        for index, reading_status in enumerate(reading_statuses):
+            book = BookV2(title=f"{name} {index + 1}")
+            session.add(book)
+            await session.flush()
+            session.add(LibraryBook(library_id=test_library.id, book_id=book.id, series=name))
+            if reading_status:
+                session.add(
+                    UserBookData(
+                        book_id=book.id,
+                        user_id=test_user.id,
+                        library_id=test_library.id,
+                        reading_status=reading_status,
+                    )
+                )
+        created[name] = series
+    await session.commit()
+    for series in created.values():
+        await session.refresh(series)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_series_reading_status_uses_one_aggregate_query(
+    client: AsyncClient,
+    test_engine,
+    auth_token: str,
+    test_library: Library,
+    series_with_books: dict[str, Series],
+) -> None:
+    book_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if "user_book_data" in statement:
+            book_queries.append(statement)
+
+    series = series_with_books["Foundation"]
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get(
+            f"/api/libraries/{test_library.id}/series/{series.id}/reading-status",
+            headers=auth_headers(auth_token),
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "series_id": series.id,
+        "reading_status": "reading",
+        "total_books": 3,
+        "read_books": 1,
+    }
+    assert len(book_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_series_reading_status_batch(
+    client: AsyncClient,
+    auth_token: str,
+    auth_token2: str,
+    test_library: Library,
+    series_with_books: dict[str, Series],
+) -> None:
+    base = f"/api/libraries/{test_library.id}/series/reading-status"
+    dune, foundation, empty = (series_with_books[name] for name in ("Dune", "Foundation", "Empty"))
+
+    response = await client.get(base, headers=auth_headers(auth_token))
+    assert response.status_code == 200
+    assert {item["series_id"]: item["reading_status"] for item in response.json()} == {
+        dune.id: "completed",
+        foundation.id: "reading",
+        empty.id: "not_started",
+    }
+
+    # Unknown ids are skipped
+    response = await client.get(
+        base,
+        params={"ids": [dune.id, 99999]},
+        headers=auth_headers(auth_token),
+    )
+    assert response.json() == [
+        {"series_id": dune.id, "reading_status": "completed", "total_books": 2, "read_books": 2}
+    ]
+
+    # Non-members are refused
+    response = await client.get(base, headers=auth_headers(auth_token2))
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_series_reading_status_unknown_series(
+    client: AsyncClient,
+    auth_token: str,
+    test_library: Library,
+) -> None:
+    response = await client.get(
+        f"/api/libraries/{test_library.id}/series/99999/reading-status",
+        headers=auth_headers(auth_token),
+    )
+    assert response.status_code == 404
@@ -1,4 +1,5 @@
 import client from './client';
+import { ServerEvent, subscribeToEvents } from './events';
 import {
   BookClub,
   BookClubComment,
@@ -72,3 +73,10 @@ export const createComment = async (
   const response = await client.post<BookClubComment>(`/book-clubs/${clubId}/comments`, payload);
   return response.data;
 };
+
+export const subscribeToBookClubEvents = (
+  clubId: string,
+  onEvent: (event: ServerEvent) => void,
+  onClose?: (error?: unknown) => void,
+): (() => void) =>
+  subscribeToEvents(`/book-clubs/${clubId}/events`, onEvent, onClose);
@@ -163,13 +163,29 @@ describe('books api', () => {
     expect(mockClient.delete).toHaveBeenCalledWith(`/libraries/${libraryId}/books/library-book-uuid`);
   });
 
-  it('enriches a library book', async () => {
-    mockClient.post.mockResolvedValue({ data: sampleDetail });
+  it('queues enrichment and polls the job until it settles', async () => {
+    vi.useFakeTimers();
+    const job = {
+      job_id: 7,
+      book_id: 'book-uuid',
+      status: 'pending',
+      attempts: 0,
+      last_error: null,
+      scheduled_at: '2024-01-01T00:00:00',
+      updated_at: '2024-01-01T00:00:00',
+      metadata_status: 'pending',
+    };
+    mockClient.post.mockResolvedValue({ data: job });
+    mockClient.get.mockResolvedValue({ data: { ...job, status: 'complete', attempts: 1 } });
 
-    const result = await enrichBook(libraryId, 'library-book-uuid');
+    const promise = enrichBook(libraryId, 'library-book-uuid');
+    await vi.advanceTimersByTimeAsync(1000);
+    const result = await promise;
+    vi.useRealTimers();
 
     expect(mockClient.post).toHaveBeenCalledWith(`/libraries/${libraryId}/enrichment/books/library-book-uuid`);
-    expect(result.metadata_status).toBe('pending');
+    expect(mockClient.get).toHaveBeenCalledWith(`/libraries/${libraryId}/enrichment/jobs/7`);
+    expect(result.status).toBe('complete');
   });
 
   it('uploads a cover image for a library book', async () => {
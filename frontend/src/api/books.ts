@@ -4,6 +4,7 @@ import {
   ApiLibraryBookDetail,
   Book,
   BookFormValues,
+  EnrichmentJob,
   ListBooksResponse,
   MetadataCandidateResponse,
 } from "../types/book";
@@ -211,11 +212,28 @@ export const deleteBook = async (libraryId: string, libraryBookId: string): Prom
   await client.delete(`/libraries/${libraryId}/books/${libraryBookId}`);
 };
 
-export const enrichBook = async (libraryId: string, libraryBookId: string): Promise<Book> => {
-  const response = await client.post<ApiLibraryBookDetail>(
+const ENRICHMENT_POLL_INTERVAL_MS = 1000;
+const ENRICHMENT_POLL_TIMEOUT_MS = 60_000;
+
+export const getEnrichmentJob = async (libraryId: string, jobId: number): Promise<EnrichmentJob> => {
+  const response = await client.get<EnrichmentJob>(`/libraries/${libraryId}/enrichment/jobs/${jobId}`);
+  return response.data;
+};
+
+const isJobOutstanding = (job: EnrichmentJob) => job.status === "pending" || job.status === "in_progress";
+
+// Enrichment runs in a background worker: queue the job, then poll until it settles.
+export const enrichBook = async (libraryId: string, libraryBookId: string): Promise<EnrichmentJob> => {
+  const response = await client.post<EnrichmentJob>(
     `/libraries/${libraryId}/enrichment/books/${libraryBookId}`,
   );
-  return toBook(response.data);
+  let job = response.data;
+  const deadline = Date.now() + ENRICHMENT_POLL_TIMEOUT_MS;
+  while (isJobOutstanding(job) && Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, ENRICHMENT_POLL_INTERVAL_MS));
+    job = await getEnrichmentJob(libraryId, job.job_id);
+  }
+  return job;
 };
 
 export const getMetadataCandidate = async (
@@ -39,3 +39,39 @@ export const getMetadataPreview = async (
   );
   return response.data;
 };
+
+export interface BulkEnrichmentRequest {
+  metadata_status?: string[];
+  library_book_ids?: string[];
+}
+
+export interface EnrichmentGroup {
+  group_id: number;
+  library_id: string;
+  created_at: string;
+  total: number;
+  done: number;
+  failed: number;
+  remaining: number;
+}
+
+export const startBulkEnrichment = async (
+  libraryId: string,
+  payload: BulkEnrichmentRequest,
+): Promise<EnrichmentGroup> => {
+  const response = await client.post<EnrichmentGroup>(
+    `/libraries/${libraryId}/enrichment/bulk`,
+    payload,
+  );
+  return response.data;
+};
+
+export const getBulkEnrichment = async (
+  libraryId: string,
+  groupId: number,
+): Promise<EnrichmentGroup> => {
+  const response = await client.get<EnrichmentGroup>(
+    `/libraries/${libraryId}/enrichment/bulk/${groupId}`,
+  );
+  return response.data;
+};
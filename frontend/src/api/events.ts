@@ -0,0 +1,57 @@
+export interface ServerEvent<T = unknown> {
+  event: string;
+  data: T;
+}
+
+/**
+ * Follow a Server-Sent Events endpoint under /api.
+ *
+ * EventSource cannot send the bearer token, so the stream is read with
+ * fetch. Returns a function that closes the stream.
+ */
+export const subscribeToEvents = <T = unknown>(
+  path: string,
+  onEvent: (event: ServerEvent<T>) => void,
+  onClose?: (error?: unknown) => void,
+): (() => void) => {
+  const controller = new AbortController();
+  const token = localStorage.getItem('auth_token');
+
+  const read = async () => {
+    const response = await fetch(`/api${path}`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+      signal: controller.signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Event stream failed with status ${response.status}`);
+    }
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += value;
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+        let event = 'message';
+        const data: string[] = [];
+        for (const line of block.split('\n')) {
+          if (line.startsWith('event: ')) event = line.slice(7);
+          else if (line.startsWith('data: ')) data.push(line.slice(6));
+        }
+        if (data.length) onEvent({ event, data: JSON.parse(data.join('\n')) as T });
+      }
+    }
+  };
+
+  read().then(
+    () => onClose?.(),
+    (error) => {
+      if (!controller.signal.aborted) onClose?.(error);
+    },
+  );
+  return () => controller.abort();
+};
@@ -1,4 +1,5 @@
 import client from './client';
+import { ServerEvent, subscribeToEvents } from './events';
 import { Notification } from '../types/library';
 
 export const listNotifications = async (
@@ -31,3 +32,8 @@ export const markAllNotificationsAsRead = async (): Promise<void> => {
 export const deleteNotification = async (notificationId: string): Promise<void> => {
   await client.delete(`/notifications/${notificationId}`);
 };
+
+export const subscribeToNotifications = (
+  onEvent: (event: ServerEvent<{ count: number }>) => void,
+  onClose?: (error?: unknown) => void,
+): (() => void) => subscribeToEvents('/notifications/events', onEvent, onClose);
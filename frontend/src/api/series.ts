@@ -97,6 +97,19 @@ export const getSeriesReadingStatus = async (
   return response.data;
 };
 
+export const getSeriesReadingStatuses = async (
+  libraryId: string,
+  ids?: number[],
+): Promise<SeriesReadingStatus[]> => {
+  const params = new URLSearchParams();
+  ids?.forEach((id) => params.append("ids", String(id)));
+  const response = await client.get<SeriesReadingStatus[]>(
+    `/libraries/${libraryId}/series/reading-status`,
+    { params },
+  );
+  return response.data;
+};
+
 export const uploadSeriesCover = async (
   libraryId: string,
   id: number,
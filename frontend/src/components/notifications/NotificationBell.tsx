@@ -21,17 +21,19 @@ import { useNavigate } from 'react-router-dom';
 import * as notificationsApi from '../../api/notifications';
 import * as invitationsApi from '../../api/invitations';
 import { Notification } from '../../types/library';
+import { useNotificationStream } from './useNotificationStream';
 
 const NotificationBell = () => {
   const [anchorEl, setAnchorEl] = useState<null | HTMLElement>(null);
   const navigate = useNavigate();
   const queryClient = useQueryClient();
 
-  // Fetch unread count
+  // Unread count is pushed over the notification stream; poll only while it is down
+  const streaming = useNotificationStream();
   const { data: unreadCount = 0 } = useQuery({
     queryKey: ['notifications', 'unread-count'],
     queryFn: notificationsApi.getUnreadCount,
-    refetchInterval: 30000, // Poll every 30 seconds
+    refetchInterval: streaming ? false : 30000,
   });
 
   // Fetch recent notifications
@@ -4,6 +4,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import * as notificationsApi from '../../api/notifications';
 import * as invitationsApi from '../../api/invitations';
 import { Notification } from '../../types/library';
+import { useNotificationStream } from './useNotificationStream';
 import { useTheme } from '../../contexts/ThemeContext';
 import { Button } from '../ui/Button';
 
@@ -14,11 +15,12 @@ export const NotificationBellTailwind = () => {
   const darkMode = theme === 'dark';
   const queryClient = useQueryClient();
 
-  // Fetch unread count
+  // Unread count is pushed over the notification stream; poll only while it is down
+  const streaming = useNotificationStream();
   const { data: unreadCount = 0 } = useQuery({
     queryKey: ['notifications', 'unread-count'],
     queryFn: notificationsApi.getUnreadCount,
-    refetchInterval: 30000, // Poll every 30 seconds
+    refetchInterval: streaming ? false : 30000,
   });
 
   // Fetch recent notifications
@@ -0,0 +1,52 @@
+import { useEffect, useState } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
+import { subscribeToNotifications } from '../../api/notifications';
+
+const RECONNECT_DELAY_MS = 5000;
+
+/**
+ * Keep the notification queries current from the server's push channel.
+ *
+ * Returns whether the stream is connected, so callers only fall back to
+ * polling while it is down.
+ */
+export const useNotificationStream = (): boolean => {
+  const queryClient = useQueryClient();
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    let unsubscribe: (() => void) | null = null;
+    let retry: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = () => {
+      unsubscribe = subscribeToNotifications(
+        ({ event, data }) => {
+          if (event === 'ready' || event === 'unread_count') {
+            setConnected(true);
+            queryClient.setQueryData(['notifications', 'unread-count'], data.count);
+          } else if (event === 'notification') {
+            queryClient.setQueryData<number>(
+              ['notifications', 'unread-count'],
+              (count = 0) => count + 1,
+            );
+            queryClient.invalidateQueries({ queryKey: ['notifications', 'recent'] });
+          } else if (event === 'resync') {
+            queryClient.invalidateQueries({ queryKey: ['notifications'] });
+          }
+        },
+        () => {
+          setConnected(false);
+          retry = setTimeout(connect, RECONNECT_DELAY_MS);
+        },
+      );
+    };
+    connect();
+
+    return () => {
+      clearTimeout(retry);
+      unsubscribe?.();
+    };
+  }, [queryClient]);
+
+  return connected;
+};
@@ -137,6 +137,17 @@ export interface MetadataCandidateResponse {
   metadata_status: string;
 }
 
+export interface EnrichmentJob {
+  job_id: number;
+  book_id: string;
+  status: "pending" | "in_progress" | "complete" | "failed" | "awaiting_review";
+  attempts: number;
+  last_error: string | null;
+  scheduled_at: string;
+  updated_at: string;
+  metadata_status: string;
+}
+
 export interface ListBooksResponse {
   items: Book[];
   total: number;